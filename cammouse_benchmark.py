@@ -0,0 +1,241 @@
+"""
+CamMouse Offline Benchmark
+==========================
+Replay video atau folder frame melalui CamMouseSystemController.process_frame
+tanpa kamera dan tanpa desktop (aktuasi memakai NullActuator).
+
+Contoh:
+python cammouse_benchmark.py rekaman.mp4
+python cammouse_benchmark.py frames/ --config mc0:model_complexity=0 --config mc1:model_complexity=1
+python cammouse_benchmark.py rekaman.mp4 --loops 3 --output hasil.json
+python cammouse_benchmark.py rekaman.mp4 --config euro:cursor_filter=one_euro --config ema:cursor_filter=ema
+
+Setiap konfigurasi dijalankan di proses terpisah agar CPU time dan peak RSS
+tidak tercampur antar konfigurasi.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import cv2
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from cammouse_system_controller import (
+    CamMouseSystemController, LatencyHistogram, NullActuator)
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+class ReplayCapture:
+    """Sumber frame dari file video atau folder gambar dengan interface cv2.VideoCapture"""
+
+    def __init__(self, source, loops=1):
+        self.source = source
+        self.loops = max(1, loops)
+        self.loop_index = 0
+        self.frame_index = 0
+        self.video = None
+        self.frame_paths = None
+
+        if os.path.isdir(source):
+            self.frame_paths = sorted(
+                os.path.join(source, name) for name in os.listdir(source)
+                if name.lower().endswith(IMAGE_EXTENSIONS))
+        else:
+            self.video = cv2.VideoCapture(source)
+
+    def isOpened(self):
+        if self.frame_paths is not None:
+            return len(self.frame_paths) > 0
+        return self.video is not None and self.video.isOpened()
+
+    def read(self):
+        while self.loop_index < self.loops:
+            if self.frame_paths is not None:
+                if self.frame_index < len(self.frame_paths):
+                    frame = cv2.imread(self.frame_paths[self.frame_index])
+                    self.frame_index += 1
+                    return frame is not None, frame
+            else:
+                ret, frame = self.video.read()
+                if ret:
+                    return True, frame
+
+            # Akhir sumber: ulangi dari awal untuk loop berikutnya
+            self.loop_index += 1
+            self.frame_index = 0
+            if self.video is not None:
+                self.video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        return False, None
+
+    def release(self):
+        if self.video is not None:
+            self.video.release()
+            self.video = None
+
+def parse_value(text):
+    """Parse nilai konfigurasi: JSON jika bisa, selain itu string"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+def parse_config(text):
+    """Parse 'nama:key=value,key=value' menjadi (nama, dict opsi)"""
+    name, _, options_text = text.partition(':')
+    options = {}
+    for item in filter(None, options_text.split(',')):
+        key, sep, value = item.partition('=')
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Opsi tidak valid: {item}")
+        options[key.strip()] = parse_value(value.strip())
+    return name or 'default', options
+
+def create_controller(options):
+    """Buat controller headless dengan override atribut dari konfigurasi"""
+    options = dict(options)
+    controller = CamMouseSystemController(
+        actuator=NullActuator(),
+        model_complexity=options.pop('model_complexity', 1))
+    if 'cursor_filter' in options:
+        controller.set_cursor_filter(options.pop('cursor_filter'))
+    for key, value in options.items():
+        if not hasattr(controller, key):
+            raise ValueError(f"Atribut controller tidak dikenal: {key}")
+        setattr(controller, key, value)
+    return controller
+
+def peak_rss_mb():
+    """Peak resident set size proses ini dalam MB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+def run_benchmark(source, name, options, loops=1, warmup=10, max_frames=None):
+    """Jalankan satu konfigurasi dan kembalikan hasil pengukuran"""
+    controller = create_controller(options)
+    capture = ReplayCapture(source, loops=loops)
+    if not capture.isOpened():
+        raise RuntimeError(f"Sumber tidak dapat dibuka: {source}")
+    controller.start_camera(capture)
+    controller.enable_system_control()
+
+    frame_latency = LatencyHistogram()
+    frames = 0
+    frames_with_hand = 0
+    measure_start = None
+    cpu_start = None
+
+    while max_frames is None or frames < max_frames + warmup:
+        if frames == warmup:
+            # Mulai pengukuran setelah warmup model
+            controller.latency.reset()
+            controller.roi_stats = dict.fromkeys(controller.roi_stats, 0)
+            measure_start = time.perf_counter()
+            cpu_start = time.process_time()
+
+        start_time = time.perf_counter()
+        frame, gestures = controller.process_frame()
+        if frame is None:
+            break
+        if frames >= warmup:
+            frame_latency.record(time.perf_counter() - start_time)
+            if gestures:
+                frames_with_hand += 1
+        frames += 1
+
+    controller.stop_camera()
+    capture.release()
+
+    measured = max(0, frames - warmup)
+    wall_time = time.perf_counter() - measure_start if measure_start else 0.0
+    cpu_time = time.process_time() - cpu_start if cpu_start else 0.0
+    actuator = controller.actuator
+    return {
+        'name': name,
+        'options': options,
+        'frames': measured,
+        'frames_with_hand': frames_with_hand,
+        'wall_time_s': wall_time,
+        'throughput_fps': measured / wall_time if wall_time > 0 else 0.0,
+        'cpu_time_s': cpu_time,
+        'cpu_per_frame_ms': cpu_time * 1000.0 / measured if measured else 0.0,
+        'peak_rss_mb': peak_rss_mb(),
+        'frame_latency': frame_latency.summary(),
+        'stage_latency': controller.latency.summary(),
+        'roi': dict(controller.roi_stats),
+        'actuation': {
+            'moves': actuator.move_count,
+            # Klik gesture dikirim sebagai mouse_down/mouse_up, jadi yang dihitung penekanan tombol
+            'clicks': actuator.press_counts['left'],
+            'right_clicks': actuator.press_counts['right'],
+        },
+    }
+
+def print_result(result):
+    """Tampilkan ringkasan satu konfigurasi"""
+    latency = result['frame_latency']
+    rss = result['peak_rss_mb']
+    print(f"\n=== {result['name']} {result['options']} ===")
+    print(f"Frame         : {result['frames']} ({result['frames_with_hand']} dengan tangan)")
+    print(f"Throughput    : {result['throughput_fps']:.1f} FPS")
+    print(f"Latensi frame : p50 {latency['p50_ms']:.2f} ms, p95 {latency['p95_ms']:.2f} ms, "
+          f"p99 {latency['p99_ms']:.2f} ms, max {latency['max_ms']:.2f} ms")
+    print(f"CPU time      : {result['cpu_time_s']:.2f} s ({result['cpu_per_frame_ms']:.2f} ms/frame)")
+    print(f"Peak RSS      : {rss:.1f} MB" if rss is not None else "Peak RSS      : n/a")
+    roi = result['roi']
+    print(f"Inferensi     : {roi['full']} frame penuh, {roi['roi']} ROI ({roi['lost']} hilang)")
+    actuation = result['actuation']
+    print(f"Aktuasi       : {actuation['moves']} gerak, {actuation['clicks']} klik kiri, "
+          f"{actuation['right_clicks']} klik kanan")
+    print("Tahap (p50/p95/p99 ms):")
+    for stage, stats in result['stage_latency'].items():
+        if stats['count']:
+            print(f"  {stage:<10}{stats['p50_ms']:8.2f}{stats['p95_ms']:8.2f}{stats['p99_ms']:8.2f}")
+
+def main():
+    """Entry point benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark offline CamMouse dari rekaman video")
+    parser.add_argument('source', help="File video atau folder berisi frame gambar")
+    parser.add_argument('--config', action='append', type=parse_config, default=[],
+                        help="Konfigurasi 'nama:key=value,...' (boleh diulang)")
+    parser.add_argument('--loops', type=int, default=1, help="Ulangi sumber sebanyak N kali")
+    parser.add_argument('--warmup', type=int, default=10, help="Frame awal yang tidak diukur")
+    parser.add_argument('--max-frames', type=int, default=None, help="Batas frame terukur")
+    parser.add_argument('--output', help="Simpan hasil ke file JSON")
+    parser.add_argument('--in-process', action='store_true',
+                        help="Jalankan semua konfigurasi di proses ini (RSS tidak terpisah)")
+    args = parser.parse_args()
+
+    configs = args.config or [('default', {})]
+    results = []
+    for name, options in configs:
+        run_args = (args.source, name, options, args.loops, args.warmup, args.max_frames)
+        if args.in_process:
+            result = run_benchmark(*run_args)
+        else:
+            context = multiprocessing.get_context('spawn')
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(run_benchmark, *run_args).result()
+        print_result(result)
+        results.append(result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'source': args.source, 'results': results}, f, indent=2)
+        print(f"\nHasil disimpan ke {args.output}")
+
+if __name__ == "__main__":
+    main()
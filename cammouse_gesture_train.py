@@ -0,0 +1,186 @@
+"""
+CamMouse Gesture Trainer
+========================
+Rekam sampel pose tangan berlabel dari kamera, lalu latih classifier pose
+statis (k-NN NumPy) secara offline di CPU. Model .npz hasilnya dipakai
+detektor 'pose' (CamMouseSystemController.load_pose_classifier).
+
+Contoh:
+python cammouse_gesture_train.py record pose_data.npz --label thumbs_up --samples 200
+python cammouse_gesture_train.py record pose_data.npz --label peace --samples 200 --preview
+python cammouse_gesture_train.py train pose_data.npz --output ~/.cammouse_pose_model.npz
+python cammouse_system_controller.py --headless --pose-model ~/.cammouse_pose_model.npz
+
+Dataset menyimpan landmark mentah (N, 21, 3) sehingga normalisasi dapat
+diubah tanpa merekam ulang.
+"""
+
+import argparse
+import os
+import time
+
+import cv2
+import numpy as np
+
+from cammouse_system_controller import (
+    CamMouseSystemController, LandmarkClassifier, NullActuator, normalize_landmarks)
+
+def label_counts(labels):
+    """Jumlah sampel per label"""
+    names, counts = np.unique(labels, return_counts=True)
+    return {str(name): int(count) for name, count in zip(names, counts)}
+
+def load_dataset(paths):
+    """Gabungkan satu atau lebih file dataset menjadi (points, labels)"""
+    points, labels = [], []
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        data = np.load(path)
+        points.append(data['points'])
+        labels.append(data['labels'])
+    if not points:
+        return np.zeros((0, 21, 3), dtype=np.float32), np.zeros(0, dtype=str)
+    return np.concatenate(points), np.concatenate(labels)
+
+def record(args):
+    """Rekam sampel pose berlabel dari kamera live dan tambahkan ke dataset"""
+    controller = CamMouseSystemController(actuator=NullActuator())
+    controller.camera_index = int(args.camera) if args.camera.isdigit() else args.camera
+    if not controller.start_camera():
+        print(f"Error: {controller.last_error}")
+        return
+
+    print(f"Tahan pose '{args.label}' di depan kamera, perekaman mulai dalam {args.countdown} detik...")
+    samples = []
+    start_at = time.perf_counter() + args.countdown
+    last_sample = 0.0
+    try:
+        while len(samples) < args.samples:
+            captured = controller.read_frame(timeout=0.5)
+            if captured is None:
+                if controller.grabber is None:
+                    print("Error: Kamera berhenti mengirim frame")
+                    break
+                continue
+            frame, gestures = controller.infer_frame(*captured)
+            now = time.perf_counter()
+            if gestures and now >= start_at and now - last_sample >= args.interval:
+                # Jeda antar sampel agar dataset tidak berisi frame yang hampir identik
+                samples.append(gestures['features']['points'].copy())
+                last_sample = now
+                print(f"\r{args.label}: {len(samples)}/{args.samples}", end='', flush=True)
+            if args.preview:
+                cv2.imshow('CamMouse Gesture Recorder', cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print()
+        controller.stop_camera()
+        if args.preview:
+            cv2.destroyAllWindows()
+
+    if not samples:
+        print("Tidak ada sampel yang direkam")
+        return
+    points, labels = load_dataset([args.dataset])
+    points = np.concatenate([points, np.asarray(samples, dtype=np.float32)])
+    labels = np.concatenate([labels, np.full(len(samples), args.label)])
+    np.savez(args.dataset, points=points, labels=labels)
+    print(f"{len(samples)} sampel disimpan ke {args.dataset} (total per label: {label_counts(labels)})")
+
+def split_dataset(labels, holdout, seed):
+    """Bagi index per label menjadi (train, holdout) agar semua label terwakili"""
+    rng = np.random.default_rng(seed)
+    train_index, holdout_index = [], []
+    for label in np.unique(labels):
+        index = rng.permutation(np.flatnonzero(labels == label))
+        n_holdout = int(len(index) * holdout) if len(index) > 1 else 0
+        holdout_index.extend(index[:n_holdout])
+        train_index.extend(index[n_holdout:])
+    return np.array(train_index, dtype=int), np.array(holdout_index, dtype=int)
+
+def nearest_same_label_distance(classifier, samples, labels):
+    """Jarak ke sampel training terdekat berlabel sama untuk tiap sampel"""
+    flat = samples.reshape(len(samples), -1)
+    train_labels = classifier.classes[classifier.label_index]
+    distances = []
+    for vector, label in zip(flat, labels):
+        squared = classifier.sample_norms - 2.0 * (classifier.samples @ vector) + vector @ vector
+        distances.append(np.sqrt(max(float(squared[train_labels == label].min()), 0.0)))
+    return np.array(distances)
+
+def measure_inference_us(classifier, samples, repeats=2000):
+    """Rata-rata waktu satu predict dalam mikrodetik"""
+    start_time = time.perf_counter()
+    for i in range(repeats):
+        classifier.predict(samples[i % len(samples)])
+    return (time.perf_counter() - start_time) * 1e6 / repeats
+
+def train(args):
+    """Latih classifier pose offline dan simpan model .npz"""
+    points, labels = load_dataset(args.datasets)
+    if len(points) == 0:
+        print("Error: Dataset kosong")
+        return
+    samples = np.array([normalize_landmarks(p) for p in points], dtype=np.float32)
+    print(f"Dataset       : {len(samples)} sampel {label_counts(labels)}")
+
+    train_index, holdout_index = split_dataset(labels, args.holdout, args.seed)
+    reject_distance = None
+    if len(holdout_index):
+        classifier = LandmarkClassifier(samples[train_index], labels[train_index], k=args.k)
+        predicted = [classifier.predict(s)[0] for s in samples[holdout_index]]
+        truth = labels[holdout_index]
+        accuracy = np.mean([p == t for p, t in zip(predicted, truth)])
+        print(f"Akurasi holdout: {accuracy * 100:.1f}% ({len(holdout_index)} sampel)")
+        for label in classifier.classes:
+            mask = truth == label
+            wrong = [p for p, m in zip(predicted, mask) if m and p != label]
+            print(f"  {label:<14}{np.mean([p == label for p, m in zip(predicted, mask) if m]) * 100:6.1f}%"
+                  + (f"  salah -> {label_counts(wrong)}" if wrong else ""))
+
+        # Batas penolakan: pose yang lebih jauh dari ini dari semua contoh dianggap tidak dikenal
+        distances = nearest_same_label_distance(classifier, samples[holdout_index], truth)
+        reject_distance = float(np.percentile(distances, args.reject_percentile)) * args.reject_margin
+        print(f"Jarak tolak   : {reject_distance:.3f}")
+
+    model = LandmarkClassifier(samples, labels, k=args.k, reject_distance=reject_distance)
+    print(f"Inferensi     : {measure_inference_us(model, samples):.1f} us/frame")
+    output = os.path.expanduser(args.output)
+    model.save(output)
+    print(f"Model disimpan ke {output}")
+
+def main():
+    """Entry point recorder dan trainer"""
+    parser = argparse.ArgumentParser(description="Rekam dan latih classifier pose tangan CamMouse")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help="Rekam sampel berlabel dari kamera")
+    record_parser.add_argument('dataset', help="File dataset .npz (ditambahkan jika sudah ada)")
+    record_parser.add_argument('--label', required=True, help="Nama pose, mis. thumbs_up, fist, peace, three")
+    record_parser.add_argument('--samples', type=int, default=200, help="Jumlah sampel yang direkam")
+    record_parser.add_argument('--interval', type=float, default=0.05, help="Jeda minimum antar sampel (detik)")
+    record_parser.add_argument('--countdown', type=float, default=3.0, help="Jeda sebelum perekaman (detik)")
+    record_parser.add_argument('--camera', default='0', help="Index atau path device kamera")
+    record_parser.add_argument('--preview', action='store_true', help="Tampilkan preview kamera (q untuk berhenti)")
+    record_parser.set_defaults(handler=record)
+
+    train_parser = subparsers.add_parser('train', help="Latih model dari dataset")
+    train_parser.add_argument('datasets', nargs='+', help="Satu atau lebih file dataset .npz")
+    train_parser.add_argument('--output', default='~/.cammouse_pose_model.npz', help="File model .npz")
+    train_parser.add_argument('--k', type=int, default=5, help="Jumlah tetangga k-NN")
+    train_parser.add_argument('--holdout', type=float, default=0.2, help="Porsi data untuk validasi")
+    train_parser.add_argument('--reject-percentile', type=float, default=99.0,
+                              help="Persentil jarak validasi untuk batas penolakan")
+    train_parser.add_argument('--reject-margin', type=float, default=1.25, help="Pengali batas penolakan")
+    train_parser.add_argument('--seed', type=int, default=0, help="Seed pembagian data")
+    train_parser.set_defaults(handler=train)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+CamMouse Synthetic Landmark Stream
+==================================
+Generator trajektori 21 landmark tangan sintetis (gerak, pinch, hold, jitter,
+dropout) dengan bentuk yang sama seperti results.multi_hand_landmarks dari
+MediaPipe, untuk micro-benchmark lapisan gesture tanpa kamera dan tanpa model.
+
+Contoh:
+python cammouse_synthetic.py --frames 1000000
+python cammouse_synthetic.py --frames 200000 --rate 120 --seed 7 --execute
+python cammouse_synthetic.py --score-filters --frames 20000
+python cammouse_synthetic.py --frames 200000 --depth-range 0.25 0.75
+
+Stream bersifat deterministik untuk seed yang sama, sehingga logika smoothing
+dan klik dapat diperiksa terhadap label ground truth per frame.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+# Pose tangan terbuka relatif terhadap pergelangan (koordinat gambar ternormalisasi,
+# y ke bawah) sebelum dikalikan hand_scale
+HAND_TEMPLATE = np.array([
+    [0.000, 0.000, 0.000],     # 0 wrist
+    [-0.070, -0.050, -0.010],  # 1 thumb_cmc
+    [-0.120, -0.100, -0.020],  # 2 thumb_mcp
+    [-0.150, -0.150, -0.030],  # 3 thumb_ip
+    [-0.170, -0.190, -0.040],  # 4 thumb_tip
+    [-0.040, -0.200, -0.010],  # 5 index_mcp
+    [-0.050, -0.290, -0.020],  # 6 index_pip
+    [-0.055, -0.350, -0.030],  # 7 index_dip
+    [-0.060, -0.400, -0.040],  # 8 index_tip
+    [0.000, -0.210, -0.010],   # 9 middle_mcp
+    [0.000, -0.310, -0.020],   # 10 middle_pip
+    [0.000, -0.380, -0.030],   # 11 middle_dip
+    [0.000, -0.430, -0.040],   # 12 middle_tip
+    [0.040, -0.200, -0.010],   # 13 ring_mcp
+    [0.045, -0.290, -0.020],   # 14 ring_pip
+    [0.050, -0.350, -0.030],   # 15 ring_dip
+    [0.050, -0.390, -0.040],   # 16 ring_tip
+    [0.080, -0.170, -0.010],   # 17 pinky_mcp
+    [0.090, -0.240, -0.020],   # 18 pinky_pip
+    [0.095, -0.280, -0.030],   # 19 pinky_dip
+    [0.100, -0.320, -0.040],   # 20 pinky_tip
+], dtype=np.float32)
+
+# Sendi jempol yang digeser ke ujung jari target saat pinch, dengan bobotnya
+PINCH_JOINTS = ((4, 1.0), (3, 0.6))
+
+def hand_pose(wrist, pinch=0.0, target_tip=8, hand_scale=0.5):
+    """
+    Satu pose tangan (21, 3) float32: HAND_TEMPLATE di posisi pergelangan
+    (x, y), dengan jempol ditarik sejauh pinch (0..1) ke ujung jari target.
+    """
+    hand = HAND_TEMPLATE.copy()
+    for joint, weight in PINCH_JOINTS:
+        hand[joint] += (HAND_TEMPLATE[target_tip] - HAND_TEMPLATE[joint]) * pinch * weight
+    return hand * hand_scale + np.array([wrist[0], wrist[1], 0.0], dtype=np.float32)
+
+# Segmen skenario dan bobot pemilihannya
+SEGMENT_WEIGHTS = {
+    'move': 0.45,
+    'hold': 0.15,
+    'pinch': 0.15,
+    'right_pinch': 0.10,
+    'dropout': 0.05,
+    'fast_move': 0.10,
+}
+
+# Durasi segmen dalam detik (min, max)
+SEGMENT_DURATIONS = {
+    'move': (0.4, 1.2),
+    'hold': (0.2, 0.8),
+    'pinch': (0.2, 0.6),
+    'right_pinch': (0.2, 0.6),
+    'dropout': (0.05, 0.3),
+    'fast_move': (0.1, 0.3),
+}
+
+class SyntheticLandmark:
+    """Satu landmark dengan atribut x, y, z seperti NormalizedLandmark MediaPipe"""
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+class SyntheticHandLandmarks:
+    """Daftar 21 landmark seperti NormalizedLandmarkList MediaPipe"""
+    __slots__ = ('landmark',)
+
+    def __init__(self, points):
+        self.landmark = [SyntheticLandmark(float(x), float(y), float(z)) for x, y, z in points]
+
+class SyntheticHandStream:
+    """Generator trajektori tangan sintetis yang deterministik"""
+
+    def __init__(self, rate_hz=30, seed=0, jitter=0.002, hand_scale=0.5, depth_range=None):
+        self.rate_hz = float(rate_hz)
+        self.seed = seed
+        self.jitter = jitter
+        self.hand_scale = hand_scale
+        # (min, max) hand_scale: tangan maju-mundur terhadap kamera selama segmen gerak
+        self.depth_range = depth_range
+
+    def _segments(self, rng, n_frames):
+        """Pilih urutan segmen sampai jumlah frame terpenuhi"""
+        names = list(SEGMENT_WEIGHTS)
+        weights = np.array([SEGMENT_WEIGHTS[name] for name in names])
+        weights = weights / weights.sum()
+        total = 0
+        while total < n_frames:
+            name = names[rng.choice(len(names), p=weights)]
+            low, high = SEGMENT_DURATIONS[name]
+            length = max(1, int(rng.uniform(low, high) * self.rate_hz))
+            yield name, length
+            total += length
+
+    def generate_array(self, n_frames):
+        """
+        Bangkitkan n_frames frame sekaligus.
+
+        Return (timestamps, landmarks, labels): landmarks berbentuk (N, 21, 3)
+        float32 dengan NaN untuk frame tanpa tangan, labels berisi nama segmen
+        dan status pinch ground truth per frame.
+        """
+        rng = np.random.default_rng(self.seed)
+        # Jitter dan kedalaman memakai generator terpisah agar skenario sama untuk
+        # jitter dan depth_range berapa pun
+        noise_rng = np.random.default_rng([self.seed, 1])
+        depth_rng = np.random.default_rng([self.seed, 2])
+        timestamps = np.arange(n_frames, dtype=np.float64) / self.rate_hz
+        landmarks = np.full((n_frames, 21, 3), np.nan, dtype=np.float32)
+        labels = []
+
+        scale = self.hand_scale
+        wrist = np.array([0.5, 0.75, 0.0], dtype=np.float32)
+        frame = 0
+
+        for name, length in self._segments(rng, n_frames):
+            length = min(length, n_frames - frame)
+            if length <= 0:
+                break
+            progress = (np.arange(length, dtype=np.float32) + 1) / length
+
+            # Posisi pergelangan per frame
+            scales = np.full(length, scale, dtype=np.float32)
+            if name in ('move', 'fast_move'):
+                target = np.array([rng.uniform(0.25, 0.75), rng.uniform(0.55, 0.9), 0.0],
+                                  dtype=np.float32)
+                eased = progress * progress * (3 - 2 * progress)  # smoothstep
+                wrists = wrist + (target - wrist) * eased[:, None]
+                wrist = target
+                if self.depth_range is not None:
+                    target_scale = depth_rng.uniform(*self.depth_range)
+                    scales = scale + (target_scale - scale) * eased
+                    scale = target_scale
+            else:
+                wrists = np.repeat(wrist[None, :], length, axis=0)
+
+            # Tingkat pinch: menutup 30% awal, menahan, membuka 30% akhir
+            pinch = np.zeros(length, dtype=np.float32)
+            if name in ('pinch', 'right_pinch'):
+                pinch = np.clip(np.minimum(progress, 1 - progress + 1 / length) / 0.3, 0, 1)
+
+            hands = HAND_TEMPLATE[None, :, :] * scales[:, None, None]
+            if name in ('pinch', 'right_pinch'):
+                target_tip = 8 if name == 'pinch' else 12
+                for joint, weight in PINCH_JOINTS:
+                    delta = HAND_TEMPLATE[target_tip] - HAND_TEMPLATE[joint]
+                    hands[:, joint, :] += delta * (pinch * weight * scales)[:, None]
+
+            points = hands + wrists[:, None, :]
+            if self.jitter > 0:
+                points += noise_rng.normal(0.0, self.jitter, size=points.shape).astype(np.float32)
+
+            if name != 'dropout':
+                landmarks[frame:frame + length] = points
+
+            for i in range(length):
+                labels.append({
+                    'segment': name,
+                    'left_pinch': bool(name == 'pinch' and pinch[i] > 0.8),
+                    'right_pinch': bool(name == 'right_pinch' and pinch[i] > 0.8),
+                })
+            frame += length
+
+        return timestamps, landmarks, labels
+
+    def frames(self, n_frames, as_array=False):
+        """
+        Iterasi (timestamp, multi_hand_landmarks atau None, label) per frame.
+
+        Dengan as_array=True setiap tangan berupa array (21, 3) float32 alih-alih
+        objek landmark, untuk mengukur lapisan gesture tanpa biaya konversi.
+        """
+        timestamps, landmarks, labels = self.generate_array(n_frames)
+        for timestamp, points, label in zip(timestamps, landmarks, labels):
+            if np.isnan(points[0, 0]):
+                yield timestamp, None, label
+            elif as_array:
+                yield timestamp, [np.ascontiguousarray(points)], label
+            else:
+                yield timestamp, [SyntheticHandLandmarks(points)], label
+
+def run_gesture_benchmark(controller, stream, n_frames, cycle_frames=10000, execute=False,
+                          as_array=False):
+    """Ukur throughput process_hand_landmarks pada stream sintetis"""
+    cycle = list(stream.frames(min(n_frames, cycle_frames), as_array=as_array))
+    if execute:
+        controller.is_system_control_enabled = True
+
+    agreement = {'left': [0, 0], 'right': [0, 0]}  # [cocok, total]
+    processed = 0
+    # Timestamp terus naik antar pengulangan cycle agar dt filter tetap valid
+    cycle_duration = len(cycle) / stream.rate_hz
+    time_offset = 0.0
+    start_time = time.perf_counter()
+    cpu_start = time.process_time()
+    while processed < n_frames:
+        for timestamp, multi_hand_landmarks, label in cycle:
+            if processed >= n_frames:
+                break
+            processed += 1
+            if not multi_hand_landmarks:
+                controller.reset_hand_tracking()
+                continue
+            gestures = controller.process_hand_landmarks(
+                multi_hand_landmarks[0], 640, 480, time_offset + timestamp)
+            if execute and gestures:
+                controller.execute_system_control(gestures)
+            agreement['left'][0] += gestures['left_click'] == label['left_pinch']
+            agreement['left'][1] += 1
+            agreement['right'][0] += gestures['right_click'] == label['right_pinch']
+            agreement['right'][1] += 1
+        time_offset += cycle_duration
+    wall_time = time.perf_counter() - start_time
+    cpu_time = time.process_time() - cpu_start
+
+    return {
+        'frames': processed,
+        'wall_time_s': wall_time,
+        'frames_per_second': processed / wall_time if wall_time > 0 else 0.0,
+        'ns_per_frame': wall_time * 1e9 / processed if processed else 0.0,
+        'cpu_time_s': cpu_time,
+        'left_click_agreement': agreement['left'][0] / max(1, agreement['left'][1]),
+        'right_click_agreement': agreement['right'][0] / max(1, agreement['right'][1]),
+    }
+
+def _replay_cursor(controller, timestamps, landmarks, visible):
+    """Jalankan landmark melalui process_hand_landmarks dan kumpulkan posisi kursor"""
+    cursor = np.full((len(timestamps), 2), np.nan)
+    controller.reset_hand_tracking()
+    for i in range(len(timestamps)):
+        if not visible[i]:
+            controller.reset_hand_tracking()
+            continue
+        gestures = controller.process_hand_landmarks(landmarks[i], 640, 480, timestamps[i])
+        cursor[i] = gestures['cursor_pos']
+    return cursor
+
+def score_cursor_filters(controller, stream, n_frames, filters=None, max_lag_frames=30):
+    """
+    Nilai setiap filter kursor terhadap stream yang sama tanpa jitter.
+
+    Lag adalah pergeseran (ms) yang meminimalkan RMSE kursor terhadap posisi
+    ideal selama segmen gerak. Jitter adalah RMS selisih kursor antara stream
+    ber-jitter dan stream bersih selama segmen hold, yaitu getaran yang murni
+    berasal dari noise landmark.
+    """
+    from cammouse_system_controller import CURSOR_FILTERS, INDEX_TIP
+
+    timestamps, landmarks, labels = stream.generate_array(n_frames)
+    clean = SyntheticHandStream(stream.rate_hz, stream.seed, 0.0, stream.hand_scale,
+                                stream.depth_range)
+    _, clean_landmarks, _ = clean.generate_array(n_frames)
+
+    scale = np.array([controller.screen_width, controller.screen_height]) * controller.cursor_sensitivity
+    truth = clean_landmarks[:, INDEX_TIP, :2].astype(np.float64) * scale
+    visible = ~np.isnan(landmarks[:, 0, 0])
+    segments = np.array([label['segment'] for label in labels])
+    # Abaikan posisi di luar layar karena clamp tepi mendistorsi skor
+    inside = visible & np.all((truth > 0) & (truth < scale), axis=1)
+    moving = inside & np.isin(segments, ('move', 'fast_move'))
+    holding = inside & (segments == 'hold')
+
+    results = {}
+    for name in filters or CURSOR_FILTERS:
+        controller.set_cursor_filter(name)
+        start_time = time.perf_counter()
+        cursor = _replay_cursor(controller, timestamps, landmarks, visible)
+        wall_time = time.perf_counter() - start_time
+        clean_cursor = _replay_cursor(controller, timestamps, clean_landmarks, visible)
+
+        # Lag: pergeseran truth (dalam frame) yang paling cocok dengan output filter
+        errors = []
+        for shift in range(max_lag_frames + 1):
+            valid = moving[shift:] & moving[:n_frames - shift]
+            diff = cursor[shift:][valid] - truth[:n_frames - shift][valid]
+            errors.append(np.sqrt(np.mean(np.sum(diff * diff, axis=1))) if len(diff) else np.inf)
+
+        tracking = cursor[moving] - truth[moving]
+        noise = cursor[holding] - clean_cursor[holding]
+        results[name] = {
+            'lag_ms': int(np.argmin(errors)) * 1000.0 / stream.rate_hz,
+            'tracking_rmse_px': float(np.sqrt(np.mean(np.sum(tracking * tracking, axis=1)))),
+            'hold_jitter_px': float(np.sqrt(np.mean(np.sum(noise * noise, axis=1)))),
+            'us_per_frame': wall_time * 1e6 / max(1, int(visible.sum())),
+        }
+    return results
+
+def main():
+    """Entry point micro-benchmark lapisan gesture"""
+    parser = argparse.ArgumentParser(description="Micro-benchmark gesture CamMouse dengan landmark sintetis")
+    parser.add_argument('--frames', type=int, default=1000000, help="Jumlah frame yang diproses")
+    parser.add_argument('--rate', type=float, default=30, help="Rate stream sintetis (Hz)")
+    parser.add_argument('--seed', type=int, default=0, help="Seed generator")
+    parser.add_argument('--jitter', type=float, default=0.002, help="Standar deviasi jitter landmark")
+    parser.add_argument('--depth-range', type=float, nargs=2, metavar=('MIN', 'MAX'),
+                        help="Variasi hand_scale (jarak tangan ke kamera) selama segmen gerak")
+    parser.add_argument('--cycle', type=int, default=10000,
+                        help="Jumlah frame unik yang dibangkitkan lalu diulang")
+    parser.add_argument('--execute', action='store_true',
+                        help="Ikut jalankan execute_system_control dengan NullActuator")
+    parser.add_argument('--array', action='store_true',
+                        help="Kirim landmark sebagai array (21, 3) tanpa konversi objek")
+    parser.add_argument('--score-filters', action='store_true',
+                        help="Bandingkan lag dan jitter setiap filter kursor")
+    args = parser.parse_args()
+
+    from cammouse_system_controller import CamMouseSystemController, NullActuator
+
+    controller = CamMouseSystemController(actuator=NullActuator())
+    stream = SyntheticHandStream(rate_hz=args.rate, seed=args.seed, jitter=args.jitter,
+                                 depth_range=args.depth_range)
+
+    if args.score_filters:
+        scores = score_cursor_filters(controller, stream, args.frames)
+        print(f"{'Filter':<10}{'Lag':>8}{'RMSE':>10}{'Jitter':>10}{'Waktu':>10}")
+        for name, score in scores.items():
+            print(f"{name:<10}{score['lag_ms']:6.0f}ms{score['tracking_rmse_px']:8.1f}px"
+                  f"{score['hold_jitter_px']:8.2f}px{score['us_per_frame']:8.1f}us")
+        return
+
+    result = run_gesture_benchmark(controller, stream, args.frames, args.cycle, args.execute,
+                                   args.array)
+
+    print(f"Frame          : {result['frames']}")
+    print(f"Throughput     : {result['frames_per_second']:,.0f} frame/s "
+          f"({result['ns_per_frame']:.0f} ns/frame)")
+    print(f"CPU time       : {result['cpu_time_s']:.2f} s")
+    print(f"Kecocokan klik : kiri {result['left_click_agreement']:.1%}, "
+          f"kanan {result['right_click_agreement']:.1%}")
+
+if __name__ == "__main__":
+    main()
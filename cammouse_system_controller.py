@@ -12,6 +12,7 @@ Dependensi:
 - tkinter (built-in Python)
 - pillow
 - numpy
+- screeninfo (opsional, untuk multi-monitor)
 
 Install:
 pip install opencv-python mediapipe pyautogui pillow numpy
@@ -22,9 +23,8 @@ Version: 2.1.0
 
 import cv2
 import mediapipe as mp
-import pyautogui
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import threading
 import time
 import numpy as np
@@ -32,143 +32,2663 @@ from PIL import Image, ImageTk
 import json
 import os
 import sys
+import csv
+import bisect
+import math
+import argparse
+import collections
+import operator
+
+# PyAutoGUI butuh display saat import; mode headless (benchmark/CI) tetap bisa jalan tanpanya
+try:
+    import pyautogui
+except Exception:
+    pyautogui = None
+
+# Indeks landmark MediaPipe Hands
+WRIST = 0
+THUMB_TIP = 4
+INDEX_TIP = 8
+MIDDLE_MCP = 9
+MIDDLE_TIP = 12
+RING_TIP = 16
+PINKY_TIP = 20
+FINGER_NAMES = ['thumb', 'index', 'middle', 'ring', 'pinky']
+FINGER_TIPS = [THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]
+FINGER_PIPS = [3, 6, 10, 14, 18]  # Untuk jempol dipakai sendi IP
+PINCH_TIPS = [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]  # Pasangan dengan ujung jempol
+
+_landmark_xyz = operator.attrgetter('x', 'y', 'z')
+
+# Wire format NormalizedLandmarkList dengan tepat x, y, z per landmark: setiap
+# landmark 17 byte = key field 1 (0x0a) + panjang (15) + 3 x (tag + float32 LE)
+LANDMARK_WIRE_SIZE = 17
+LANDMARK_WIRE_LENGTH = b'\x0f' * 21
+LANDMARK_WIRE_TAGS = (b'\x0d' * 21, b'\x15' * 21, b'\x1d' * 21)  # Tag x, y, z
+
+def landmarks_to_array(landmarks):
+    """Konversi NormalizedLandmarkList MediaPipe ke array kontigu (21, 3) float32"""
+    if isinstance(landmarks, np.ndarray):
+        return landmarks
+    # Jalur cepat: satu serialisasi protobuf lalu baca float langsung dari byte-nya,
+    # jauh lebih murah daripada 63 akses atribut protobuf
+    serialize = getattr(landmarks, 'SerializeToString', None)
+    if serialize is not None:
+        data = serialize()
+        size, (x_tag, y_tag, z_tag) = LANDMARK_WIRE_SIZE, LANDMARK_WIRE_TAGS
+        if (len(data) == 21 * size and data[1::size] == LANDMARK_WIRE_LENGTH
+                and data[2::size] == x_tag and data[7::size] == y_tag and data[12::size] == z_tag):
+            return np.ndarray((21, 3), dtype='<f4', buffer=data, offset=3,
+                              strides=(LANDMARK_WIRE_SIZE, 5)).astype(np.float32)
+    # Landmark dengan visibility/presence atau objek non-protobuf: satu getter C per landmark.
+    # Array baru setiap frame (bukan buffer bersama): points ikut gestures ke thread lain
+    return np.array(list(map(_landmark_xyz, landmarks.landmark)), dtype=np.float32)
+
+# Sendi untuk sudut tekuk jari: (titik sebelum, sendi, titik sesudah) untuk MCP/PIP/DIP
+# (jempol: CMC/MCP/IP) setiap jari, urut per jari
+JOINT_PREV = np.array([0, 1, 2, 0, 5, 6, 0, 9, 10, 0, 13, 14, 0, 17, 18])
+JOINT_CENTER = np.array([1, 2, 3, 5, 6, 7, 9, 10, 11, 13, 14, 15, 17, 18, 19])
+JOINT_NEXT = JOINT_CENTER + 1
+PALM_POINTS = [WRIST, 5, MIDDLE_MCP, 13, 17]
+
+class HandFeatures(dict):
+    """
+    Cache fitur turunan satu frame, dibagi oleh semua detektor gesture.
+
+    Fitur dasar diisi compute_hand_features; fitur lain dihitung lewat
+    FEATURE_FUNCTIONS saat pertama diminta lalu disimpan, sehingga setiap
+    fitur dihitung paling banyak sekali per frame berapa pun detektornya.
+    """
+
+    def __missing__(self, name):
+        if name not in FEATURE_FUNCTIONS:
+            raise KeyError(name)
+        value = self[name] = FEATURE_FUNCTIONS[name](self)
+        return value
+
+# Fitur turunan lazy: nama -> fungsi(features)
+FEATURE_FUNCTIONS = {}
+
+def register_feature(name):
+    """Decorator untuk menambah fitur lazy ke HandFeatures"""
+    def decorator(function):
+        FEATURE_FUNCTIONS[name] = function
+        return function
+    return decorator
+
+@register_feature('joint_angles')
+def _joint_angles(features):
+    """Sudut tekuk (radian, 0 = lurus) 15 sendi jari dalam 3D, shape (5, 3)"""
+    points = features['points']
+    a = points.take(JOINT_CENTER, axis=0) - points.take(JOINT_PREV, axis=0)
+    b = points.take(JOINT_NEXT, axis=0) - points.take(JOINT_CENTER, axis=0)
+    cosine = np.einsum('ij,ij->i', a, b) / (
+        np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1) + 1e-9)
+    return np.arccos(np.clip(cosine, -1.0, 1.0)).reshape(5, 3)
+
+@register_feature('fingers_extended')
+def _fingers_extended(features):
+    """finger_flags sebagai array bool (5,) untuk detektor berbasis array"""
+    return np.array(features['finger_flags'])
+
+@register_feature('extended_count')
+def _extended_count(features):
+    return sum(features['finger_flags'])
+
+@register_feature('palm_center')
+def _palm_center(features):
+    """Titik tengah telapak (wrist + MCP) dalam koordinat gambar (x, y)"""
+    x, y = (features['points'].take(PALM_POINTS, axis=0)[:, :2].sum(axis=0) / len(PALM_POINTS)).tolist()
+    return x, y
+
+def normalize_landmarks(points):
+    """
+    Normalisasi pose tangan: translasi ke wrist, rotasi agar wrist->middle_mcp
+    mengarah ke atas, dan skala dengan panjang wrist->middle_mcp.
+    """
+    relative = points - points[WRIST]
+    dx, dy = relative[MIDDLE_MCP, :2].tolist()
+    scale = math.hypot(dx, dy) or 1.0
+    # Rotasi bidang xy: vektor (dx, dy) dipetakan ke (0, -scale)
+    cos_a, sin_a = -dy / scale, dx / scale
+    rotation = np.array([[cos_a, sin_a, 0.0], [-sin_a, cos_a, 0.0], [0.0, 0.0, 1.0]],
+                        dtype=np.float32) / scale
+    return relative @ rotation.T
+
+@register_feature('normalized_landmarks')
+def _normalized_landmarks(features):
+    return normalize_landmarks(features['points'])
+
+def compute_hand_features(points, timestamp=None):
+    """
+    Hitung fitur gesture dasar (jarak pinch, jari terentang, ukuran telapak).
+
+    Jarak dihitung dalam 3D (z MediaPipe berskala kira-kira sama dengan x), dan
+    jarak pinch dinyatakan dalam ukuran telapak (wrist ke middle_mcp) sehingga
+    threshold klik bermakna sama pada jarak tangan berapa pun dari kamera.
+    Hanya 15 jarak skalar: math.dist pada list Python lebih murah daripada
+    overhead panggilan NumPy untuk array sekecil ini.
+    """
+    rows = points.tolist()
+    dist = math.dist
+    wrist, thumb = rows[WRIST], rows[THUMB_TIP]
+    palm_size = dist(wrist, rows[MIDDLE_MCP])
+    scale = 1.0 / max(palm_size, 1e-6)
+    return HandFeatures(
+        points=points,
+        timestamp=timestamp,
+        # Jempol ke telunjuk/tengah/manis/kelingking, relatif terhadap ukuran telapak
+        pinch_distances=(dist(thumb, rows[8]) * scale, dist(thumb, rows[12]) * scale,
+                         dist(thumb, rows[16]) * scale, dist(thumb, rows[20]) * scale),
+        # Jari terentang: ujung lebih jauh dari wrist daripada sendi PIP (jempol: IP)
+        finger_flags=(dist(thumb, wrist) > dist(rows[3], wrist),
+                      dist(rows[8], wrist) > dist(rows[6], wrist),
+                      dist(rows[12], wrist) > dist(rows[10], wrist),
+                      dist(rows[16], wrist) > dist(rows[14], wrist),
+                      dist(rows[20], wrist) > dist(rows[18], wrist)),
+        palm_size=palm_size,
+    )
+
+# Backend capture OpenCV yang bisa dipilih; 'auto' memakai V4L2 di Linux
+CAMERA_BACKENDS = {
+    'auto': None,
+    'any': cv2.CAP_ANY,
+    'v4l2': cv2.CAP_V4L2,
+    'dshow': cv2.CAP_DSHOW,
+    'msmf': cv2.CAP_MSMF,
+    'avfoundation': cv2.CAP_AVFOUNDATION,
+}
+
+def decode_fourcc(value):
+    """Konversi nilai CAP_PROP_FOURCC (float) ke string 4 karakter"""
+    code = int(value)
+    if code <= 0:
+        return ''
+    return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+
+# Urutan tahap yang diukur latensinya per frame
+LATENCY_STAGES = ['capture', 'frame_age', 'flip', 'bgr2rgb', 'hands', 'draw', 'gesture', 'actuation',
+                  'injection', 'total']
+
+class LatencyHistogram:
+    """Histogram latensi dengan bucket tetap (skala logaritmik, dalam milidetik)"""
+
+    # Batas atas bucket: 0.01 ms sampai ~2 detik, naik 25% per bucket
+    BUCKET_BOUNDS_MS = [0.01 * 1.25 ** i for i in range(56)]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Kosongkan semua bucket"""
+        with self._lock:
+            self.counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+            self.count = 0
+            self.total_ms = 0.0
+            self.min_ms = None
+            self.max_ms = 0.0
+
+    def record(self, seconds):
+        """Catat satu sampel durasi dalam detik"""
+        value_ms = seconds * 1000.0
+        index = bisect.bisect_left(self.BUCKET_BOUNDS_MS, value_ms)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total_ms += value_ms
+            if self.min_ms is None or value_ms < self.min_ms:
+                self.min_ms = value_ms
+            if value_ms > self.max_ms:
+                self.max_ms = value_ms
+
+    def percentile(self, percent):
+        """Estimasi persentil dengan interpolasi linear di dalam bucket, dalam milidetik"""
+        with self._lock:
+            if self.count == 0:
+                return 0.0
+            target = self.count * percent / 100.0
+            cumulative = 0
+            for index, bucket_count in enumerate(self.counts):
+                if bucket_count and cumulative + bucket_count >= target:
+                    lower = self.BUCKET_BOUNDS_MS[index - 1] if index > 0 else 0.0
+                    upper = (self.BUCKET_BOUNDS_MS[index]
+                             if index < len(self.BUCKET_BOUNDS_MS) else self.max_ms)
+                    fraction = (target - cumulative) / bucket_count
+                    value = lower + (upper - lower) * fraction
+                    return max(self.min_ms, min(value, self.max_ms))
+                cumulative += bucket_count
+            return self.max_ms
+
+    def summary(self):
+        """Ringkasan statistik untuk export dan tampilan"""
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'min_ms': self.min_ms or 0.0,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+        }
+
+class LatencyRecorder:
+    """Kumpulan histogram latensi per tahap pipeline"""
+
+    def __init__(self, stages=LATENCY_STAGES):
+        self.enabled = True
+        self.histograms = {stage: LatencyHistogram() for stage in stages}
+
+    def record(self, stage, start_time):
+        """Catat durasi sejak start_time, kembalikan waktu sekarang untuk tahap berikutnya"""
+        now = time.perf_counter()
+        if self.enabled:
+            self.histograms[stage].record(now - start_time)
+        return now
+
+    def reset(self):
+        """Reset semua histogram"""
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def summary(self):
+        """Ringkasan p50/p95/p99 per tahap"""
+        return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+
+    def export(self, path):
+        """Simpan ringkasan latensi ke file JSON atau CSV (berdasarkan ekstensi)"""
+        summary = self.summary()
+        if path.lower().endswith('.csv'):
+            fields = ['stage', 'count', 'mean_ms', 'min_ms', 'max_ms', 'p50_ms', 'p95_ms', 'p99_ms']
+            with open(path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                for stage, stats in summary.items():
+                    writer.writerow(dict(stage=stage, **stats))
+        else:
+            export_data = {
+                'bucket_bounds_ms': LatencyHistogram.BUCKET_BOUNDS_MS,
+                'stages': {
+                    stage: dict(stats, buckets=self.histograms[stage].counts)
+                    for stage, stats in summary.items()
+                },
+            }
+            with open(path, 'w') as f:
+                json.dump(export_data, f, indent=2)
+
+class CameraGrabber:
+    """Thread yang terus membaca kamera dan hanya menyimpan frame terbaru"""
+
+    def __init__(self, camera, latency=None):
+        self.camera = camera
+        self.latency = latency
+        self._condition = threading.Condition()
+        self._frame = None
+        self.capture_time = 0.0
+        self.sequence = 0
+        self._consumed_sequence = 0
+        self.frame_count = 0
+        self.drop_count = 0
+        self.failed_reads = 0
+        self.is_running = False
+        self.thread = None
+
+    def start(self):
+        """Mulai thread grab"""
+        self.is_running = True
+        self.thread = threading.Thread(target=self._grab_loop, name='cammouse-grabber', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Hentikan thread grab sebelum kamera di-release"""
+        self.is_running = False
+        with self._condition:
+            self._condition.notify_all()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+        self.thread = None
+
+    def _grab_loop(self):
+        while self.is_running:
+            start_time = time.perf_counter()
+            ret, frame = self.camera.read()
+            capture_time = time.perf_counter()
+            if self.latency is not None:
+                self.latency.record('capture', start_time)
+            if not ret:
+                self.failed_reads += 1
+                time.sleep(0.005)
+                continue
+            with self._condition:
+                # Frame sebelumnya belum diambil consumer: dibuang
+                if self.sequence > self._consumed_sequence:
+                    self.drop_count += 1
+                self._frame = frame
+                self.capture_time = capture_time
+                self.sequence += 1
+                self.frame_count += 1
+                self._condition.notify_all()
+
+    def read(self, timeout=0):
+        """
+        Ambil frame terbaru yang belum pernah dikembalikan.
+
+        Return (frame, capture_time, sequence), atau None jika belum ada frame
+        baru dalam timeout (timeout=0 berarti tidak menunggu sama sekali).
+        """
+        with self._condition:
+            if self.sequence == self._consumed_sequence and timeout and self.is_running:
+                self._condition.wait(timeout)
+            if self.sequence == self._consumed_sequence:
+                return None
+            self._consumed_sequence = self.sequence
+            return self._frame, self.capture_time, self.sequence
+
+class ActuatorBackend:
+    """Interface backend aktuasi; move_to mengembalikan False jika failsafe terpicu"""
+
+    def size(self):
+        """Ukuran layar (lebar, tinggi) dalam piksel"""
+        raise NotImplementedError
+
+    def move_to(self, x, y):
+        raise NotImplementedError
+
+    def click(self):
+        raise NotImplementedError
+
+    def right_click(self):
+        raise NotImplementedError
+
+    def move_relative(self, dx, dy):
+        """Gerakkan kursor relatif terhadap posisi sekarang"""
+        raise NotImplementedError
+
+    def mouse_down(self, button='left'):
+        raise NotImplementedError
+
+    def mouse_up(self, button='left'):
+        raise NotImplementedError
+
+    def scroll(self, dx, dy):
+        """Scroll dalam notch: dy positif ke atas, dx positif ke kanan"""
+        raise NotImplementedError
+
+    def hotkey(self, *keys):
+        """Tekan kombinasi tombol keyboard (nama key PyAutoGUI, mis. 'ctrl', 'alt', 'right')"""
+        raise NotImplementedError
+
+    def set_bounds(self, bounds):
+        """Area virtual desktop (x, y, lebar, tinggi) berubah; koordinat move_to ada di ruang ini"""
+
+    def reset(self):
+        """Dipanggil saat kontrol sistem diaktifkan kembali"""
+
+    def close(self):
+        """Lepaskan resource backend"""
+
+class PyAutoGUIActuator(ActuatorBackend):
+    """Backend aktuasi sistem menggunakan PyAutoGUI"""
 
-class CamMouseSystemController:
     def __init__(self):
+        if pyautogui is None:
+            raise RuntimeError("PyAutoGUI tidak tersedia (tidak ada display?)")
+
+        # Konfigurasi PyAutoGUI untuk kontrol sistem
+        pyautogui.FAILSAFE = True  # Failsafe ke pojok kiri atas
+        pyautogui.PAUSE = 0  # Tanpa sleep antar aksi: aksi dikirim dari thread aktuasi sendiri
+
+    def size(self):
+        """Ukuran layar utama"""
+        return pyautogui.size()
+
+    def move_to(self, x, y):
+        """Gerakkan kursor, False jika failsafe terpicu"""
+        try:
+            pyautogui.moveTo(x, y, duration=0, _pause=False)
+        except pyautogui.FailSafeException:
+            return False
+        return True
+
+    def click(self):
+        """Klik kiri"""
+        pyautogui.click(_pause=False)
+
+    def right_click(self):
+        """Klik kanan"""
+        pyautogui.rightClick(_pause=False)
+
+    def move_relative(self, dx, dy):
+        """Gerakkan kursor relatif"""
+        try:
+            pyautogui.moveRel(dx, dy, duration=0, _pause=False)
+        except pyautogui.FailSafeException:
+            return False
+        return True
+
+    def mouse_down(self, button='left'):
+        pyautogui.mouseDown(button=button, _pause=False)
+
+    def mouse_up(self, button='left'):
+        pyautogui.mouseUp(button=button, _pause=False)
+
+    def scroll(self, dx, dy):
+        if dy:
+            pyautogui.scroll(dy, _pause=False)
+        if dx:
+            pyautogui.hscroll(dx, _pause=False)
+
+    def hotkey(self, *keys):
+        pyautogui.hotkey(*keys, _pause=False)
+
+class XTestActuator(ActuatorBackend):
+    """Backend aktuasi X11 langsung lewat ekstensi XTest (tanpa overhead PyAutoGUI)"""
+
+    def __init__(self, display_name=None):
+        # python-xlib sudah menjadi dependensi PyAutoGUI di Linux
+        from Xlib import X, display
+        from Xlib.ext import xtest
+
+        self._X = X
+        self._xtest = xtest
+        self.display = display.Display(display_name)
+        if not self.display.has_extension('XTEST'):
+            raise RuntimeError("Ekstensi XTEST tidak tersedia di X server")
+        self.screen = self.display.screen()
+        self.failsafe = True  # Failsafe ke pojok kiri atas seperti PyAutoGUI
+        self.failsafe_interval = 0.2  # Jeda minimum query_pointer (detik)
+        self.position = None  # Posisi terakhir yang dikirim backend
+        self._failsafe_checked = 0.0
+
+    def size(self):
+        """Ukuran root window X"""
+        return self.screen.width_in_pixels, self.screen.height_in_pixels
+
+    def move_to(self, x, y):
+        """Kirim motion event absolut, False jika kursor berada di pojok failsafe"""
+        if self.failsafe and self._at_failsafe_corner():
+            return False
+        x, y = int(x), int(y)
+        self._xtest.fake_input(self.display, self._X.MotionNotify, x=x, y=y)
+        self.display.flush()
+        self.position = (x, y)
+        return True
+
+    def _at_failsafe_corner(self):
+        """
+        Cek pojok failsafe dari posisi terakhir yang dikirim; posisi pointer
+        sebenarnya (mouse fisik) hanya di-query tiap failsafe_interval karena
+        query_pointer adalah round trip sinkron ke X server.
+        """
+        if self.position == (0, 0):
+            return True
+        now = time.perf_counter()
+        if now - self._failsafe_checked < self.failsafe_interval:
+            return False
+        self._failsafe_checked = now
+        pointer = self.screen.root.query_pointer()
+        return pointer.root_x == 0 and pointer.root_y == 0
+
+    # Nomor tombol pointer X11
+    BUTTONS = {'left': 1, 'middle': 2, 'right': 3}
+    # Tombol scroll X11 (atas, bawah, kiri, kanan); satu klik = satu notch
+    SCROLL_BUTTONS = (4, 5, 6, 7)
+
+    def move_relative(self, dx, dy):
+        """Kirim motion event relatif (detail=True pada XTest)"""
+        self._xtest.fake_input(self.display, self._X.MotionNotify, detail=True,
+                               x=int(dx), y=int(dy))
+        self.display.flush()
+        self.position = None  # Posisi absolut tidak lagi diketahui
+        return True
+
+    def mouse_down(self, button='left'):
+        self._xtest.fake_input(self.display, self._X.ButtonPress, self.BUTTONS[button])
+        self.display.flush()
+
+    def mouse_up(self, button='left'):
+        self._xtest.fake_input(self.display, self._X.ButtonRelease, self.BUTTONS[button])
+        self.display.flush()
+
+    def scroll(self, dx, dy):
+        """Kirim semua notch scroll frame ini dalam satu flush"""
+        up, down, left, right = self.SCROLL_BUTTONS
+        for amount, positive, negative in ((dy, up, down), (dx, right, left)):
+            button = positive if amount > 0 else negative
+            for _ in range(abs(int(amount))):
+                self._xtest.fake_input(self.display, self._X.ButtonPress, button)
+                self._xtest.fake_input(self.display, self._X.ButtonRelease, button)
+        self.display.flush()
+
+    # Nama key PyAutoGUI ke keysym X11
+    KEYSYMS = {'ctrl': 'Control_L', 'alt': 'Alt_L', 'shift': 'Shift_L', 'win': 'Super_L',
+               'super': 'Super_L', 'left': 'Left', 'right': 'Right', 'up': 'Up', 'down': 'Down',
+               'pageup': 'Prior', 'pagedown': 'Next'}
+
+    def hotkey(self, *keys):
+        """Tekan semua key berurutan lalu lepas terbalik, dalam satu flush"""
+        from Xlib import XK
+
+        keycodes = [self.display.keysym_to_keycode(XK.string_to_keysym(self.KEYSYMS.get(key, key)))
+                    for key in keys]
+        for keycode in keycodes:
+            self._xtest.fake_input(self.display, self._X.KeyPress, keycode)
+        for keycode in reversed(keycodes):
+            self._xtest.fake_input(self.display, self._X.KeyRelease, keycode)
+        self.display.flush()
+
+    def _click_button(self, button):
+        # Press dan release dikirim dalam satu flush, tanpa sleep
+        self._xtest.fake_input(self.display, self._X.ButtonPress, self.BUTTONS[button])
+        self._xtest.fake_input(self.display, self._X.ButtonRelease, self.BUTTONS[button])
+        self.display.flush()
+
+    def click(self):
+        """Klik kiri"""
+        self._click_button('left')
+
+    def right_click(self):
+        """Klik kanan"""
+        self._click_button('right')
+
+    def reset(self):
+        # Move pertama setelah kontrol diaktifkan selalu meng-query pointer sebenarnya
+        self.position = None
+        self._failsafe_checked = 0.0
+
+    def close(self):
+        self.display.close()
+
+class UInputActuator(ActuatorBackend):
+    """
+    Backend aktuasi Linux lewat /dev/uinput (tanpa X11, juga bekerja di Wayland).
+
+    Membuat perangkat pointer virtual. Mode 'absolute' meniru tablet USB QEMU
+    (ABS_X/ABS_Y) sehingga posisi layar dapat dikirim langsung; mode 'relative'
+    mengirim REL_X/REL_Y seperti mouse biasa. Setiap aksi ditulis dalam satu
+    syscall write tanpa sleep, cocok untuk update 120 Hz ke atas. Butuh akses
+    tulis ke /dev/uinput (grup input atau aturan udev).
+    """
+
+    # Konstanta dari linux/input-event-codes.h dan linux/uinput.h
+    EV_SYN, EV_KEY, EV_REL, EV_ABS = 0x00, 0x01, 0x02, 0x03
+    SYN_REPORT = 0
+    REL_X, REL_Y, REL_HWHEEL, REL_WHEEL = 0x00, 0x01, 0x06, 0x08
+    ABS_X, ABS_Y = 0x00, 0x01
+    BUTTONS = {'left': 0x110, 'right': 0x111, 'middle': 0x112}
+    # Key keyboard untuk hotkey (nama key PyAutoGUI ke KEY_*)
+    KEYS = {'ctrl': 29, 'alt': 56, 'shift': 42, 'win': 125, 'super': 125, 'left': 105,
+            'right': 106, 'up': 103, 'down': 108, 'pageup': 104, 'pagedown': 109}
+    UI_SET_EVBIT = 0x40045564
+    UI_SET_KEYBIT = 0x40045565
+    UI_SET_RELBIT = 0x40045566
+    UI_SET_ABSBIT = 0x40045567
+    UI_DEV_CREATE = 0x5501
+    UI_DEV_DESTROY = 0x5502
+    ABS_CNT = 64
+    EVENT_FORMAT = 'llHHi'  # struct input_event: timeval, type, code, value
+
+    def __init__(self, screen_size=None, mode='absolute', device_path='/dev/uinput',
+                 name='CamMouse Virtual Pointer', origin=(0, 0)):
+        import fcntl
+        import struct
+
+        self._ioctl = fcntl.ioctl
+        self._struct = struct
+        self._event_struct = struct.Struct(self.EVENT_FORMAT)
+        self.mode = mode
+        self.device_path = device_path
+        self.name = name
+        if screen_size is None:
+            screen_size = pyautogui.size() if pyautogui is not None else (1920, 1080)
+        # Sumbu absolut mencakup seluruh virtual desktop (semua monitor); koordinat
+        # move_to dikurangi origin sebelum ditulis
+        self.screen_size = tuple(screen_size)
+        self.origin = tuple(origin)
+        self.position = None
+        self.failsafe = True  # Failsafe ke pojok kiri atas seperti PyAutoGUI
+
+        self.fd = None
+        self._open_device()
+
+    def _open_device(self):
+        self.fd = os.open(self.device_path, os.O_WRONLY | os.O_NONBLOCK)
+        try:
+            self._setup_device(self.name, self._struct)
+        except Exception:
+            os.close(self.fd)
+            self.fd = None
+            raise
+
+    def _setup_device(self, name, struct):
+        """Daftarkan kemampuan perangkat lalu buat perangkat virtual"""
+        for event_type in (self.EV_SYN, self.EV_KEY, self.EV_REL):
+            self._ioctl(self.fd, self.UI_SET_EVBIT, event_type)
+        for key in (*self.BUTTONS.values(), *self.KEYS.values()):
+            self._ioctl(self.fd, self.UI_SET_KEYBIT, key)
+        rel_codes = [self.REL_WHEEL, self.REL_HWHEEL]
+        if self.mode == 'relative':
+            rel_codes += [self.REL_X, self.REL_Y]
+        for code in rel_codes:
+            self._ioctl(self.fd, self.UI_SET_RELBIT, code)
+
+        absmax = [0] * self.ABS_CNT
+        if self.mode == 'absolute':
+            self._ioctl(self.fd, self.UI_SET_EVBIT, self.EV_ABS)
+            for code in (self.ABS_X, self.ABS_Y):
+                self._ioctl(self.fd, self.UI_SET_ABSBIT, code)
+            absmax[self.ABS_X] = self.screen_size[0] - 1
+            absmax[self.ABS_Y] = self.screen_size[1] - 1
+
+        # struct uinput_user_dev (antarmuka legacy, didukung semua kernel)
+        user_dev = struct.pack(
+            '80sHHHHi%di%di%di%di' % ((self.ABS_CNT,) * 4),
+            name.encode()[:79], 0x03, 0x1234, 0x5678, 1, 0,
+            *absmax, *([0] * self.ABS_CNT * 3))
+        os.write(self.fd, user_dev)
+        self._ioctl(self.fd, self.UI_DEV_CREATE)
+
+    def _write_events(self, events):
+        """Tulis sekumpulan event (type, code, value) diakhiri SYN_REPORT dalam satu write"""
+        pack = self._event_struct.pack
+        payload = b''.join(pack(0, 0, event_type, code, value) for event_type, code, value in events)
+        os.write(self.fd, payload + pack(0, 0, self.EV_SYN, self.SYN_REPORT, 0))
+
+    def size(self):
+        return self.screen_size
+
+    def set_bounds(self, bounds):
+        """
+        Samakan sumbu perangkat dengan virtual desktop. Rentang ABS_X/ABS_Y
+        tetap sejak perangkat dibuat, jadi di mode absolut perangkat dibuat
+        ulang jika ukuran desktop berubah (monitor dicolok/dicabut).
+        """
+        left, top, width, height = bounds
+        self.origin = (left, top)
+        size = (width, height)
+        if size == self.screen_size:
+            return
+        self.screen_size = size
+        if self.mode == 'absolute' and self.fd is not None:
+            self.close()
+            self._open_device()
+
+    def move_to(self, x, y):
+        """Gerakkan kursor ke posisi virtual desktop, False jika di pojok failsafe"""
+        if self.failsafe and self.position == (0, 0):
+            return False
+        x, y = int(x), int(y)
+        if self.mode == 'absolute':
+            self._write_events([(self.EV_ABS, self.ABS_X, x - self.origin[0]),
+                                (self.EV_ABS, self.ABS_Y, y - self.origin[1])])
+        elif self.position is not None:
+            self._write_events([(self.EV_REL, self.REL_X, x - self.position[0]),
+                                (self.EV_REL, self.REL_Y, y - self.position[1])])
+        self.position = (x, y)
+        return True
+
+    def move_relative(self, dx, dy):
+        """Kirim gerakan relatif"""
+        if self.mode == 'absolute':
+            if self.position is None:
+                return True
+            left, top = self.origin
+            x = min(max(self.position[0] + int(dx), left), left + self.screen_size[0] - 1)
+            y = min(max(self.position[1] + int(dy), top), top + self.screen_size[1] - 1)
+            return self.move_to(x, y)
+        self._write_events([(self.EV_REL, self.REL_X, int(dx)), (self.EV_REL, self.REL_Y, int(dy))])
+        return True
+
+    def mouse_down(self, button='left'):
+        self._write_events([(self.EV_KEY, self.BUTTONS[button], 1)])
+
+    def mouse_up(self, button='left'):
+        self._write_events([(self.EV_KEY, self.BUTTONS[button], 0)])
+
+    def scroll(self, dx, dy):
+        """Wheel vertikal dan horizontal dalam satu syscall"""
+        events = []
+        if dy:
+            events.append((self.EV_REL, self.REL_WHEEL, int(dy)))
+        if dx:
+            events.append((self.EV_REL, self.REL_HWHEEL, int(dx)))
+        if events:
+            self._write_events(events)
+
+    def hotkey(self, *keys):
+        """Press semua key dalam satu laporan, lalu release dalam laporan berikutnya"""
+        codes = [self.KEYS[key] for key in keys]
+        self._write_events([(self.EV_KEY, code, 1) for code in codes])
+        self._write_events([(self.EV_KEY, code, 0) for code in reversed(codes)])
+
+    def click(self):
+        """Klik kiri (press dan release tanpa sleep)"""
+        self.mouse_down('left')
+        self.mouse_up('left')
+
+    def right_click(self):
+        """Klik kanan"""
+        self.mouse_down('right')
+        self.mouse_up('right')
+
+    def reset(self):
+        self.position = None
+
+    def close(self):
+        if self.fd is not None:
+            try:
+                self._ioctl(self.fd, self.UI_DEV_DESTROY)
+            finally:
+                os.close(self.fd)
+                self.fd = None
+
+class NullActuator(ActuatorBackend):
+    """Backend aktuasi no-op untuk benchmark dan pengujian tanpa desktop"""
+
+    def __init__(self, screen_size=(1920, 1080), record=False):
+        self.screen_size = screen_size
+        self.move_count = 0
+        self.click_count = 0
+        self.right_click_count = 0
+        self.press_counts = {'left': 0, 'right': 0, 'middle': 0}  # mouse_down per tombol
+        self.last_position = None
+        self.events = [] if record else None  # (aksi, argumen, timestamp) jika record=True
+
+    def _record(self, action, *args):
+        if self.events is not None:
+            self.events.append((action, args, time.perf_counter()))
+
+    def size(self):
+        """Ukuran layar virtual"""
+        return self.screen_size
+
+    def move_to(self, x, y):
+        """Catat posisi kursor tanpa menggerakkan kursor sistem"""
+        self.move_count += 1
+        self.last_position = (x, y)
+        self._record('move_to', x, y)
+        return True
+
+    def click(self):
+        """Catat klik kiri"""
+        self.click_count += 1
+        self._record('click')
+
+    def right_click(self):
+        """Catat klik kanan"""
+        self.right_click_count += 1
+        self._record('right_click')
+
+    def move_relative(self, dx, dy):
+        """Catat gerakan relatif"""
+        self.move_count += 1
+        if self.last_position is not None:
+            self.last_position = (self.last_position[0] + dx, self.last_position[1] + dy)
+        self._record('move_relative', dx, dy)
+        return True
+
+    def mouse_down(self, button='left'):
+        """Catat tombol ditekan (klik gesture dikirim sebagai mouse_down/mouse_up)"""
+        self.press_counts[button] += 1
+        self._record('mouse_down', button)
+
+    def mouse_up(self, button='left'):
+        self._record('mouse_up', button)
+
+    def scroll(self, dx, dy):
+        self._record('scroll', dx, dy)
+
+    def hotkey(self, *keys):
+        self._record('hotkey', *keys)
+
+# Backend aktuasi yang bisa dipilih berdasarkan nama
+ACTUATOR_BACKENDS = {
+    'pyautogui': PyAutoGUIActuator,
+    'xtest': XTestActuator,
+    'uinput': UInputActuator,
+    'null': NullActuator,
+}
+
+def create_actuator(name):
+    """Buat backend aktuasi berdasarkan nama"""
+    if name not in ACTUATOR_BACKENDS:
+        raise ValueError(f"Backend aktuasi tidak dikenal: {name}")
+    return ACTUATOR_BACKENDS[name]()
+
+class AsyncActuator(ActuatorBackend):
+    """
+    Menjalankan backend aktuasi di thread sendiri dengan antrean event yang dikoalesi.
+
+    Gerakan kursor berturut-turut digabung sehingga hanya posisi terbaru yang
+    dikirim; klik tidak pernah dibuang dan urutannya terhadap gerakan dijaga.
+    Setelah failsafe hanya release tombol (mouse_up) yang masih dikirim.
+    """
+
+    # Aksi yang boleh digabung dengan aksi sejenis tepat sebelumnya di antrean:
+    # posisi absolut diganti yang terbaru, delta relatif dijumlahkan
+    REPLACED_ACTIONS = ('move_to', 'set_bounds')
+    SUMMED_ACTIONS = ('move_relative', 'scroll')
+    # Aksi yang tetap dikirim setelah failsafe atau reset: tombol OS tidak boleh macet
+    # dan perubahan geometri desktop tidak boleh hilang
+    PRESERVED_ACTIONS = ('mouse_up', 'set_bounds')
+
+    def __init__(self, backend, latency=None, on_failsafe=None):
+        self.backend = backend
+        self.latency = latency
+        self.on_failsafe = on_failsafe
+        self._condition = threading.Condition()
+        self._events = collections.deque()
+        self.failsafe_triggered = False
+        self.sent_events = 0
+        self.coalesced_events = 0
+        self.is_running = True
+        self.thread = threading.Thread(target=self._worker_loop, name='cammouse-actuator', daemon=True)
+        self.thread.start()
+
+    def size(self):
+        return self.backend.size()
+
+    def _enqueue(self, action, *args):
+        with self._condition:
+            last = self._events[-1] if self._events else None
+            if last is not None and last[0] == action and action in self.REPLACED_ACTIONS:
+                # Gerakan lama yang belum terkirim digantikan posisi terbaru
+                self._events[-1] = (action, args, last[2])
+                self.coalesced_events += 1
+            elif last is not None and last[0] == action and action in self.SUMMED_ACTIONS:
+                self._events[-1] = (action, tuple(a + b for a, b in zip(last[1], args)), last[2])
+                self.coalesced_events += 1
+            else:
+                self._events.append((action, args, time.perf_counter()))
+            self._condition.notify()
+
+    def move_to(self, x, y):
+        """Antrekan gerakan kursor, False jika failsafe sudah terpicu"""
+        if self.failsafe_triggered:
+            return False
+        self._enqueue('move_to', x, y)
+        return True
+
+    def click(self):
+        self._enqueue('click')
+
+    def right_click(self):
+        self._enqueue('right_click')
+
+    def move_relative(self, dx, dy):
+        """Antrekan gerakan relatif (delta yang belum terkirim dijumlahkan)"""
+        if self.failsafe_triggered:
+            return False
+        self._enqueue('move_relative', dx, dy)
+        return True
+
+    def mouse_down(self, button='left'):
+        self._enqueue('mouse_down', button)
+
+    def mouse_up(self, button='left'):
+        self._enqueue('mouse_up', button)
+
+    def scroll(self, dx, dy):
+        """Antrekan scroll (notch yang belum terkirim dijumlahkan)"""
+        self._enqueue('scroll', dx, dy)
+
+    def hotkey(self, *keys):
+        self._enqueue('hotkey', *keys)
+
+    def set_bounds(self, bounds):
+        """Diteruskan lewat antrean agar berurutan dengan event yang sudah antre"""
+        self._enqueue('set_bounds', bounds)
+
+    def reset(self):
+        """Bersihkan status failsafe saat kontrol diaktifkan kembali"""
+        with self._condition:
+            # Event lama dibuang, kecuali release dari disable sebelumnya yang belum terkirim
+            pending = [event for event in self._events if event[0] in self.PRESERVED_ACTIONS]
+            self._events.clear()
+            self._events.extend(pending)
+            self.failsafe_triggered = False
+        self.backend.reset()
+
+    def close(self):
+        """Kirim sisa antrean (mis. mouse_up), hentikan thread aktuasi, lalu tutup backend"""
+        with self._condition:
+            self.is_running = False
+            self._condition.notify()
+        if self.thread is not threading.current_thread():
+            self.thread.join(timeout=1.0)
+        self.backend.close()
+
+    def _worker_loop(self):
+        while True:
+            with self._condition:
+                while not self._events and self.is_running:
+                    self._condition.wait()
+                if not self._events:
+                    # Berhenti hanya setelah antrean kosong: tombol yang ditahan tetap dilepas
+                    return
+                events = list(self._events)
+                self._events.clear()
+
+            for action, args, queued_time in events:
+                if self.failsafe_triggered and action not in self.PRESERVED_ACTIONS:
+                    # Setelah failsafe hanya release (dan geometri) yang dikirim sampai reset()
+                    continue
+                try:
+                    result = getattr(self.backend, action)(*args)
+                except Exception as e:
+                    print(f"Error dalam injeksi input: {e}")
+                    continue
+                self.sent_events += 1
+                if self.latency is not None:
+                    self.latency.record('injection', queued_time)
+
+                if action in ('move_to', 'move_relative') and result is False:
+                    # Failsafe: sisa event dibuang kecuali release, lalu beri tahu controller
+                    self.failsafe_triggered = True
+                    if self.on_failsafe is not None:
+                        self.on_failsafe()
+
+class EMAFilter:
+    """Exponential moving average dengan faktor smoothing tetap (perilaku lama)"""
+
+    PARAMETERS = [('smoothing', "Smoothing", 0.0, 0.95)]
+
+    def __init__(self, smoothing=0.7):
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self):
+        self.state = None
+
+    def filter(self, x, y, timestamp):
+        if self.state is None:
+            self.state = (x, y)
+        else:
+            s = self.smoothing
+            self.state = (self.state[0] * s + x * (1 - s), self.state[1] * s + y * (1 - s))
+        return self.state
+
+class OneEuroFilter:
+    """
+    One Euro filter (Casiez dkk., 2012): cutoff low-pass naik seiring kecepatan,
+    sehingga gerakan lambat dihaluskan kuat dan gerakan cepat hampir tanpa lag.
+    """
+
+    PARAMETERS = [
+        ('min_cutoff', "Min cutoff (Hz)", 0.05, 5.0),
+        ('beta', "Beta (respons kecepatan)", 0.0, 0.05),
+    ]
+
+    def __init__(self, min_cutoff=1.0, beta=0.007, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.state = None
+        self.derivative = (0.0, 0.0)
+        self.last_time = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def filter(self, x, y, timestamp):
+        if self.state is None:
+            self.state = (x, y)
+            self.last_time = timestamp
+            return self.state
+
+        dt = timestamp - self.last_time
+        if dt <= 0:
+            dt = 1.0 / 30
+        self.last_time = timestamp
+
+        a_d = self._alpha(self.d_cutoff, dt)
+        filtered = []
+        derivative = []
+        for value, prev, prev_d in zip((x, y), self.state, self.derivative):
+            d = prev_d + a_d * ((value - prev) / dt - prev_d)
+            a = self._alpha(self.min_cutoff + self.beta * abs(d), dt)
+            filtered.append(prev + a * (value - prev))
+            derivative.append(d)
+        self.state = tuple(filtered)
+        self.derivative = tuple(derivative)
+        return self.state
+
+class KalmanFilter:
+    """Kalman filter kecepatan konstan per sumbu (state: posisi, kecepatan)"""
+
+    PARAMETERS = [
+        ('process_noise', "Noise proses", 100.0, 50000.0),
+        ('measurement_noise', "Noise pengukuran", 1.0, 400.0),
+    ]
+
+    def __init__(self, process_noise=5000.0, measurement_noise=25.0):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.reset()
+
+    def reset(self):
+        self.axes = None  # Per sumbu: [posisi, kecepatan, P00, P01, P11]
+        self.last_time = None
+
+    def filter(self, x, y, timestamp):
+        if self.axes is None:
+            initial_variance = self.measurement_noise
+            self.axes = [[x, 0.0, initial_variance, 0.0, 1e6],
+                         [y, 0.0, initial_variance, 0.0, 1e6]]
+            self.last_time = timestamp
+            return x, y
+
+        dt = timestamp - self.last_time
+        if dt <= 0:
+            dt = 1.0 / 30
+        self.last_time = timestamp
+
+        q = self.process_noise
+        r = self.measurement_noise
+        result = []
+        for axis, measurement in zip(self.axes, (x, y)):
+            p, v, p00, p01, p11 = axis
+
+            # Prediksi dengan model kecepatan konstan (noise akselerasi putih)
+            p += v * dt
+            p00 += dt * (2 * p01 + dt * p11) + q * dt ** 3 / 3
+            p01 += dt * p11 + q * dt ** 2 / 2
+            p11 += q * dt
+
+            # Update dengan pengukuran posisi
+            s = p00 + r
+            k0 = p00 / s
+            k1 = p01 / s
+            innovation = measurement - p
+            p += k0 * innovation
+            v += k1 * innovation
+            p11 -= k1 * p01
+            p01 -= k0 * p01
+            p00 -= k0 * p00
+
+            axis[:] = [p, v, p00, p01, p11]
+            result.append(p)
+        return tuple(result)
+
+# Filter kursor yang bisa dipilih dari panel Pengaturan
+CURSOR_FILTERS = {
+    'one_euro': OneEuroFilter,
+    'kalman': KalmanFilter,
+    'ema': EMAFilter,
+}
+
+class MotionPredictor:
+    """
+    Prediksi posisi kursor untuk mengkompensasi latensi pipeline.
+
+    Kecepatan dan akselerasi diestimasi dengan least squares dari riwayat
+    posisi terfilter, lalu posisi diekstrapolasi dari timestamp capture ke
+    waktu target. Horizon dan besar lompatan dibatasi agar tidak overshoot.
+    """
+
+    def __init__(self, history=6, max_horizon=0.1, max_overshoot=40.0, min_speed=50.0):
+        self.history = history
+        self.max_horizon = max_horizon      # Detik
+        self.max_overshoot = max_overshoot  # Piksel
+        self.min_speed = min_speed          # Piksel/detik, di bawahnya tidak diprediksi
+        self.reset()
+
+    def reset(self):
+        self.samples = collections.deque(maxlen=self.history)
+
+    @staticmethod
+    def _slope(samples):
+        """Kemiringan least squares (vx, vy) dan waktu rata-rata sampel"""
+        n = len(samples)
+        mean_t = sum(s[0] for s in samples) / n
+        mean_x = sum(s[1] for s in samples) / n
+        mean_y = sum(s[2] for s in samples) / n
+        var_t = sum((s[0] - mean_t) ** 2 for s in samples)
+        if var_t <= 0:
+            return 0.0, 0.0, mean_t
+        vx = sum((s[0] - mean_t) * (s[1] - mean_x) for s in samples) / var_t
+        vy = sum((s[0] - mean_t) * (s[2] - mean_y) for s in samples) / var_t
+        return vx, vy, mean_t
+
+    def predict(self, x, y, timestamp, target_time):
+        """Tambahkan sampel dan kembalikan posisi yang diekstrapolasi ke target_time"""
+        samples = self.samples
+        if samples and timestamp <= samples[-1][0]:
+            samples.clear()
+        samples.append((timestamp, x, y))
+        if len(samples) < 3:
+            return x, y
+
+        vx, vy, mean_t = self._slope(samples)
+        ax = ay = 0.0
+        if len(samples) >= 4:
+            # Akselerasi dari selisih kecepatan paruh awal dan paruh akhir riwayat
+            half = len(samples) // 2
+            history = list(samples)
+            vx0, vy0, t0 = self._slope(history[:half + 1])
+            vx1, vy1, t1 = self._slope(history[half:])
+            if t1 > t0:
+                ax = (vx1 - vx0) / (t1 - t0)
+                ay = (vy1 - vy0) / (t1 - t0)
+
+        # Kecepatan pada sampel terakhir
+        age = timestamp - mean_t
+        vx += ax * age
+        vy += ay * age
+        if math.hypot(vx, vy) < self.min_speed:
+            return x, y
+
+        horizon = max(0.0, min(target_time - timestamp, self.max_horizon))
+        dx = vx * horizon + 0.5 * ax * horizon * horizon
+        dy = vy * horizon + 0.5 * ay * horizon * horizon
+
+        # Akselerasi tidak boleh membalik arah gerak (overshoot saat berhenti)
+        if dx * vx + dy * vy < 0:
+            return x, y
+        distance = math.hypot(dx, dy)
+        if distance > self.max_overshoot:
+            scale = self.max_overshoot / distance
+            dx *= scale
+            dy *= scale
+        return x + dx, y + dy
+
+# Kurva akselerasi pointer untuk mode relatif
+ACCELERATION_CURVES = ('linear', 'power', 'sigmoid')
+
+class PointerAcceleration:
+    """
+    Gain mode relatif sebagai fungsi kecepatan ujung jari.
+
+    Kecepatan diukur dalam lebar frame per detik. Gerakan lambat memakai
+    base_gain (presisi), gerakan cepat naik menuju max_gain (jangkauan).
+    """
+
+    PARAMETERS = [
+        ('base_gain', "Gain dasar", 0.1, 2.0),
+        ('max_gain', "Gain maksimum", 1.0, 6.0),
+        ('threshold', "Threshold kecepatan (frame/s)", 0.1, 2.0),
+        ('exponent', "Eksponen", 1.0, 4.0),
+    ]
+
+    def __init__(self, curve='sigmoid', base_gain=0.6, max_gain=3.0, threshold=0.5, exponent=2.0):
+        if curve not in ACCELERATION_CURVES:
+            raise ValueError(f"Kurva akselerasi tidak dikenal: {curve}")
+        self.curve = curve
+        self.base_gain = base_gain
+        self.max_gain = max_gain
+        self.threshold = threshold
+        self.exponent = exponent
+
+    def gain(self, speed):
+        if self.curve == 'linear':
+            return self.base_gain
+        ratio = (speed / self.threshold) ** self.exponent
+        if self.curve == 'power':
+            return min(self.max_gain, self.base_gain * (1 + ratio))
+        # sigmoid: transisi halus, tepat di tengah base..max pada kecepatan threshold
+        return self.base_gain + (self.max_gain - self.base_gain) * ratio / (1 + ratio)
+
+class RelativeMotion:
+    """Ubah delta posisi ujung jari menjadi delta kursor (mode trackpad)"""
+
+    def __init__(self, acceleration=None):
+        self.acceleration = acceleration or PointerAcceleration()
+        self.remainder = (0.0, 0.0)
+        self.reset()
+
+    def reset(self):
+        """Lepas anchor: sampel berikutnya tidak menggerakkan kursor"""
+        self.last_sample = None
+
+    def update(self, x, y, timestamp, unit, scale=1.0):
+        """
+        Kembalikan delta kursor integer (dx, dy) untuk posisi terfilter x, y.
+
+        unit adalah jumlah piksel per lebar frame pada posisi (x, y), dipakai
+        untuk menormalkan kecepatan; scale adalah faktor DPI monitor aktif.
+        Sisa sub-piksel dibawa ke frame berikutnya.
+        """
+        last = self.last_sample
+        self.last_sample = (timestamp, x, y)
+        if last is None:
+            return 0, 0
+
+        dt = timestamp - last[0]
+        if dt <= 0:
+            dt = 1.0 / 30
+        dx = x - last[1]
+        dy = y - last[2]
+        gain = self.acceleration.gain(math.hypot(dx, dy) / unit / dt) * scale
+
+        move_x = dx * gain + self.remainder[0]
+        move_y = dy * gain + self.remainder[1]
+        step_x = int(round(move_x))
+        step_y = int(round(move_y))
+        self.remainder = (move_x - step_x, move_y - step_y)
+        return step_x, step_y
+
+# Satu monitor dalam koordinat virtual desktop (piksel fisik)
+Monitor = collections.namedtuple('Monitor', 'name x y width height scale is_primary')
+
+def enable_dpi_awareness():
+    """Di Windows, minta koordinat piksel fisik agar monitor ber-scaling tidak tergeser"""
+    if sys.platform != 'win32':
+        return
+    import ctypes
+    try:
+        ctypes.windll.shcore.SetProcessDpiAwareness(2)  # Per-monitor DPI aware
+    except Exception:
+        try:
+            ctypes.windll.user32.SetProcessDPIAware()
+        except Exception:
+            pass
+
+def _windows_monitor_scale(x, y):
+    """Faktor scaling DPI monitor di titik (x, y) pada Windows"""
+    import ctypes
+    from ctypes import wintypes
+    try:
+        monitor = ctypes.windll.user32.MonitorFromPoint(wintypes.POINT(x, y), 2)
+        dpi_x, dpi_y = ctypes.c_uint(), ctypes.c_uint()
+        ctypes.windll.shcore.GetDpiForMonitor(monitor, 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y))
+        return dpi_x.value / 96.0
+    except Exception:
+        return 1.0
+
+def _screeninfo_monitors():
+    import screeninfo
+    monitors = []
+    for i, m in enumerate(screeninfo.get_monitors()):
+        scale = _windows_monitor_scale(m.x, m.y) if sys.platform == 'win32' else 1.0
+        monitors.append(Monitor(m.name or f"monitor{i}", m.x, m.y, m.width, m.height,
+                                scale, bool(getattr(m, 'is_primary', i == 0))))
+    return monitors
+
+def _xrandr_monitors():
+    from Xlib import display
+    disp = display.Display()
+    try:
+        reply = disp.screen().root.xrandr_get_monitors(is_active=True)
+        return [Monitor(disp.get_atom_name(m.name), m.x, m.y, m.width_in_pixels,
+                        m.height_in_pixels, 1.0, bool(m.primary))
+                for m in reply.monitors]
+    finally:
+        disp.close()
+
+# Sumber enumerasi monitor, dicoba berurutan (semuanya opsional)
+MONITOR_SOURCES = [_screeninfo_monitors, _xrandr_monitors]
+
+def enumerate_monitors():
+    """Daftar monitor dari sumber pertama yang tersedia (kosong jika tidak ada)"""
+    for source in MONITOR_SOURCES:
+        try:
+            monitors = source()
+        except Exception:
+            continue
+        if monitors:
+            return monitors
+    return []
+
+class DisplayTopology:
+    """
+    Topologi monitor dan pemetaan ke virtual desktop.
+
+    Daftar monitor diperbarui di thread latar setiap refresh_interval detik;
+    lookup monitor per frame memeriksa monitor hit terakhir lebih dulu.
+    """
+
+    def __init__(self, fallback_size, detect=True, refresh_interval=2.0, on_change=None):
+        self.fallback_size = fallback_size
+        self.detect = detect
+        self.refresh_interval = refresh_interval
+        self.on_change = on_change
+        self._last_hit = None
+        self._layout = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        if detect:
+            enable_dpi_awareness()
+        self.refresh()
+
+    def refresh(self):
+        """Enumerasi ulang monitor; return True jika topologi berubah"""
+        monitors = enumerate_monitors() if self.detect else []
+        if not monitors:
+            width, height = self.fallback_size
+            monitors = [Monitor('default', 0, 0, width, height, 1.0, True)]
+        monitors.sort(key=lambda m: not m.is_primary)
+
+        if self._layout is not None and monitors == self._layout[0]:
+            return False
+        left = min(m.x for m in monitors)
+        top = min(m.y for m in monitors)
+        right = max(m.x + m.width for m in monitors)
+        bottom = max(m.y + m.height for m in monitors)
+        # Diganti sebagai satu tuple agar pembaca di thread lain selalu konsisten
+        self._layout = (monitors, (left, top, right - left, bottom - top))
+        self._last_hit = None
+        return True
+
+    @property
+    def monitors(self):
+        return self._layout[0]
+
+    @property
+    def bounds(self):
+        """(x, y, lebar, tinggi) virtual desktop"""
+        return self._layout[1]
+
+    def start(self):
+        """Mulai polling perubahan topologi (monitor dicolok/dicabut, scaling diubah)"""
+        if self.detect and self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _poll_loop(self):
+        while not self._stop_event.wait(self.refresh_interval):
+            if self.refresh() and self.on_change:
+                self.on_change()
+
+    def monitor_at(self, x, y):
+        """Monitor yang memuat titik (x, y), atau None jika di celah antar monitor"""
+        last = self._last_hit
+        if last is not None and last.x <= x < last.x + last.width and last.y <= y < last.y + last.height:
+            return last
+        for monitor in self._layout[0]:
+            if monitor.x <= x < monitor.x + monitor.width and monitor.y <= y < monitor.y + monitor.height:
+                self._last_hit = monitor
+                return monitor
+        return None
+
+    def clamp(self, x, y):
+        """Batasi titik ke monitor terdekat; return (x, y, monitor) dalam piksel integer"""
+        x = int(round(x))
+        y = int(round(y))
+        monitor = self.monitor_at(x, y)
+        if monitor is not None:
+            return x, y, monitor
+
+        best = None
+        for m in self._layout[0]:
+            cx = min(max(x, m.x), m.x + m.width - 1)
+            cy = min(max(y, m.y), m.y + m.height - 1)
+            distance = (cx - x) ** 2 + (cy - y) ** 2
+            if best is None or distance < best[0]:
+                best = (distance, cx, cy, m)
+        self._last_hit = best[3]
+        return best[1], best[2], best[3]
+
+# File cache kalibrasi, dikunci per kamera dan per layar
+CALIBRATION_FILE = os.path.join(os.path.expanduser('~'), '.cammouse_calibration.json')
+
+class CalibrationSession:
+    """
+    Rekam titik jangkauan nyaman pengguna di keempat sudut.
+
+    Setiap sudut tercatat setelah ujung telunjuk ditahan diam (simpangan di
+    bawah tolerance) selama hold_time detik; posisinya adalah rata-rata sampel.
+    """
+
+    CORNERS = ['kiri atas', 'kanan atas', 'kanan bawah', 'kiri bawah']
+
+    def __init__(self, hold_time=1.0, tolerance=0.01, min_distance=0.1):
+        self.hold_time = hold_time
+        self.tolerance = tolerance
+        self.min_distance = min_distance
+        self.corners = []
+        self.samples = collections.deque()
+
+    @property
+    def is_complete(self):
+        return len(self.corners) == len(self.CORNERS)
+
+    @property
+    def prompt(self):
+        if self.is_complete:
+            return "Kalibrasi selesai"
+        return (f"Kalibrasi {len(self.corners) + 1}/{len(self.CORNERS)}: tahan telunjuk "
+                f"di sudut {self.CORNERS[len(self.corners)]} jangkauan nyaman Anda")
+
+    def add_sample(self, x, y, timestamp):
+        """Tambahkan posisi ujung telunjuk; return True jika semua sudut sudah terekam"""
+        samples = self.samples
+        samples.append((timestamp, x, y))
+        while samples and timestamp - samples[0][0] > self.hold_time:
+            samples.popleft()
+
+        # Mulai ulang hitungan jika jari bergerak keluar toleransi
+        if max(abs(x - s[1]) + abs(y - s[2]) for s in samples) > self.tolerance * 2:
+            samples.clear()
+            samples.append((timestamp, x, y))
+            return False
+
+        if timestamp - samples[0][0] >= self.hold_time * 0.95:
+            corner = (sum(s[1] for s in samples) / len(samples),
+                      sum(s[2] for s in samples) / len(samples))
+            # Jari yang masih diam di sudut sebelumnya tidak dihitung sebagai sudut baru
+            if all(abs(corner[0] - c[0]) + abs(corner[1] - c[1]) > self.min_distance
+                   for c in self.corners):
+                self.corners.append(corner)
+            samples.clear()
+        return self.is_complete
+
+class CursorMapping:
+    """Transformasi perspektif (homography) dari koordinat kamera ternormalisasi ke layar"""
+
+    def __init__(self, matrix):
+        # Disimpan sebagai float Python: apply per frame cukup 9 perkalian skalar
+        self.matrix = [[float(v) for v in row] for row in matrix]
+        (self.h00, self.h01, self.h02), (self.h10, self.h11, self.h12), \
+            (self.h20, self.h21, self.h22) = self.matrix
+
+    @classmethod
+    def from_corners(cls, corners, screen_width, screen_height, origin=(0, 0)):
+        """Hitung homography sekali dari 4 sudut (urutan CalibrationSession.CORNERS)"""
+        left, top = origin
+        right = left + screen_width - 1
+        bottom = top + screen_height - 1
+        target = np.float32([[left, top], [right, top], [right, bottom], [left, bottom]])
+        return cls(cv2.getPerspectiveTransform(np.float32(corners), target))
+
+    def apply(self, x, y):
+        w = self.h20 * x + self.h21 * y + self.h22
+        return ((self.h00 * x + self.h01 * y + self.h02) / w,
+                (self.h10 * x + self.h11 * y + self.h12) / w)
+
+class GestureStateMachine:
+    """
+    State machine satu gesture (mis. pinch) dengan hysteresis dan debouncing.
+
+    Gesture masuk saat jarak < threshold dan baru keluar saat jarak >=
+    threshold * release_ratio. Setiap transisi harus bertahan beberapa frame
+    berturut-turut, sehingga noise satu frame tidak menghasilkan klik.
+    """
+
+    def __init__(self, release_ratio=1.4, min_hold_frames=2, min_release_frames=2):
+        self.release_ratio = release_ratio
+        self.min_hold_frames = min_hold_frames
+        self.min_release_frames = min_release_frames
+        self.press_count = 0  # Naik setiap press, dipakai aktuasi untuk mendeteksi klik yang terlewat
+        self.reset()
+
+    def reset(self):
+        """Kembali ke idle (tangan hilang); press yang sedang aktif dianggap dilepas"""
+        self.is_pressed = False
+        self.pending_frames = 0
+
+    def update(self, distance, threshold):
+        """Update dengan jarak frame ini; return 'press', 'hold', 'release', atau None"""
+        if self.is_pressed:
+            active = distance < threshold * self.release_ratio
+        else:
+            active = distance < threshold
+
+        if active == self.is_pressed:
+            self.pending_frames = 0
+            return 'hold' if active else None
+
+        self.pending_frames += 1
+        if self.pending_frames < (self.min_release_frames if self.is_pressed else self.min_hold_frames):
+            return 'hold' if self.is_pressed else None
+
+        self.pending_frames = 0
+        self.is_pressed = active
+        if active:
+            self.press_count += 1
+            return 'press'
+        return 'release'
+
+class ScrollEngine:
+    """
+    Scroll kontinu dari kecepatan tangan dengan akumulasi sub-notch dan inersia.
+
+    Kecepatan diukur dalam tinggi/lebar frame per detik dan dikalikan gain
+    menjadi notch per detik. Pecahan notch dibawa ke frame berikutnya; saat
+    pose scroll dilepas, kecepatan meluruh eksponensial (inersia).
+    """
+
+    def __init__(self, gain=40.0, deadzone=0.05, friction=4.0, min_velocity=1.0, natural=False):
+        self.gain = gain                # Notch/detik per (frame/detik)
+        self.deadzone = deadzone        # Frame/detik, gerak lebih lambat dianggap diam
+        self.friction = friction        # Laju peluruhan inersia per detik
+        self.min_velocity = min_velocity  # Notch/detik, di bawahnya inersia berhenti
+        self.natural = natural          # True: arah seperti touchpad "natural scrolling"
+        self.total = (0, 0)  # Total notch kumulatif (dx, dy) yang sudah dihasilkan
+        self.reset()
+
+    def reset(self):
+        """Hentikan scroll dan inersia (tangan hilang)"""
+        self.last_point = None
+        self.last_time = None
+        self.velocity = (0.0, 0.0)
+        self.remainder = (0.0, 0.0)
+
+    def update(self, x, y, timestamp, active):
+        """Return notch (dx, dy) untuk frame ini; dy positif berarti scroll ke atas"""
+        dt = timestamp - self.last_time if self.last_time is not None else 0.0
+        self.last_time = timestamp
+        if dt <= 0:
+            dt = 1.0 / 30
+
+        if active:
+            if self.last_point is not None:
+                vx = (x - self.last_point[0]) / dt
+                vy = (y - self.last_point[1]) / dt
+                if math.hypot(vx, vy) < self.deadzone:
+                    vx = vy = 0.0
+                # Tangan naik (y gambar turun) = scroll ke atas
+                sign = -1.0 if self.natural else 1.0
+                target = (sign * vx * self.gain, -sign * vy * self.gain)
+                # Sedikit smoothing agar jitter landmark tidak menjadi notch acak
+                self.velocity = tuple(0.5 * v + 0.5 * t for v, t in zip(self.velocity, target))
+            self.last_point = (x, y)
+        else:
+            self.last_point = None
+            decay = math.exp(-self.friction * dt)
+            self.velocity = (self.velocity[0] * decay, self.velocity[1] * decay)
+            if math.hypot(*self.velocity) < self.min_velocity:
+                self.velocity = (0.0, 0.0)
+
+        amount_x = self.velocity[0] * dt + self.remainder[0]
+        amount_y = self.velocity[1] * dt + self.remainder[1]
+        notch_x = int(amount_x)  # Dibulatkan ke nol, sisanya dibawa
+        notch_y = int(amount_y)
+        self.remainder = (amount_x - notch_x, amount_y - notch_y)
+        if notch_x or notch_y:
+            self.total = (self.total[0] + notch_x, self.total[1] + notch_y)
+        return notch_x, notch_y
+
+class GestureDetector:
+    """
+    Interface plugin detektor gesture.
+
+    detect() membaca fitur dari cache HandFeatures bersama (jangan menghitung
+    ulang dari landmark) dan mengembalikan hasil yang disimpan di
+    gestures['detected'][name].
+    """
+
+    name = None
+
+    def detect(self, features):
+        raise NotImplementedError
+
+    def reset(self):
+        """Dipanggil saat tangan hilang dari frame"""
+
+class PinchDetector(GestureDetector):
+    """Jari yang paling dekat ke ujung jempol: (nama jari, jarak dalam ukuran telapak)"""
+
+    name = 'pinch'
+
+    def detect(self, features):
+        distances = features['pinch_distances']
+        nearest = min(range(4), key=distances.__getitem__)
+        return FINGER_NAMES[nearest + 1], distances[nearest]
+
+class FistDetector(GestureDetector):
+    """Kepalan: telunjuk sampai kelingking terlipat"""
+
+    name = 'fist'
+
+    def detect(self, features):
+        return not any(features['finger_flags'][1:])
+
+class OpenPalmDetector(GestureDetector):
+    """Telapak terbuka: kelima jari lurus"""
+
+    name = 'open_palm'
+
+    def detect(self, features):
+        return features['extended_count'] == 5
+
+class PointDetector(GestureDetector):
+    """Menunjuk: hanya telunjuk yang lurus (jempol diabaikan)"""
+
+    name = 'point'
+
+    def detect(self, features):
+        _, index, middle, ring, pinky = features['finger_flags']
+        return index and not (middle or ring or pinky)
+
+class TwoFingerDetector(GestureDetector):
+    """Pose scroll: telunjuk dan jari tengah lurus, manis dan kelingking terlipat"""
+
+    name = 'two_finger'
+
+    def detect(self, features):
+        _, index, middle, ring, pinky = features['finger_flags']
+        return index and middle and not (ring or pinky)
+
+class LandmarkRingBuffer:
+    """
+    Ring buffer array berukuran tetap berisi frame landmark terakhir beserta timestamp.
+
+    Slot dialokasikan sekali dan setiap frame ditulis dua kali (slot dan
+    slot + capacity), sehingga jendela frame terakhir selalu berupa slice
+    kontigu: window() mengembalikan view tanpa salinan dan tanpa alokasi.
+    """
+
+    def __init__(self, capacity=128):
+        self.capacity = capacity
+        self.points = np.zeros((2 * capacity, 21, 3), dtype=np.float32)
+        self.timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self.clear()
+
+    def clear(self):
+        self.head = 0  # Slot yang akan ditulis berikutnya
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def last_slots(self):
+        """Index (slot, slot cermin) frame terbaru, untuk data turunan yang disimpan paralel"""
+        slot = (self.head - 1) % self.capacity
+        return slice(slot, 2 * self.capacity, self.capacity)
+
+    def append(self, points, timestamp):
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        slots = self.last_slots
+        self.points[slots] = points
+        self.timestamps[slots] = timestamp
+
+    def window_slice(self, duration, since=None):
+        """
+        Slice frame dalam `duration` detik terakhir (dan sejak `since` jika
+        diberikan), urut dari yang terlama.
+        """
+        stop = self.head + self.capacity
+        start = stop - self.count
+        if self.count:
+            begin = self.timestamps[stop - 1] - duration
+            if since is not None:
+                begin = max(begin, since)
+            start += int(np.searchsorted(self.timestamps[start:stop], begin))
+        return slice(start, stop)
+
+    def window(self, duration, since=None):
+        """Return view (timestamps, points) untuk frame dalam window_slice"""
+        window = self.window_slice(duration, since)
+        return self.timestamps[window], self.points[window]
+
+# Template gesture dinamis: path (N, 2) dinormalisasi dengan normalize_path dari
+# track 'palm' (pusat telapak, lebar frame) atau 'index' (ujung telunjuk relatif
+# terhadap telapak, dalam ukuran telapak), dicocokkan dalam jendela `duration`
+# detik terakhir hanya jika rentang gerak track minimal `min_extent`
+MotionTemplate = collections.namedtuple('MotionTemplate', 'name track duration path min_extent')
+
+MOTION_PATH_POINTS = 16
+MOTION_DIRECTIONS = {'left': (-1.0, 0.0), 'right': (1.0, 0.0), 'up': (0.0, -1.0), 'down': (0.0, 1.0)}
+
+def resample_path(track, n_points=MOTION_PATH_POINTS):
+    """Resample track (M, 2) menjadi n_points titik berjarak sama sepanjang lintasan"""
+    steps = track[1:] - track[:-1]
+    arc = np.zeros(len(track))
+    np.cumsum(np.hypot(steps[:, 0], steps[:, 1]), out=arc[1:])
+    if arc[-1] <= 0:
+        return np.repeat(track[:1], n_points, axis=0)
+    target = np.arange(n_points) * (arc[-1] / (n_points - 1))
+    return np.stack([np.interp(target, arc, track[:, 0]), np.interp(target, arc, track[:, 1])], axis=1)
+
+def normalize_path(track, n_points=MOTION_PATH_POINTS):
+    """Path berjarak sama, dipusatkan di centroid dan diskalakan ke sisi terpanjang = 1"""
+    path = resample_path(np.asarray(track, dtype=np.float64), n_points)
+    low, high = path.min(axis=0), path.max(axis=0)
+    path -= path.mean(axis=0)
+    extent = (high - low).max()
+    return path / extent if extent > 0 else path
+
+def path_bend(track):
+    """
+    Simpangan terjauh track dari segmen awal-akhir, dibagi rentang gerak:
+    ~0 untuk garis lurus, ~0.3 untuk busur 120 derajat, ~1 untuk lingkaran.
+    """
+    start = track[0]
+    chord = track[-1] - start
+    offset = track - start
+    length = float(chord @ chord)
+    if length > 0:
+        offset = offset - np.clip(offset @ chord / length, 0.0, 1.0)[:, None] * chord
+    extent = (track.max(axis=0) - track.min(axis=0)).max()
+    return float(np.hypot(offset[:, 0], offset[:, 1]).max() / extent) if extent > 0 else 0.0
+
+def default_motion_templates(circle_phases=8):
+    """Template bawaan: swipe dan flick empat arah, lingkaran searah/berlawanan jarum jam"""
+    templates = []
+    line = np.linspace(0.0, 1.0, MOTION_PATH_POINTS)[:, None]
+    for direction, vector in MOTION_DIRECTIONS.items():
+        path = normalize_path(line * np.array(vector))
+        templates.append(MotionTemplate(f'swipe_{direction}', 'palm', 0.35, path, 0.2))
+        templates.append(MotionTemplate(f'flick_{direction}', 'index', 0.15, path, 0.6))
+    # Lingkaran bisa dimulai dari titik mana pun: satu template per fase awal.
+    # Koordinat gambar (y ke bawah): sudut naik = searah jarum jam di layar
+    angles = np.linspace(0.0, 2 * np.pi, MOTION_PATH_POINTS)
+    for phase in np.arange(circle_phases) * 2 * np.pi / circle_phases:
+        for name, sign in (('circle_cw', 1.0), ('circle_ccw', -1.0)):
+            theta = phase + sign * angles
+            path = normalize_path(np.stack([np.cos(theta), np.sin(theta)], axis=1))
+            templates.append(MotionTemplate(name, 'palm', 1.3, path, 0.12))
+    return templates
+
+def dtw_distance(query, template, band, limit=math.inf):
+    """
+    DTW dengan pita Sakoe-Chiba antara dua path (list titik (x, y)), dinormalisasi
+    per titik. Berhenti lebih awal (inf) begitu semua sel satu baris melewati limit.
+    """
+    n = len(query)
+    limit *= n
+    previous = [0.0] + [math.inf] * n
+    for i in range(1, n + 1):
+        current = [math.inf] * (n + 1)
+        qx, qy = query[i - 1]
+        row_min = math.inf
+        for j in range(max(1, i - band), min(n, i + band) + 1):
+            tx, ty = template[j - 1]
+            cost = math.hypot(qx - tx, qy - ty) + min(previous[j], previous[j - 1], current[j - 1])
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return math.inf
+        previous = current
+    return previous[n] / n
+
+class MotionGestureDetector(GestureDetector):
+    """
+    Gesture dinamis (swipe, flick, lingkaran) dari riwayat landmark di ring buffer.
+
+    Template dengan track dan durasi sama berbagi satu path kandidat. Untuk
+    semua template sekaligus dihitung (vektor) jarak lock-step sebagai batas
+    atas DTW dan LB_Keogh sebagai batas bawah; biaya langkah vektor ini
+    tumbuh linear dengan jumlah template. DTW penuh hanya dijalankan untuk
+    template yang batas bawahnya masih di bawah jarak terbaik, paling banyak
+    max_candidates per frame untuk semua kelompok bersama. Semua kelompok
+    dinilai dan jarak terkecil yang menang, dan path tidak boleh lebih
+    melengkung dari template (busur awal lingkaran bukan swipe). Return
+    nama template satu kali per gesture, selain itu None.
+    """
+
+    name = 'motion'
+
+    def __init__(self, templates=None, threshold=0.12, band=1, max_candidates=3,
+                 min_frames=4, cooldown=0.5, closure_tolerance=0.4, bend_tolerance=0.12):
+        self.threshold = threshold  # Jarak DTW rata-rata per titik maksimum
+        self.closure_tolerance = closure_tolerance  # Selisih jarak awal-akhir path maksimum
+        self.bend_tolerance = bend_tolerance  # Kelengkungan path di atas template maksimum
+        self.band = band
+        self.max_candidates = max_candidates  # Budget DTW penuh per frame (semua kelompok)
+        self.min_frames = min_frames
+        self.cooldown = cooldown
+        self.set_templates(default_motion_templates() if templates is None else templates)
+        self.tracks = None
+        self.reset()
+
+    def set_templates(self, templates):
+        """Kelompokkan template per (track, durasi) dan hitung envelope LB_Keogh"""
+        groups = collections.defaultdict(list)
+        for template in templates:
+            groups[(template.track, template.duration)].append(template)
+        self.groups = []
+        # Jendela terpendek lebih dulu agar budget DTW tidak habis di gesture lambat
+        for (track, duration), members in sorted(groups.items(), key=lambda item: item[0][1]):
+            paths = np.array([template.path for template in members])
+            shifted = [np.roll(paths, shift, axis=1) for shift in range(-self.band, self.band + 1)]
+            # Ujung path tidak boleh dibungkus oleh roll: pakai tepi yang diulang
+            for k, shift in enumerate(range(-self.band, self.band + 1)):
+                if shift > 0:
+                    shifted[k][:, :shift] = paths[:, :1]
+                elif shift < 0:
+                    shifted[k][:, shift:] = paths[:, -1:]
+            self.groups.append({
+                'track': track,
+                'duration': duration,
+                'templates': members,
+                'path_array': paths,
+                'paths': [template.path.tolist() for template in members],
+                'upper': np.max(shifted, axis=0),
+                'lower': np.min(shifted, axis=0),
+                'min_extent': np.array([template.min_extent for template in members]),
+                # Jarak titik awal-akhir path ternormalisasi: ~1 untuk garis, ~0 untuk lingkaran
+                'closure': np.hypot(*(paths[:, -1] - paths[:, 0]).T),
+                'bend': np.array([path_bend(path) for path in paths]),
+            })
+            group = self.groups[-1]
+            group['min_extent_floor'] = group['min_extent'].min()
+            group['closure_range'] = (group['closure'].min(), group['closure'].max())
+            group['bend_ceiling'] = group['bend'].max() + self.bend_tolerance
+        self.durations = np.array([group['duration'] for group in self.groups])
+        self.max_duration = self.durations.max(initial=0.0)
+
+    def reset(self):
+        self.last_match_time = None
+        self.valid_since = None  # Slot track sebelum waktu ini belum diisi detektor ini
+
+    # Kolom track per frame di self.tracks
+    TRACK_COLUMNS = {'palm': slice(0, 2), 'index': slice(2, 4)}
+
+    def _update_tracks(self, features, history):
+        """Simpan track frame ini sekali, paralel (dan dicerminkan) dengan slot ring buffer"""
+        if self.tracks is None or len(self.tracks) != len(history.timestamps):
+            self.tracks = np.zeros((len(history.timestamps), 4))
+            self.valid_since = None
+        if self.valid_since is None:
+            self.valid_since = features['timestamp']
+        palm_x, palm_y = features['palm_center']
+        index_x, index_y = features['points'][INDEX_TIP, :2].tolist()
+        palm_size = max(features['palm_size'], 1e-6)
+        self.tracks[history.last_slots] = (palm_x, palm_y, (index_x - palm_x) / palm_size,
+                                           (index_y - palm_y) / palm_size)
+
+    def _match(self, group, track, budget, limit):
+        """
+        Template terbaik (nama, jarak) untuk satu kelompok dengan jarak di bawah
+        limit, None jika tidak ada.
+
+        Menjalankan paling banyak budget DTW penuh; return (match, sisa budget).
+        """
+        # Saringan murah sebelum resample: rentang gerak cukup, bentuk
+        # terbuka/tertutup mirip, dan tidak lebih melengkung dari template
+        width, height = (track.max(axis=0) - track.min(axis=0)).tolist()
+        extent = max(width, height)
+        if extent < group['min_extent_floor']:
+            return None, budget
+        closure = math.hypot(*(track[-1] - track[0]).tolist()) / extent
+        closure_low, closure_high = group['closure_range']
+        if not closure_low - self.closure_tolerance <= closure <= closure_high + self.closure_tolerance:
+            return None, budget
+        bend = path_bend(track)
+        if bend > group['bend_ceiling']:
+            return None, budget
+        eligible = ((group['min_extent'] <= extent)
+                    & (np.abs(group['closure'] - closure) <= self.closure_tolerance)
+                    & (bend <= group['bend'] + self.bend_tolerance))
+        query = normalize_path(track)
+        excess = np.maximum(query - group['upper'], 0.0) + np.maximum(group['lower'] - query, 0.0)
+        bounds = np.hypot(excess[..., 0], excess[..., 1]).mean(axis=1)
+        bounds[~eligible] = math.inf
+        # Jarak lock-step adalah satu jalur warping yang valid, jadi batas atas DTW
+        offset = group['path_array'] - query
+        upper = np.hypot(offset[..., 0], offset[..., 1]).mean(axis=1)
+        upper[~eligible] = math.inf
+
+        best_name, best_distance = None, limit
+        best = int(upper.argmin())
+        if upper[best] < best_distance:
+            best_name, best_distance = group['templates'][best].name, upper[best]
+        query_list = query.tolist()
+        for i in np.argsort(bounds):
+            if budget <= 0 or bounds[i] >= best_distance:
+                break
+            if group['templates'][i].name == best_name:
+                # DTW hanya bisa memperkecil jarak, nama hasilnya tidak berubah
+                continue
+            budget -= 1
+            distance = dtw_distance(query_list, group['paths'][i], self.band, best_distance)
+            if distance < best_distance:
+                best_name, best_distance = group['templates'][i].name, distance
+        return best_name and (best_name, best_distance), budget
+
+    def detect(self, features):
+        timestamp = features['timestamp']
+        history = features.get('history')
+        if timestamp is None or history is None:
+            return None
+        self._update_tracks(features, history)
+        if self.last_match_time is not None and timestamp - self.last_match_time < self.cooldown:
+            return None
+        since = self.valid_since
+        if self.last_match_time is not None:
+            since = max(since, self.last_match_time)
+        window = history.window_slice(self.max_duration, since)
+        timestamps = history.timestamps[window]
+        if len(timestamps) < self.min_frames:
+            return None
+        tracks = self.tracks[window]
+        starts = np.searchsorted(timestamps, timestamp - self.durations).tolist()
+        budget = self.max_candidates
+        best = None
+        for group, start in zip(self.groups, starts):
+            if len(timestamps) - start < self.min_frames:
+                continue
+            # Jarak sudah dinormalisasi per titik, jadi bisa dibandingkan antar kelompok
+            match, budget = self._match(group, tracks[start:, self.TRACK_COLUMNS[group['track']]],
+                                        budget, self.threshold if best is None else best[1])
+            if match is not None:
+                best = match
+        if best is None:
+            return None
+        # Frame gesture ini tidak dipakai lagi untuk pencocokan berikutnya
+        self.last_match_time = timestamp
+        return best[0]
+
+class LandmarkClassifier:
+    """
+    Klasifikasi pose tangan statis dengan k-NN atas landmark ternormalisasi (63 dimensi).
+
+    Hanya NumPy: dilatih offline dengan cammouse_gesture_train.py dan dimuat
+    dari file .npz. Jarak ke semua sampel dihitung dengan satu perkalian
+    matriks-vektor memakai norma sampel yang sudah dihitung sebelumnya.
+    """
+
+    def __init__(self, samples, labels, k=5, reject_distance=None):
+        samples = np.asarray(samples, dtype=np.float32)
+        self.samples = np.ascontiguousarray(samples.reshape(len(samples), -1))
+        self.sample_norms = np.einsum('ij,ij->i', self.samples, self.samples)
+        self.classes, self.label_index = np.unique(np.asarray(labels), return_inverse=True)
+        self.k = max(1, min(k, len(self.samples)))
+        self.reject_distance = reject_distance  # Di atas jarak ini pose dianggap tidak dikenal
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        reject_distance = float(data['reject_distance'])
+        return cls(data['samples'], data['labels'], int(data['k']),
+                   reject_distance if reject_distance > 0 else None)
+
+    def save(self, path):
+        labels = self.classes[self.label_index]
+        np.savez(path, samples=self.samples, labels=labels, k=self.k,
+                 reject_distance=self.reject_distance or 0.0)
+
+    def predict(self, normalized):
+        """Return (label atau None, confidence) untuk satu pose ternormalisasi (21, 3)"""
+        query = np.ravel(normalized).astype(np.float32, copy=False)
+        distances = self.sample_norms - 2.0 * (self.samples @ query) + float(query @ query)
+        if self.k < len(distances):
+            nearest = np.argpartition(distances, self.k - 1)[:self.k]
+        else:
+            nearest = np.arange(len(distances))
+        votes = np.bincount(self.label_index[nearest], minlength=len(self.classes))
+        best = int(votes.argmax())
+        if self.reject_distance is not None:
+            best_distance = distances[nearest][self.label_index[nearest] == best].min()
+            if math.sqrt(max(float(best_distance), 0.0)) > self.reject_distance:
+                return None, 0.0
+        return str(self.classes[best]), votes[best] / len(nearest)
+
+class PoseClassifierDetector(GestureDetector):
+    """Pose tangan statis dari LandmarkClassifier (mis. thumbs_up, peace), None jika tidak yakin"""
+
+    name = 'pose'
+
+    def __init__(self, model_path=None, classifier=None, min_confidence=0.6):
+        self.classifier = classifier or LandmarkClassifier.load(model_path)
+        self.min_confidence = min_confidence
+
+    def detect(self, features):
+        label, confidence = self.classifier.predict(features['normalized_landmarks'])
+        return label if confidence >= self.min_confidence else None
+
+# Plugin detektor gesture yang tersedia, berdasarkan nama
+GESTURE_DETECTORS = {
+    'pinch': PinchDetector,
+    'fist': FistDetector,
+    'open_palm': OpenPalmDetector,
+    'point': PointDetector,
+    'two_finger': TwoFingerDetector,
+    'motion': MotionGestureDetector,
+    'pose': PoseClassifierDetector,  # Butuh model_path hasil cammouse_gesture_train.py
+}
+# Hanya detektor yang hasilnya dibaca controller; 'point' dan 'motion' dipasang sesuai kebutuhan
+DEFAULT_GESTURE_DETECTORS = ['pinch', 'fist', 'open_palm', 'two_finger']
+
+def create_gesture_detector(name, **params):
+    """Buat detektor gesture berdasarkan nama"""
+    if name not in GESTURE_DETECTORS:
+        raise ValueError(f"Detektor gesture tidak dikenal: {name}")
+    return GESTURE_DETECTORS[name](**params)
+
+# Hotkey pindah workspace (sebelumnya, berikutnya) per platform
+if sys.platform == 'win32':
+    WORKSPACE_HOTKEYS = (('ctrl', 'win', 'left'), ('ctrl', 'win', 'right'))
+elif sys.platform == 'darwin':
+    WORKSPACE_HOTKEYS = (('ctrl', 'left'), ('ctrl', 'right'))
+else:
+    WORKSPACE_HOTKEYS = (('ctrl', 'alt', 'left'), ('ctrl', 'alt', 'right'))
+
+class GestureRegistry:
+    """
+    Kumpulan detektor aktif; semuanya dijalankan atas satu cache fitur per frame.
+
+    Setiap frame juga disimpan ke ring buffer landmark bersama yang tersedia
+    bagi detektor sebagai features['history'].
+    """
+
+    def __init__(self, detectors=(), history_size=128):
+        self.history = LandmarkRingBuffer(history_size)
+        self.detectors = {}
+        for detector in detectors:
+            self.add(detector)
+
+    def add(self, detector):
+        """Tambah atau ganti detektor (berdasarkan detector.name)"""
+        self.detectors[detector.name] = detector
+        return detector
+
+    def remove(self, name):
+        return self.detectors.pop(name, None)
+
+    def detect(self, features):
+        if features['timestamp'] is not None:
+            self.history.append(features['points'], features['timestamp'])
+            features['history'] = self.history
+        return {name: detector.detect(features) for name, detector in self.detectors.items()}
+
+    def reset(self):
+        self.history.clear()
+        for detector in self.detectors.values():
+            detector.reset()
+
+class CamMouseSystemController:
+    def __init__(self, actuator=None, model_complexity=1, actuation_backend='pyautogui'):
         """Inisialisasi controller untuk kontrol kursor sistem"""
+        self.latency = LatencyRecorder()
+
         # Konfigurasi MediaPipe
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
+            model_complexity=model_complexity,
             min_detection_confidence=0.7,
             min_tracking_confidence=0.5
         )
         self.mp_drawing = mp.solutions.drawing_utils
-
-        # Konfigurasi PyAutoGUI untuk kontrol sistem
-        pyautogui.FAILSAFE = True  # Failsafe ke pojok kiri atas
-        pyautogui.PAUSE = 0.01  # Delay minimal antar aksi
+        self.model_complexity = model_complexity
+
+        # Frame kerja berformat RGB, jadi warna landmark ditulis dalam urutan RGB
+        self.landmark_drawing_spec = self.mp_drawing.DrawingSpec(
+            color=(255, 0, 0), thickness=2, circle_radius=2)
+        self.draw_enabled = True  # Gambar landmark hanya jika preview ditampilkan
+
+        # Ring buffer RGB praalokasi untuk inferensi. Slot dipakai ulang setelah
+        # rgb_buffer_count frame, jadi konsumen di thread lain (preview) harus
+        # menyalin frame di thread inferensi (CamMousePipeline.make_preview)
+        self.rgb_buffer_count = 3
+        self._rgb_buffers = []
+        self._rgb_buffer_index = 0
+
+        # Mode ROI: inferensi pada crop di sekitar tangan frame sebelumnya
+        self.roi_enabled = False
+        self.roi_margin = 0.3  # Margin relatif terhadap ukuran bounding box
+        self.roi_size = 256  # Sisi crop setelah downscale (piksel)
+        self.roi_min_fraction = 0.2  # Sisi crop minimum relatif terhadap sisi frame terpendek
+        self.roi_hands = None  # Instance MediaPipe terpisah, dibuat saat pertama dipakai
+        self.last_hand_points = None
+        self.roi_stats = {'roi': 0, 'full': 0, 'lost': 0}
+
+        # Backend aktuasi: default-nya dijalankan di thread sendiri agar injeksi
+        # input tidak pernah memblokir loop inferensi
+        detect_displays = actuator is None
+        if actuator is None:
+            actuator = AsyncActuator(create_actuator(actuation_backend), self.latency,
+                                     on_failsafe=self.disable_system_control)
+        self.actuator = actuator
+
+        # Topologi monitor; actuator eksplisit (benchmark/pengujian) memakai ukurannya saja
+        self.display = DisplayTopology(self.actuator.size(), detect=detect_displays,
+                                       on_change=self.update_screen_geometry).start()
 
         # Status aplikasi
         self.is_running = False
         self.is_system_control_enabled = False
         self.camera = None
-        self.screen_width, self.screen_height = pyautogui.size()
+        self.update_screen_geometry()
+
+        # Konfigurasi capture kamera (None = default driver)
+        self.camera_index = 0  # Index atau path device (mis. '/dev/video2')
+        self.camera_backend = 'auto'
+        self.capture_width = 640
+        self.capture_height = 480
+        self.capture_fps = 30
+        self.capture_fourcc = 'MJPG'
+        self.capture_buffer_size = 1  # Buffer driver minimal = latensi capture minimal
+        self.capture_mode = None  # Mode yang benar-benar dinegosiasikan kamera
+        self.use_grabber = True  # Grab kamera di thread latar untuk kamera live
+        self.grabber = None
+        self.last_capture_time = None
+        self.last_error = None
 
         # Konfigurasi gesture
         self.cursor_sensitivity = 1.5
-        self.click_threshold = 0.05
-        self.last_click_time = 0
-        self.click_cooldown = 0.3  # Detik
-
-        # Smoothing untuk gerakan kursor
-        self.cursor_smoothing = 0.7
+        self.click_threshold = 0.4  # Jarak pinch relatif terhadap ukuran telapak
+
+        # State machine klik per tombol: press -> mouse_down, release -> mouse_up
+        self.click_machines = {'left': GestureStateMachine(), 'right': GestureStateMachine()}
+        self.button_held = {'left': False, 'right': False}  # State tombol yang sudah diinjeksi
+        self.button_presses = {'left': 0, 'right': 0}  # press_count terakhir yang diinjeksi
+        self.button_lock = threading.RLock()  # Reentran: release_buttons dipanggil di dalam lock
+        self.last_gesture_time = None
+        self.buttons_released_at = None
+
+        # Detektor gesture (plugin) yang berbagi cache fitur per frame
+        self.gesture_registry = GestureRegistry(
+            create_gesture_detector(name) for name in DEFAULT_GESTURE_DETECTORS)
+
+        # Aksi hotkey untuk gesture dinamis (detektor 'motion'), mis. swipe -> pindah workspace.
+        # Aksi hanya dijalankan jika detektor gesture_action_pose aktif saat gesture selesai,
+        # agar gerak kursor cepat dengan pose biasa tidak dianggap swipe
+        self.gesture_actions = {}
+        self.gesture_action_pose = 'open_palm'
+        self.motion_events = (0, None)  # (jumlah gesture dinamis, nama terakhir)
+        self.motion_applied = 0
+
+        # Scroll: pose dua jari (telunjuk + tengah) dengan debounce, gerak tangan menjadi scroll
+        self.scroll_machine = GestureStateMachine(release_ratio=1.0, min_hold_frames=3)
+        self.scroll_engine = ScrollEngine()
+        self.scroll_applied = (0, 0)  # Total notch yang sudah diinjeksi
+
+        # Smoothing gerakan kursor (dalam float, sebelum dibulatkan ke piksel)
+        self.cursor_filter_name = 'one_euro'
+        self.cursor_filter = CURSOR_FILTERS[self.cursor_filter_name]()
         self.last_cursor_pos = None
 
+        # Prediksi gerak (opsional): ekstrapolasi ke waktu sekarang + prediction_lead
+        self.prediction_enabled = False
+        self.prediction_lead = 0.0
+        self.predictor = MotionPredictor()
+
+        # Mode kursor: 'absolute' (frame dipetakan ke layar) atau 'relative' (trackpad)
+        self.cursor_mode = 'absolute'
+        self.relative_motion = RelativeMotion()
+        self.tracking_reset_requested = False  # Diset thread lain, dijalankan thread inferensi
+        self.cursor_total = (0, 0)  # Akumulasi delta mode relatif (piksel)
+        self.cursor_applied = (0, 0)  # Total delta yang sudah diinjeksi
+
+        # Kalibrasi area aktif (mode absolut); None = pemetaan skala biasa
+        self.cursor_mapping = None
+        self.calibration = None
+        self.calibration_file = CALIBRATION_FILE
+
         # Performance tracking
+        self.target_fps = 30
         self.fps_counter = 0
         self.last_fps_time = time.time()
         self.current_fps = 0
 
-    def calculate_distance(self, point1, point2):
-        """Hitung jarak Euclidean antara dua titik landmark"""
-        return np.sqrt((point1.x - point2.x)**2 + (point1.y - point2.y)**2)
+    def set_cursor_filter(self, name, **params):
+        """Ganti filter smoothing kursor"""
+        if name not in CURSOR_FILTERS:
+            raise ValueError(f"Filter kursor tidak dikenal: {name}")
+        self.cursor_filter = CURSOR_FILTERS[name](**params)
+        self.cursor_filter_name = name
+
+    def set_cursor_mode(self, mode, curve=None, **params):
+        """
+        Pilih mode kursor absolut/relatif serta kurva dan parameter akselerasi
+        mode relatif (PointerAcceleration.PARAMETERS). Parameter yang tidak
+        diberikan mempertahankan nilai saat ini.
+        """
+        if mode not in ('absolute', 'relative'):
+            raise ValueError(f"Mode kursor tidak dikenal: {mode}")
+        if curve is not None or params:
+            current = self.relative_motion.acceleration
+            values = {attr: getattr(current, attr) for attr, *_ in PointerAcceleration.PARAMETERS}
+            values.update(params)
+            self.relative_motion.acceleration = PointerAcceleration(curve or current.curve, **values)
+        self.cursor_mode = mode
+        # Dipanggil dari thread GUI: reset dijalankan thread inferensi di frame berikutnya
+        self.tracking_reset_requested = True
+
+    def update_screen_geometry(self):
+        """Ambil area virtual desktop (semua monitor) dari topologi display"""
+        left, top, width, height = self.display.bounds
+        self.screen_origin = (left, top)
+        self.screen_width, self.screen_height = width, height
+        self.actuator.set_bounds(self.display.bounds)
+        if self.is_running:
+            self.load_calibration()
+
+    def set_workspace_swipes(self, enabled):
+        """Swipe telapak terbuka kiri/kanan menjadi pindah workspace (detektor 'motion')"""
+        previous, following = WORKSPACE_HOTKEYS
+        if enabled:
+            if 'motion' not in self.gesture_registry.detectors:
+                self.gesture_registry.add(create_gesture_detector('motion'))
+            # Seperti trackpad: swipe ke kiri menampilkan workspace di sebelah kanan
+            self.gesture_actions.update({'swipe_left': following, 'swipe_right': previous})
+        else:
+            self.gesture_actions.pop('swipe_left', None)
+            self.gesture_actions.pop('swipe_right', None)
+            if not self.gesture_actions:
+                self.gesture_registry.remove('motion')
+
+    def load_pose_classifier(self, path):
+        """Muat model pose statis dan pasang sebagai detektor 'pose'"""
+        self.gesture_registry.add(PoseClassifierDetector(model_path=path))
+
+    def calibration_key(self):
+        """Kunci cache kalibrasi: kamera + resolusi capture + ukuran layar"""
+        mode = self.capture_mode or {'width': self.capture_width, 'height': self.capture_height}
+        return (f"{self.camera_index}:{mode['width']}x{mode['height']}"
+                f"|{self.screen_width}x{self.screen_height}")
+
+    def load_calibration(self):
+        """Muat homography tersimpan untuk kamera dan layar saat ini (jika ada)"""
+        self.cursor_mapping = None
+        try:
+            with open(self.calibration_file) as f:
+                matrix = json.load(f).get(self.calibration_key())
+        except (OSError, ValueError):
+            return False
+        if matrix:
+            self.cursor_mapping = CursorMapping(matrix)
+        return self.cursor_mapping is not None
 
-    def process_hand_landmarks(self, landmarks, frame_width, frame_height):
+    def save_calibration(self):
+        """Simpan homography aktif ke cache kalibrasi"""
+        try:
+            with open(self.calibration_file) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if self.cursor_mapping is None:
+            cache.pop(self.calibration_key(), None)
+        else:
+            cache[self.calibration_key()] = self.cursor_mapping.matrix
+        try:
+            with open(self.calibration_file, 'w') as f:
+                json.dump(cache, f, indent=2)
+        except OSError as e:
+            print(f"Gagal menyimpan kalibrasi: {e}")
+
+    def start_calibration(self):
+        """Mulai rekam sudut jangkauan; kursor dan klik ditahan selama kalibrasi"""
+        self.calibration = CalibrationSession()
+
+    def cancel_calibration(self):
+        self.calibration = None
+
+    def clear_calibration(self):
+        """Kembali ke pemetaan skala biasa dan hapus cache untuk kamera/layar ini"""
+        self.cursor_mapping = None
+        self.save_calibration()
+
+    def update_calibration(self, x, y, timestamp):
+        """Umpankan posisi telunjuk ke sesi kalibrasi dan terapkan hasilnya jika selesai"""
+        session = self.calibration
+        if session is None or not session.add_sample(x, y, timestamp):
+            return
+        try:
+            self.cursor_mapping = CursorMapping.from_corners(
+                session.corners, self.screen_width, self.screen_height, self.screen_origin)
+        except cv2.error as e:
+            print(f"Kalibrasi gagal: {e}")
+        else:
+            self.save_calibration()
+        self.calibration = None
+        self.reset_hand_tracking()
+
+    def reset_hand_tracking(self):
+        """Reset state per-tangan saat tangan hilang dari frame (thread inferensi)"""
+        self.tracking_reset_requested = False
+        self.cursor_filter.reset()
+        self.predictor.reset()
+        self.relative_motion.reset()
+        if self.cursor_mode == 'absolute':
+            self.last_cursor_pos = None
+        for machine in self.click_machines.values():
+            machine.reset()
+        self.scroll_machine.reset()
+        self.scroll_engine.reset()
+        self.gesture_registry.reset()
+        self.release_buttons()
+
+    def release_buttons(self):
+        """Lepas tombol yang masih ditahan (tangan hilang atau kontrol dinonaktifkan)"""
+        with self.button_lock:
+            for button, held in self.button_held.items():
+                if held:
+                    self.actuator.mouse_up(button)
+                    self.button_held[button] = False
+            # Gesture lama yang masih di buffer tidak boleh menekan tombol lagi
+            self.buttons_released_at = self.last_gesture_time
+
+    def process_hand_landmarks(self, landmarks, frame_width, frame_height, timestamp=None):
         """Proses landmark tangan untuk kontrol kursor"""
-        if not landmarks:
+        if landmarks is None:
             return None
-
-        # Ambil landmark penting
-        index_tip = landmarks.landmark[8]  # Ujung jari telunjuk
-        thumb_tip = landmarks.landmark[4]  # Ujung jempol
-        middle_tip = landmarks.landmark[12]  # Ujung jari tengah
-
-        # Konversi koordinat ke layar
-        cursor_x = int(index_tip.x * self.screen_width * self.cursor_sensitivity)
-        cursor_y = int(index_tip.y * self.screen_height * self.cursor_sensitivity)
-
-        # Batas layar
-        cursor_x = max(0, min(cursor_x, self.screen_width - 1))
-        cursor_y = max(0, min(cursor_y, self.screen_height - 1))
-
-        # Smoothing gerakan kursor
-        if self.last_cursor_pos:
-            cursor_x = int(self.last_cursor_pos[0] * self.cursor_smoothing + 
-                          cursor_x * (1 - self.cursor_smoothing))
-            cursor_y = int(self.last_cursor_pos[1] * self.cursor_smoothing + 
-                          cursor_y * (1 - self.cursor_smoothing))
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        if self.tracking_reset_requested:
+            self.reset_hand_tracking()
+
+        # Konversi landmark sekali per frame, semua fitur dihitung dari array yang sama
+        points = landmarks_to_array(landmarks)
+        features = compute_hand_features(points, timestamp)
+        detected = self.gesture_registry.detect(features)
+
+        # Konversi koordinat ujung jari telunjuk ke layar
+        index_x, index_y = float(points[INDEX_TIP, 0]), float(points[INDEX_TIP, 1])
+        if self.calibration is not None:
+            self.update_calibration(index_x, index_y, timestamp)
+        mapping = self.cursor_mapping
+        if mapping is not None and self.cursor_mode == 'absolute':
+            # Area aktif terkalibrasi: satu apply homography, tanpa sensitivitas
+            raw_x, raw_y = mapping.apply(index_x, index_y)
+        else:
+            raw_x = self.screen_origin[0] + index_x * self.screen_width * self.cursor_sensitivity
+            raw_y = self.screen_origin[1] + index_y * self.screen_height * self.cursor_sensitivity
+
+        # Smoothing di ruang float, baru dibulatkan setelahnya
+        smooth_x, smooth_y = self.cursor_filter.filter(raw_x, raw_y, timestamp)
+
+        # Kompensasi latensi capture + inferensi dengan ekstrapolasi ke "sekarang"
+        if self.prediction_enabled:
+            smooth_x, smooth_y = self.predictor.predict(
+                smooth_x, smooth_y, timestamp, time.perf_counter() + self.prediction_lead)
+
+        # Gesture dinamis yang dipetakan ke aksi dihitung kumulatif (tidak hilang di buffer)
+        motion = detected.get('motion')
+        if motion in self.gesture_actions and (self.gesture_action_pose is None
+                                               or detected.get(self.gesture_action_pose)):
+            self.motion_events = (self.motion_events[0] + 1, motion)
+
+        # Clutch (kepalan) untuk mengangkat "trackpad" di mode relatif
+        clutch = bool(detected.get('fist'))
+        cursor_delta = None
+
+        # Pose scroll (dua jari) dengan debounce
+        self.scroll_machine.update(0.0 if detected.get('two_finger') else 1.0, 0.5)
+        scrolling = self.scroll_machine.is_pressed
+        scroll = self.scroll_engine.update(
+            float(points[INDEX_TIP, 0] + points[MIDDLE_TIP, 0]) * 0.5,
+            float(points[INDEX_TIP, 1] + points[MIDDLE_TIP, 1]) * 0.5,
+            timestamp, scrolling)
+        if scrolling:
+            # Kursor diam selama scroll
+            self.relative_motion.reset()
+
+        if scrolling and self.last_cursor_pos is not None:
+            smooth_x, smooth_y = self.last_cursor_pos
+            if self.cursor_mode == 'relative':
+                cursor_delta = (0, 0)
+        elif self.cursor_mode == 'relative':
+            # Estimasi posisi kursor dari akumulasi delta (awal: tengah monitor utama)
+            primary = self.display.monitors[0]
+            last_x, last_y = self.last_cursor_pos or (primary.x + primary.width // 2,
+                                                      primary.y + primary.height // 2)
+            if clutch:
+                self.relative_motion.reset()
+                cursor_delta = (0, 0)
+            else:
+                # Delta diskalakan dengan faktor DPI monitor aktif agar terasa sama di semua layar
+                monitor = self.display.monitor_at(last_x, last_y)
+                cursor_delta = self.relative_motion.update(
+                    smooth_x, smooth_y, timestamp, self.screen_width * self.cursor_sensitivity,
+                    monitor.scale if monitor else 1.0)
+            smooth_x = last_x + cursor_delta[0]
+            smooth_y = last_y + cursor_delta[1]
+
+        # Batas layar: titik di celah antar monitor dipindah ke monitor terdekat
+        cursor_x, cursor_y, _ = self.display.clamp(smooth_x, smooth_y)
+        if cursor_delta is not None and cursor_delta != (0, 0):
+            # Delta efektif setelah clamp, diakumulasi seperti scroll_total: gerak dari
+            # gesture yang dibuang buffer tetap terkirim dan estimasi posisi tidak bergeser
+            cursor_delta = (cursor_x - last_x, cursor_y - last_y)
+            self.cursor_total = (self.cursor_total[0] + cursor_delta[0],
+                                 self.cursor_total[1] + cursor_delta[1])
 
         self.last_cursor_pos = (cursor_x, cursor_y)
 
         # Deteksi gesture
         gestures = {
+            'timestamp': timestamp,
             'cursor_pos': (cursor_x, cursor_y),
+            'cursor_delta': cursor_delta,
+            'cursor_total': self.cursor_total if cursor_delta is not None else None,
+            'clutch': clutch,
             'left_click': False,
             'right_click': False,
-            'scroll': None
+            'scroll': scroll if scroll != (0, 0) else None,
+            'scrolling': scrolling,
+            'scroll_total': self.scroll_engine.total,
+            'motion_events': self.motion_events,
+            'detected': detected,
+            'features': features
         }
-
-        # Left click: jempol dan telunjuk berdekatan
-        left_click_distance = self.calculate_distance(thumb_tip, index_tip)
-        if left_click_distance < self.click_threshold:
-            gestures['left_click'] = True
-
-        # Right click: jempol dan jari tengah berdekatan
-        right_click_distance = self.calculate_distance(thumb_tip, middle_tip)
-        if right_click_distance < self.click_threshold:
-            gestures['right_click'] = True
-
+        self.last_gesture_time = timestamp
+
+        # Left click: jempol ke telunjuk; right click: jempol ke jari tengah. Jempol bisa
+        # dekat ke beberapa jari sekaligus, jadi pinch milik jari yang paling dekat
+        pinch_finger, pinch_distance = detected.get('pinch') or (None, math.inf)
+        left_click_distance = pinch_distance if pinch_finger == 'index' else math.inf
+        right_click_distance = pinch_distance if pinch_finger == 'middle' else math.inf
+        if scrolling or (clutch and self.cursor_mode == 'relative'):
+            # Saat scroll/clutch tidak ada klik (jempol bisa menyentuh jari yang terlipat)
+            left_click_distance = right_click_distance = math.inf
+        left, right = self.click_machines['left'], self.click_machines['right']
+        events = {'left': left.update(left_click_distance, self.click_threshold),
+                  'right': right.update(right_click_distance, self.click_threshold)}
+
+        gestures['left_click'] = left.is_pressed
+        gestures['right_click'] = right.is_pressed
+        gestures['events'] = {name: event for name, event in events.items() if event}
+        gestures['buttons'] = {name: (machine.is_pressed, machine.press_count)
+                               for name, machine in self.click_machines.items()}
         return gestures
 
     def execute_system_control(self, gestures):
         """Eksekusi kontrol sistem berdasarkan gesture"""
-        if not self.is_system_control_enabled:
+        if not self.is_system_control_enabled or self.calibration is not None:
             return
 
-        current_time = time.time()
+        start_time = time.perf_counter()
 
-        # Gerakkan kursor
-        try:
-            pyautogui.moveTo(gestures['cursor_pos'][0], gestures['cursor_pos'][1], 
-                           duration=0, _pause=False)
-        except pyautogui.FailSafeException:
+        # Gerakkan kursor (mode relatif mengirim delta, mode absolut posisi); selama
+        # scroll kursor diam sehingga event scroll berturut-turut tergabung di antrean
+        cursor_total = gestures.get('cursor_total')
+        if cursor_total is not None:
+            moved = self.apply_relative_motion(cursor_total)
+        elif gestures.get('scrolling'):
+            moved = True
+        else:
+            moved = self.actuator.move_to(gestures['cursor_pos'][0], gestures['cursor_pos'][1])
+        if not moved:
             self.disable_system_control()
             return
 
-        # Click dengan cooldown
-        if current_time - self.last_click_time > self.click_cooldown:
-            if gestures['left_click']:
-                pyautogui.click()
-                self.last_click_time = current_time
-            elif gestures['right_click']:
-                pyautogui.rightClick()
-                self.last_click_time = current_time
+        self.apply_buttons(gestures)
+        self.apply_scroll(gestures)
+        self.apply_gesture_actions(gestures)
 
-    def start_camera(self):
-        """Mulai capture kamera"""
+        self.latency.record('actuation', start_time)
+
+    def apply_relative_motion(self, total):
+        """Injeksi selisih total delta relatif sejak event terakhir, False jika failsafe"""
+        dx = total[0] - self.cursor_applied[0]
+        dy = total[1] - self.cursor_applied[1]
+        if not (dx or dy):
+            return True
+        self.cursor_applied = total
+        return self.actuator.move_relative(dx, dy)
+
+    def apply_scroll(self, gestures):
+        """Injeksi selisih total notch sejak event terakhir (satu event per frame)"""
+        total = gestures.get('scroll_total')
+        if total is None:
+            return
+        dx = total[0] - self.scroll_applied[0]
+        dy = total[1] - self.scroll_applied[1]
+        # Total kumulatif: notch dari gesture yang dibuang buffer tetap terkirim
+        if dx or dy:
+            self.scroll_applied = total
+            self.actuator.scroll(dx, dy)
+
+    def apply_gesture_actions(self, gestures):
+        """Jalankan hotkey untuk gesture dinamis baru sejak aksi terakhir"""
+        count, name = gestures.get('motion_events') or (0, None)
+        if count == self.motion_applied:
+            return
+        # Jika beberapa gesture terjadi di antara dua frame aktuasi, hanya yang terakhir dijalankan
+        self.motion_applied = count
+        keys = self.gesture_actions.get(name)
+        if keys:
+            self.actuator.hotkey(*keys)
+
+    def apply_buttons(self, gestures):
+        """
+        Samakan tombol mouse dengan state machine gesture.
+
+        Berbasis level + jumlah press, bukan event per frame: gesture yang
+        dibuang buffer latest-wins tidak membuat tombol macet, dan press/release
+        lengkap yang terlewat tetap diinjeksi sebagai klik.
+        """
+        buttons = gestures.get('buttons')
+        if not buttons:
+            return
+        with self.button_lock:
+            released_at = self.buttons_released_at
+            if released_at is not None and gestures['timestamp'] <= released_at:
+                return
+            for button, (pressed, press_count) in buttons.items():
+                held = self.button_held[button]
+                new_presses = press_count - self.button_presses[button]
+                self.button_presses[button] = press_count
+
+                if held and (new_presses > 0 or not pressed):
+                    self.actuator.mouse_up(button)
+                    held = False
+                for _ in range(new_presses - 1 if pressed else new_presses):
+                    self.actuator.mouse_down(button)
+                    self.actuator.mouse_up(button)
+                if pressed and new_presses > 0:
+                    # Tombol ditahan selama pinch: kursor yang bergerak menjadi drag
+                    self.actuator.mouse_down(button)
+                    held = True
+                self.button_held[button] = held
+
+    def open_camera(self):
+        """Buka kamera dengan backend dan index yang dikonfigurasi"""
+        backend = self.camera_backend
+        if backend == 'auto':
+            backend = 'v4l2' if sys.platform.startswith('linux') else 'any'
+        if backend not in CAMERA_BACKENDS:
+            raise Exception(f"Backend kamera tidak dikenal: {self.camera_backend}")
+        return cv2.VideoCapture(self.camera_index, CAMERA_BACKENDS[backend])
+
+    def configure_camera(self, camera):
+        """Set properti capture lalu baca kembali mode yang dinegosiasikan"""
+        # FOURCC di-set lebih dulu: sebagian driver mereset resolusi saat format berubah
+        requested = [
+            ('fourcc', cv2.CAP_PROP_FOURCC, self.capture_fourcc),
+            ('width', cv2.CAP_PROP_FRAME_WIDTH, self.capture_width),
+            ('height', cv2.CAP_PROP_FRAME_HEIGHT, self.capture_height),
+            ('fps', cv2.CAP_PROP_FPS, self.capture_fps),
+            ('buffer_size', cv2.CAP_PROP_BUFFERSIZE, self.capture_buffer_size),
+        ]
+        for name, prop, value in requested:
+            if value is None:
+                continue
+            if name == 'fourcc':
+                value = cv2.VideoWriter_fourcc(*value)
+            camera.set(prop, value)
+
+        mode = {
+            'backend': camera.getBackendName() if hasattr(camera, 'getBackendName') else '',
+            'fourcc': decode_fourcc(camera.get(cv2.CAP_PROP_FOURCC)),
+            'width': int(camera.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(camera.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'fps': camera.get(cv2.CAP_PROP_FPS),
+            'buffer_size': int(camera.get(cv2.CAP_PROP_BUFFERSIZE)),
+        }
+
+        # Catat properti yang tidak diterima driver
+        mode['mismatch'] = [
+            name for name, _, value in requested
+            if value is not None and (
+                mode[name] != value if name != 'fps' else abs(mode[name] - value) > 0.5)
+        ]
+        return mode
+
+    def describe_capture_mode(self):
+        """Ringkasan mode capture untuk panel Status"""
+        mode = self.capture_mode
+        if not mode:
+            return "Kamera: -"
+        text = (f"Kamera: {mode['width']}x{mode['height']} @ {mode['fps']:.0f} FPS "
+                f"{mode['fourcc'] or '?'} buf={mode['buffer_size']} ({mode['backend'] or '?'})")
+        if mode['mismatch']:
+            text += f" [ditolak: {', '.join(mode['mismatch'])}]"
+        return text
+
+    def start_camera(self, capture=None):
+        """Mulai capture kamera (atau sumber lain dengan interface VideoCapture)"""
         try:
-            self.camera = cv2.VideoCapture(0)
+            self.capture_mode = None
+            if capture is None:
+                self.camera = self.open_camera()
+                if not self.camera.isOpened():
+                    raise Exception("Tidak dapat mengakses kamera")
+                self.capture_mode = self.configure_camera(self.camera)
+                if self.use_grabber:
+                    self.grabber = CameraGrabber(self.camera, self.latency).start()
+            else:
+                self.camera = capture
             if not self.camera.isOpened():
                 raise Exception("Tidak dapat mengakses kamera")
             self.is_running = True
+            self.last_error = None
+            self.load_calibration()
             return True
         except Exception as e:
-            messagebox.showerror("Error Kamera", f"Gagal mengakses kamera: {str(e)}")
+            # Pesan error ditampilkan oleh pemanggil (GUI atau terminal)
+            self.last_error = str(e)
             return False
 
     def stop_camera(self):
         """Hentikan capture kamera"""
         self.is_running = False
         self.is_system_control_enabled = False
+        self.release_buttons()
+        if self.grabber:
+            self.grabber.stop()
+            self.grabber = None
         if self.camera:
             self.camera.release()
             self.camera = None
 
+    def set_actuation_backend(self, name):
+        """Ganti backend aktuasi saat runtime (backend lama ditutup)"""
+        backend = create_actuator(name)
+        with self.button_lock:
+            # Tombol yang ditahan dilepas di perangkat lama sebelum diganti
+            self.release_buttons()
+            old_actuator = self.actuator
+            self.actuator = AsyncActuator(backend, self.latency,
+                                          on_failsafe=self.disable_system_control)
+        self.display.fallback_size = self.actuator.size()
+        self.display.refresh()
+        self.update_screen_geometry()
+        old_actuator.close()
+
     def enable_system_control(self):
         """Aktifkan kontrol sistem"""
         if self.is_running:
+            self.actuator.reset()
+            # Pinch yang sudah berlangsung saat kontrol diaktifkan tidak ditekan
+            with self.button_lock:
+                for name, machine in self.click_machines.items():
+                    self.button_presses[name] = machine.press_count
+            self.scroll_applied = self.scroll_engine.total
+            self.cursor_applied = self.cursor_total
+            self.motion_applied = self.motion_events[0]
             self.is_system_control_enabled = True
             return True
         return False
@@ -176,41 +2696,151 @@ class CamMouseSystemController:
     def disable_system_control(self):
         """Nonaktifkan kontrol sistem"""
         self.is_system_control_enabled = False
+        self.release_buttons()
 
-    def process_frame(self):
-        """Proses frame kamera untuk deteksi gesture"""
-        if not self.is_running or not self.camera:
-            return None, None
+    def read_frame(self, timeout=0):
+        """
+        Ambil satu frame mentah (tahap capture) sebagai (frame, capture_time).
 
+        Dengan grabber aktif, hanya frame terbaru yang belum diproses yang
+        dikembalikan dan kamera tidak pernah ditunggu; None jika belum ada
+        frame baru dalam timeout.
+        """
+        if not self.is_running or not self.camera:
+            return None
+        if self.grabber is not None:
+            grabbed = self.grabber.read(timeout)
+            if grabbed is None:
+                return None
+            frame, capture_time, _ = grabbed
+            return frame, capture_time
+
+        start_time = time.perf_counter()
         ret, frame = self.camera.read()
+        capture_time = self.latency.record('capture', start_time)
         if not ret:
-            return None, None
+            return None
+        return frame, capture_time
+
+    def get_tracking_roi(self, frame_width, frame_height):
+        """Crop persegi (x0, y0, sisi) di sekitar tangan frame sebelumnya, None jika tidak ada"""
+        if self.last_hand_points is None:
+            return None
+
+        xs = self.last_hand_points[:, 0] * frame_width
+        ys = self.last_hand_points[:, 1] * frame_height
+        box_size = max(xs.max() - xs.min(), ys.max() - ys.min())
+        short_side = min(frame_width, frame_height)
+        side = int(max(box_size * (1 + 2 * self.roi_margin), short_side * self.roi_min_fraction))
+
+        # Crop hampir seukuran frame tidak menghemat apa-apa
+        if side >= short_side * 0.9:
+            return None
 
-        # Flip frame secara horizontal untuk efek mirror
-        frame = cv2.flip(frame, 1)
+        center_x = (xs.max() + xs.min()) / 2
+        center_y = (ys.max() + ys.min()) / 2
+        x0 = int(min(max(center_x - side / 2, 0), frame_width - side))
+        y0 = int(min(max(center_y - side / 2, 0), frame_height - side))
+        return x0, y0, side
+
+    def detect_hands_roi(self, frame, roi):
+        """Jalankan deteksi tangan pada crop ROI dan petakan landmark ke koordinat frame penuh"""
+        if self.roi_hands is None:
+            self.roi_hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=1,
+                model_complexity=self.model_complexity,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
+
+        x0, y0, side = roi
+        crop = cv2.resize(frame[y0:y0 + side, x0:x0 + side],
+                          (self.roi_size, self.roi_size), interpolation=cv2.INTER_AREA)
+        results = self.roi_hands.process(crop)
 
-        # Konversi BGR ke RGB untuk MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if results.multi_hand_landmarks:
+            frame_height, frame_width = frame.shape[:2]
+            for hand_landmarks in results.multi_hand_landmarks:
+                for point in hand_landmarks.landmark:
+                    point.x = (x0 + point.x * side) / frame_width
+                    point.y = (y0 + point.y * side) / frame_height
+                    point.z = point.z * side / frame_width
+        return results
+
+    def next_rgb_buffer(self, shape):
+        """Ambil buffer RGB praalokasi berikutnya dari ring (alokasi ulang jika ukuran frame berubah)"""
+        if not self._rgb_buffers or self._rgb_buffers[0].shape != shape:
+            self._rgb_buffers = [np.empty(shape, dtype=np.uint8)
+                                 for _ in range(self.rgb_buffer_count)]
+        self._rgb_buffer_index = (self._rgb_buffer_index + 1) % len(self._rgb_buffers)
+        return self._rgb_buffers[self._rgb_buffer_index]
+
+    def infer_frame(self, frame, capture_time=None):
+        """
+        Deteksi tangan dan gesture pada satu frame BGR (tahap inferensi).
+
+        Return (frame RGB ter-mirror dengan landmark, gestures). Buffer RGB yang
+        sama dipakai untuk MediaPipe dan preview, jadi tidak ada konversi kedua.
+        """
+        start_time = stage_time = time.perf_counter()
+        if capture_time is not None:
+            # Umur frame sejak keluar dari kamera sampai mulai diproses
+            self.latency.record('frame_age', capture_time)
+        self.last_capture_time = capture_time if capture_time is not None else start_time
+
+        # Flip horizontal (efek mirror) langsung ke buffer praalokasi, lalu
+        # konversi BGR ke RGB in-place tanpa alokasi frame baru
+        rgb_frame = self.next_rgb_buffer(frame.shape)
+        cv2.flip(frame, 1, dst=rgb_frame)
+        stage_time = self.latency.record('flip', stage_time)
+        cv2.cvtColor(rgb_frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        frame = rgb_frame
+        stage_time = self.latency.record('bgr2rgb', stage_time)
+
+        roi = None
+        if self.roi_enabled:
+            roi = self.get_tracking_roi(frame.shape[1], frame.shape[0])
+
+        if roi is not None:
+            # Deteksi tangan pada crop kecil
+            results = self.detect_hands_roi(frame, roi)
+            self.roi_stats['roi'] += 1
+            if not results.multi_hand_landmarks:
+                self.roi_stats['lost'] += 1
+        else:
+            # Deteksi tangan
+            results = self.hands.process(frame)
+            self.roi_stats['full'] += 1
+        stage_time = self.latency.record('hands', stage_time)
 
-        # Deteksi tangan
-        results = self.hands.process(rgb_frame)
+        # Tanpa tangan: frame berikutnya kembali ke deteksi frame penuh
+        self.last_hand_points = None
+        if not results.multi_hand_landmarks:
+            self.reset_hand_tracking()
 
         gestures = None
         if results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
                 # Gambar landmark pada frame
-                self.mp_drawing.draw_landmarks(
-                    frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+                if self.draw_enabled:
+                    self.mp_drawing.draw_landmarks(
+                        frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS,
+                        landmark_drawing_spec=self.landmark_drawing_spec)
+                    stage_time = self.latency.record('draw', stage_time)
 
                 # Proses gesture
                 gestures = self.process_hand_landmarks(
-                    hand_landmarks, frame.shape[1], frame.shape[0])
+                    hand_landmarks, frame.shape[1], frame.shape[0], self.last_capture_time)
+                stage_time = self.latency.record('gesture', stage_time)
+                self.last_hand_points = gestures['features']['points']
 
-                # Eksekusi kontrol sistem
-                if gestures:
-                    self.execute_system_control(gestures)
+        self.latency.record('total', start_time)
+        self.update_fps()
+        return frame, gestures
 
-        # Update FPS counter
+    def update_fps(self):
+        """Update FPS counter"""
         self.fps_counter += 1
         current_time = time.time()
         if current_time - self.last_fps_time >= 1.0:
@@ -218,16 +2848,298 @@ class CamMouseSystemController:
             self.fps_counter = 0
             self.last_fps_time = current_time
 
+    def process_frame(self):
+        """Proses frame kamera untuk deteksi gesture (mode serial)"""
+        captured = self.read_frame()
+        if captured is None:
+            return None, None
+
+        frame, gestures = self.infer_frame(*captured)
+
+        # Eksekusi kontrol sistem
+        if gestures:
+            self.execute_system_control(gestures)
+
         return frame, gestures
 
+class FramePacer:
+    """Penjadwal frame berbasis deadline untuk mencapai target FPS"""
+
+    def __init__(self, target_fps=30):
+        self.set_target_fps(target_fps)
+        self.reset()
+
+    def set_target_fps(self, target_fps):
+        """Ubah target FPS tanpa mereset statistik"""
+        self.target_fps = max(1.0, float(target_fps))
+        self.period = 1.0 / self.target_fps
+
+    def reset(self):
+        """Mulai jadwal baru dari waktu sekarang"""
+        self.next_deadline = None
+        self.skipped_frames = 0
+        self.achieved_fps = 0.0
+        self._window_frames = 0
+        self._window_start = None
+
+    def wait(self):
+        """Tunggu sampai slot frame berikutnya, kembalikan jumlah slot yang terlewat"""
+        now = time.perf_counter()
+        self._update_rate(now)
+
+        if self.next_deadline is None:
+            self.next_deadline = now
+        self.next_deadline += self.period
+
+        # Waktu proses sudah dikurangi: hanya sisa periode yang di-sleep
+        remaining = self.next_deadline - now
+        if remaining > 0:
+            time.sleep(remaining)
+            return 0
+
+        # Terlambat: lewati slot yang terlewat alih-alih mengejar secara beruntun
+        missed = int(-remaining / self.period)
+        self.skipped_frames += missed
+        self.next_deadline += missed * self.period
+        return missed
+
+    def _update_rate(self, now):
+        """Hitung FPS yang benar-benar tercapai per jendela satu detik"""
+        if self._window_start is None:
+            self._window_start = now
+            return
+        self._window_frames += 1
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.achieved_fps = self._window_frames / elapsed
+            self._window_frames = 0
+            self._window_start = now
+
+class LatestFrameBuffer:
+    """Buffer satu slot: item baru menimpa item lama yang belum diambil"""
+
+    def __init__(self, name):
+        self.name = name
+        self._condition = threading.Condition()
+        self._item = None
+        self._has_item = False
+        self._closed = False
+        self.put_count = 0
+        self.drop_count = 0
+
+    def put(self, item):
+        """Simpan item terbaru, buang item lama yang belum dikonsumsi"""
+        with self._condition:
+            if self._has_item:
+                self.drop_count += 1
+            self._item = item
+            self._has_item = True
+            self.put_count += 1
+            self._condition.notify()
+
+    def get(self, timeout=None):
+        """Ambil item terbaru, tunggu sampai ada item atau timeout"""
+        with self._condition:
+            if not self._has_item and not self._closed:
+                self._condition.wait(timeout)
+            if not self._has_item:
+                return None
+            item = self._item
+            self._item = None
+            self._has_item = False
+            return item
+
+    def close(self):
+        """Bangunkan semua consumer yang sedang menunggu"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def reset(self):
+        """Kosongkan buffer dan counter untuk sesi baru"""
+        with self._condition:
+            self._item = None
+            self._has_item = False
+            self._closed = False
+            self.put_count = 0
+            self.drop_count = 0
+
+class CamMousePipeline:
+    """Pipeline bertahap: capture -> inferensi -> aktuasi, masing-masing di thread sendiri"""
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.frame_buffer = LatestFrameBuffer('capture')
+        self.gesture_buffer = LatestFrameBuffer('inference')
+        self.preview_buffer = LatestFrameBuffer('preview')
+        self.pacer = FramePacer(controller.target_fps)
+        self.preview_enabled = True
+        self.preview_fps = 10  # Preview dirender lebih jarang daripada loop kontrol
+        self.preview_size = (640, 480)  # Ukuran maksimum frame preview
+        self._next_preview_time = 0.0
+        self.threads = []
+        self.is_running = False
+        self.buffer_timeout = 0.1  # Detik
+
+    def start(self):
+        """Mulai semua thread pipeline"""
+        if self.is_running:
+            return
+        for buffer in self.buffers():
+            buffer.reset()
+        self.pacer.set_target_fps(self.controller.target_fps)
+        self.pacer.reset()
+        self.is_running = True
+        self.threads = [
+            threading.Thread(target=self._inference_loop, name='cammouse-inference', daemon=True),
+            threading.Thread(target=self._actuation_loop, name='cammouse-actuation', daemon=True),
+        ]
+        # Kamera live sudah punya CameraGrabber sebagai tahap capture
+        if self.controller.grabber is None:
+            self.threads.insert(0, threading.Thread(
+                target=self._capture_loop, name='cammouse-capture', daemon=True))
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        """Hentikan pipeline dan tunggu semua thread selesai"""
+        self.is_running = False
+        for buffer in self.buffers():
+            buffer.close()
+        for thread in self.threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=1.0)
+        self.threads = []
+
+    def buffers(self):
+        """Daftar buffer antar tahap"""
+        return [self.frame_buffer, self.gesture_buffer, self.preview_buffer]
+
+    def set_preview_enabled(self, enabled):
+        """Aktifkan/nonaktifkan output preview (termasuk penggambaran landmark)"""
+        self.preview_enabled = enabled
+        self.controller.draw_enabled = enabled
+
+    def set_preview_fps(self, preview_fps):
+        """Ubah rate preview tanpa mempengaruhi rate loop kontrol"""
+        self.preview_fps = max(1.0, float(preview_fps))
+
+    def _is_preview_due(self):
+        """Decimation preview: True jika frame ini perlu dikirim ke preview"""
+        if not self.preview_enabled:
+            return False
+        now = time.perf_counter()
+        if now < self._next_preview_time:
+            return False
+        self._next_preview_time = max(self._next_preview_time + 1.0 / self.preview_fps, now)
+        return True
+
+    def make_preview(self, frame):
+        """
+        Salin (dan perkecil) frame ke array baru milik preview.
+
+        Dipanggil di thread inferensi sebelum slot ring buffer RGB dipakai ulang,
+        sehingga GUI tidak pernah membaca slot yang sedang ditimpa. Hanya
+        berjalan pada rate preview, jadi alokasi per frame preview murah.
+        """
+        height, width = frame.shape[:2]
+        max_width, max_height = self.preview_size
+        scale = min(max_width / width, max_height / height)
+        if scale >= 1.0:
+            return frame.copy()
+        return cv2.resize(frame, (int(width * scale), int(height * scale)))
+
+    def set_target_fps(self, target_fps):
+        """Ubah target FPS loop kontrol"""
+        self.controller.target_fps = target_fps
+        self.pacer.set_target_fps(target_fps)
+
+    def get_stats(self):
+        """Counter frame dan drop per tahap"""
+        stats = {
+            buffer.name: {'frames': buffer.put_count, 'dropped': buffer.drop_count}
+            for buffer in self.buffers()
+        }
+        grabber = self.controller.grabber
+        if grabber is not None:
+            stats['capture'] = {'frames': grabber.frame_count, 'dropped': grabber.drop_count}
+        return stats
+
+    def _is_active(self):
+        return self.is_running and self.controller.is_running
+
+    def _capture_loop(self):
+        """Thread capture: baca kamera secepat driver mengirim frame"""
+        while self._is_active():
+            try:
+                captured = self.controller.read_frame()
+            except Exception as e:
+                print(f"Error dalam capture: {e}")
+                break
+            if captured is None:
+                time.sleep(0.005)
+                continue
+            self.frame_buffer.put(captured)
+
+    def _next_frame(self):
+        """Frame terbaru dari grabber kamera atau dari buffer capture"""
+        if self.controller.grabber is not None:
+            return self.controller.read_frame(timeout=self.buffer_timeout)
+        return self.frame_buffer.get(timeout=self.buffer_timeout)
+
+    def _inference_loop(self):
+        """Thread inferensi: selalu proses frame terbaru, frame basi dibuang"""
+        while self._is_active():
+            captured = self._next_frame()
+            if captured is None:
+                continue
+            # Landmark hanya digambar pada frame yang akan ditampilkan
+            preview_due = self._is_preview_due()
+            self.controller.draw_enabled = preview_due
+            try:
+                frame, gestures = self.controller.infer_frame(*captured)
+            except Exception as e:
+                print(f"Error dalam inferensi: {e}")
+                break
+            if gestures:
+                self.gesture_buffer.put(gestures)
+            if preview_due:
+                self.preview_buffer.put((self.make_preview(frame), gestures))
+
+            # Pacing berbasis deadline sesuai target FPS
+            self.pacer.wait()
+
+    def _actuation_loop(self):
+        """Thread aktuasi: hanya posisi gesture terbaru yang dikirim ke sistem"""
+        while self._is_active():
+            gestures = self.gesture_buffer.get(timeout=self.buffer_timeout)
+            if gestures is None:
+                continue
+            try:
+                self.controller.execute_system_control(gestures)
+            except Exception as e:
+                print(f"Error dalam aktuasi: {e}")
+
 class CamMouseGUI:
     def __init__(self):
         """Inisialisasi GUI aplikasi"""
         self.controller = CamMouseSystemController()
+        self.pipeline = CamMousePipeline(self.controller)
         self.root = tk.Tk()
         self.setup_gui()
         self.update_thread = None
         self.is_gui_running = True
+        self.is_window_visible = True
+
+        # Hanya satu callback update GUI yang boleh antre di main loop Tk;
+        # worker cukup menimpa foto terbaru yang akan diambil callback tersebut
+        self._gui_update_lock = threading.Lock()
+        self._gui_update_pending = False
+        self._pending_photo = None
+
+        # Preview tidak dirender saat jendela diminimalkan
+        self.root.bind('<Map>', self.on_window_map)
+        self.root.bind('<Unmap>', self.on_window_map)
 
     def setup_gui(self):
         """Setup interface GUI"""
@@ -266,6 +3178,11 @@ class CamMouseGUI:
                                     command=self.toggle_system_control, state='disabled')
         self.system_btn.grid(row=0, column=2)
 
+        self.preview_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(control_frame, text="Tampilkan Preview",
+                        variable=self.preview_var,
+                        command=self.update_preview_state).grid(row=0, column=3, padx=(10, 0))
+
         # Settings Frame
         settings_frame = ttk.LabelFrame(main_frame, text="Pengaturan", padding="10")
         settings_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
@@ -279,16 +3196,123 @@ class CamMouseGUI:
         sensitivity_scale.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
 
         # Click threshold
+        # (relatif terhadap ukuran telapak, sama di semua jarak tangan ke kamera)
         ttk.Label(settings_frame, text="Threshold Click:").grid(row=2, column=0, sticky=tk.W)
-        self.threshold_var = tk.DoubleVar(value=0.05)
-        threshold_scale = ttk.Scale(settings_frame, from_=0.02, to=0.1, 
+        self.threshold_var = tk.DoubleVar(value=self.controller.click_threshold)
+        threshold_scale = ttk.Scale(settings_frame, from_=0.15, to=0.8, 
                                    variable=self.threshold_var,
                                    command=self.update_threshold)
         threshold_scale.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
 
+        # Target FPS
+        ttk.Label(settings_frame, text="Target FPS:").grid(row=4, column=0, sticky=tk.W)
+        self.target_fps_var = tk.DoubleVar(value=self.controller.target_fps)
+        target_fps_scale = ttk.Scale(settings_frame, from_=10, to=60,
+                                    variable=self.target_fps_var,
+                                    command=self.update_target_fps)
+        target_fps_scale.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+
+        # Mode ROI
+        self.roi_var = tk.BooleanVar(value=self.controller.roi_enabled)
+        ttk.Checkbutton(settings_frame, text="Mode ROI (hemat CPU)",
+                        variable=self.roi_var,
+                        command=self.update_roi_mode).grid(row=6, column=0, sticky=tk.W)
+
+        # Preview
+        preview_frame = ttk.Frame(settings_frame)
+        preview_frame.grid(row=7, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(preview_frame, text="Preview:").grid(row=0, column=0, sticky=tk.W)
+        self.preview_fps_var = tk.StringVar(value=str(self.pipeline.preview_fps))
+        ttk.Spinbox(preview_frame, from_=1, to=30, width=4,
+                    textvariable=self.preview_fps_var,
+                    command=self.update_preview_settings).grid(row=0, column=1, padx=(5, 2))
+        ttk.Label(preview_frame, text="FPS").grid(row=0, column=2, padx=(0, 10))
+        self.preview_size_var = tk.StringVar(value="640x480")
+        preview_size_box = ttk.Combobox(preview_frame, width=10, state='readonly',
+                                        values=["320x240", "480x360", "640x480"],
+                                        textvariable=self.preview_size_var)
+        preview_size_box.grid(row=0, column=3)
+        preview_size_box.bind('<<ComboboxSelected>>', self.update_preview_settings)
+
+        # Kamera
+        camera_frame = ttk.Frame(settings_frame)
+        camera_frame.grid(row=8, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(camera_frame, text="Kamera:").grid(row=0, column=0, sticky=tk.W)
+        self.camera_index_var = tk.StringVar(value=str(self.controller.camera_index))
+        ttk.Spinbox(camera_frame, from_=0, to=9, width=4,
+                    textvariable=self.camera_index_var).grid(row=0, column=1, padx=(5, 10))
+        self.resolution_var = tk.StringVar(
+            value=f"{self.controller.capture_width}x{self.controller.capture_height}")
+        ttk.Combobox(camera_frame, width=10, state='readonly',
+                     values=["640x480", "1280x720", "1920x1080"],
+                     textvariable=self.resolution_var).grid(row=0, column=2)
+
+        # Backend aktuasi
+        actuation_frame = ttk.Frame(settings_frame)
+        actuation_frame.grid(row=9, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(actuation_frame, text="Aktuasi:").grid(row=0, column=0, sticky=tk.W)
+        self.actuation_var = tk.StringVar(value='pyautogui')
+        actuation_box = ttk.Combobox(actuation_frame, width=10, state='readonly',
+                                     values=[name for name in ACTUATOR_BACKENDS if name != 'null'],
+                                     textvariable=self.actuation_var)
+        actuation_box.grid(row=0, column=1, padx=(5, 0))
+        actuation_box.bind('<<ComboboxSelected>>', self.update_actuation_backend)
+
+        # Filter kursor
+        filter_frame = ttk.Frame(settings_frame)
+        filter_frame.grid(row=10, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(filter_frame, text="Filter Kursor:").grid(row=0, column=0, sticky=tk.W)
+        self.cursor_filter_var = tk.StringVar(value=self.controller.cursor_filter_name)
+        filter_box = ttk.Combobox(filter_frame, width=10, state='readonly',
+                                  values=list(CURSOR_FILTERS),
+                                  textvariable=self.cursor_filter_var)
+        filter_box.grid(row=0, column=1, padx=(5, 0))
+        filter_box.bind('<<ComboboxSelected>>', self.update_cursor_filter)
+        self.prediction_var = tk.BooleanVar(value=self.controller.prediction_enabled)
+        ttk.Checkbutton(filter_frame, text="Prediksi Gerak",
+                        variable=self.prediction_var,
+                        command=self.update_prediction).grid(row=0, column=2, padx=(10, 0))
+
+        # Parameter filter dibangun ulang setiap kali filter diganti
+        self.filter_params_frame = ttk.Frame(settings_frame)
+        self.filter_params_frame.grid(row=11, column=0, sticky=(tk.W, tk.E))
+        self.build_filter_params()
+
+        # Mode kursor absolut/relatif dan kurva akselerasi
+        mode_frame = ttk.Frame(settings_frame)
+        mode_frame.grid(row=12, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(mode_frame, text="Mode Kursor:").grid(row=0, column=0, sticky=tk.W)
+        self.cursor_mode_var = tk.StringVar(value=self.controller.cursor_mode)
+        mode_box = ttk.Combobox(mode_frame, width=9, state='readonly',
+                                values=['absolute', 'relative'],
+                                textvariable=self.cursor_mode_var)
+        mode_box.grid(row=0, column=1, padx=(5, 5))
+        mode_box.bind('<<ComboboxSelected>>', self.update_cursor_mode)
+        self.curve_var = tk.StringVar(value=self.controller.relative_motion.acceleration.curve)
+        curve_box = ttk.Combobox(mode_frame, width=8, state='readonly',
+                                 values=list(ACCELERATION_CURVES),
+                                 textvariable=self.curve_var)
+        curve_box.grid(row=0, column=2)
+        curve_box.bind('<<ComboboxSelected>>', self.update_cursor_mode)
+        self.acceleration_params_frame = ttk.Frame(mode_frame)
+        self.acceleration_params_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E))
+        self.build_acceleration_params()
+
+        # Kalibrasi area aktif
+        calibration_frame = ttk.Frame(settings_frame)
+        calibration_frame.grid(row=13, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Button(calibration_frame, text="Kalibrasi Area",
+                   command=self.start_calibration).grid(row=0, column=0, padx=(0, 5))
+        ttk.Button(calibration_frame, text="Reset Kalibrasi",
+                   command=self.clear_calibration).grid(row=0, column=1)
+        self.workspace_swipes_var = tk.BooleanVar(value='swipe_left' in self.controller.gesture_actions)
+        ttk.Checkbutton(calibration_frame, text="Swipe Workspace",
+                        variable=self.workspace_swipes_var,
+                        command=self.update_workspace_swipes).grid(row=0, column=2, padx=(10, 0))
+
         # Status
         status_frame = ttk.LabelFrame(settings_frame, text="Status Sistem")
-        status_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
+        status_frame.grid(row=14, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
 
         self.status_label = ttk.Label(status_frame, text="Status: Siap")
         self.status_label.grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
@@ -296,6 +3320,29 @@ class CamMouseGUI:
         self.fps_label = ttk.Label(status_frame, text="FPS: 0")
         self.fps_label.grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
 
+        self.drop_label = ttk.Label(status_frame, text="Drop: -")
+        self.drop_label.grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+
+        self.camera_label = ttk.Label(status_frame, text="Kamera: -")
+        self.camera_label.grid(row=5, column=0, sticky=tk.W, padx=5, pady=5)
+
+        self.calibration_label = ttk.Label(status_frame, text="Kalibrasi: -")
+        self.calibration_label.grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
+
+        self.display_label = ttk.Label(status_frame, text="Layar: -")
+        self.display_label.grid(row=7, column=0, sticky=tk.W, padx=5, pady=5)
+
+        self.latency_label = ttk.Label(status_frame, text="Latensi (p50/p95/p99 ms): -",
+                                      justify=tk.LEFT, font=('Courier', 8))
+        self.latency_label.grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+
+        latency_btn_frame = ttk.Frame(status_frame)
+        latency_btn_frame.grid(row=4, column=0, sticky=tk.W, padx=5, pady=(0, 5))
+        ttk.Button(latency_btn_frame, text="💾 Export Latensi",
+                   command=self.export_latency).grid(row=0, column=0, padx=(0, 5))
+        ttk.Button(latency_btn_frame, text="🔄 Reset",
+                   command=self.controller.latency.reset).grid(row=0, column=1)
+
         # Video frame
         self.video_frame = ttk.LabelFrame(main_frame, text="Live Feed", padding="5")
         self.video_frame.grid(row=1, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -320,19 +3367,29 @@ class CamMouseGUI:
 
     def start_camera(self):
         """Mulai kamera dan update thread"""
-        if self.controller.start_camera():
-            self.start_btn.config(state='disabled')
-            self.stop_btn.config(state='normal')
-            self.system_btn.config(state='normal')
-            self.status_label.config(text="Status: Kamera Aktif")
+        self.apply_camera_settings()
+        if not self.controller.start_camera():
+            messagebox.showerror("Error Kamera",
+                                 f"Gagal mengakses kamera: {self.controller.last_error}")
+            return
+
+        self.start_btn.config(state='disabled')
+        self.stop_btn.config(state='normal')
+        self.system_btn.config(state='normal')
+        self.status_label.config(text="Status: Kamera Aktif")
+        self.camera_label.config(text=self.controller.describe_capture_mode())
+
+        # Start pipeline capture/inferensi/aktuasi
+        self.pipeline.start()
 
-            # Start update thread
-            if self.update_thread is None or not self.update_thread.is_alive():
-                self.update_thread = threading.Thread(target=self.update_video, daemon=True)
-                self.update_thread.start()
+        # Start update thread
+        if self.update_thread is None or not self.update_thread.is_alive():
+            self.update_thread = threading.Thread(target=self.update_video, daemon=True)
+            self.update_thread.start()
 
     def stop_camera(self):
         """Stop kamera"""
+        self.pipeline.stop()
         self.controller.stop_camera()
         self.start_btn.config(state='normal')
         self.stop_btn.config(state='disabled')
@@ -359,39 +3416,149 @@ class CamMouseGUI:
         """Update threshold click"""
         self.controller.click_threshold = float(value)
 
+    def apply_camera_settings(self):
+        """Terapkan index kamera dan resolusi dari panel Pengaturan"""
+        index = self.camera_index_var.get().strip()
+        self.controller.camera_index = int(index) if index.isdigit() else index
+        width, height = self.resolution_var.get().split('x')
+        self.controller.capture_width = int(width)
+        self.controller.capture_height = int(height)
+
+    def update_actuation_backend(self, event=None):
+        """Ganti backend injeksi input"""
+        name = self.actuation_var.get()
+        try:
+            self.controller.set_actuation_backend(name)
+        except Exception as e:
+            messagebox.showerror("Error Aktuasi", f"Backend {name} tidak dapat dipakai: {str(e)}")
+
+    def update_cursor_filter(self, event=None):
+        """Ganti filter smoothing kursor"""
+        self.controller.set_cursor_filter(self.cursor_filter_var.get())
+        self.build_filter_params()
+
+    def update_cursor_mode(self, event=None):
+        """Ganti mode kursor (relatif: kepalkan tangan untuk clutch)"""
+        self.controller.set_cursor_mode(self.cursor_mode_var.get(), self.curve_var.get())
+        self.build_acceleration_params()
+
+    def build_acceleration_params(self):
+        """Buat slider untuk parameter akselerasi mode relatif"""
+        for child in self.acceleration_params_frame.winfo_children():
+            child.destroy()
+
+        acceleration = self.controller.relative_motion.acceleration
+        for row, (attr, label, low, high) in enumerate(acceleration.PARAMETERS):
+            ttk.Label(self.acceleration_params_frame, text=f"{label}:").grid(
+                row=row * 2, column=0, sticky=tk.W)
+            var = tk.DoubleVar(value=getattr(acceleration, attr))
+            # Parameter diubah langsung pada objek akselerasi, berlaku di frame berikutnya
+            ttk.Scale(self.acceleration_params_frame, from_=low, to=high, variable=var,
+                      command=lambda value, attr=attr: setattr(
+                          self.controller.relative_motion.acceleration, attr, float(value))).grid(
+                row=row * 2 + 1, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+
+    def update_workspace_swipes(self):
+        """Aktifkan/nonaktifkan swipe telapak untuk pindah workspace"""
+        self.controller.set_workspace_swipes(self.workspace_swipes_var.get())
+
+    def update_prediction(self):
+        """Aktifkan/nonaktifkan prediksi gerak kursor"""
+        self.controller.prediction_enabled = self.prediction_var.get()
+        self.controller.predictor.reset()
+
+    def build_filter_params(self):
+        """Buat slider untuk parameter filter kursor yang aktif"""
+        for child in self.filter_params_frame.winfo_children():
+            child.destroy()
+
+        cursor_filter = self.controller.cursor_filter
+        for row, (attr, label, low, high) in enumerate(cursor_filter.PARAMETERS):
+            ttk.Label(self.filter_params_frame, text=f"{label}:").grid(
+                row=row * 2, column=0, sticky=tk.W)
+            var = tk.DoubleVar(value=getattr(cursor_filter, attr))
+            # Parameter diubah langsung pada objek filter, berlaku di frame berikutnya
+            ttk.Scale(self.filter_params_frame, from_=low, to=high, variable=var,
+                      command=lambda value, attr=attr: setattr(
+                          self.controller.cursor_filter, attr, float(value))).grid(
+                row=row * 2 + 1, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+
+    def update_roi_mode(self):
+        """Aktifkan/nonaktifkan inferensi pada crop ROI"""
+        self.controller.roi_enabled = self.roi_var.get()
+
+    def update_target_fps(self, value):
+        """Update target FPS loop kontrol"""
+        self.pipeline.set_target_fps(float(value))
+
+    def on_window_map(self, event):
+        """Catat apakah jendela utama sedang terlihat (tidak diminimalkan)"""
+        if event.widget is self.root:
+            self.is_window_visible = event.type == tk.EventType.Map
+            self.update_preview_state()
+
+    def update_preview_state(self):
+        """Preview dan penggambaran landmark hanya aktif jika dicentang dan jendela terlihat"""
+        enabled = self.preview_var.get() and self.is_window_visible
+        self.pipeline.set_preview_enabled(enabled)
+        if not enabled:
+            self.video_label.config(image="", text="Preview disembunyikan")
+            self.video_label.image = None
+
+    def update_preview_settings(self, event=None):
+        """Terapkan rate dan ukuran preview dari panel Pengaturan"""
+        try:
+            self.pipeline.set_preview_fps(float(self.preview_fps_var.get()))
+        except ValueError:
+            pass
+        width, height = self.preview_size_var.get().split('x')
+        self.pipeline.preview_size = (int(width), int(height))
+
     def update_video(self):
-        """Update video feed dalam thread terpisah"""
+        """Render preview dari output pipeline dalam thread terpisah"""
         while self.controller.is_running and self.is_gui_running:
             try:
-                frame, gestures = self.controller.process_frame()
-                if frame is not None:
-                    # Resize frame untuk display
-                    height, width = frame.shape[:2]
-                    max_width, max_height = 640, 480
-
-                    if width > max_width or height > max_height:
-                        scale = min(max_width/width, max_height/height)
-                        new_width = int(width * scale)
-                        new_height = int(height * scale)
-                        frame = cv2.resize(frame, (new_width, new_height))
-
-                    # Convert untuk Tkinter
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    image = Image.fromarray(frame_rgb)
+                # Pipeline sudah mendecimasi preview ke preview_fps
+                item = self.pipeline.preview_buffer.get(timeout=0.1)
+                photo = None
+                if item is not None and self.pipeline.preview_enabled:
+                    frame, gestures = item
+
+                    # Frame preview sudah RGB, diperkecil, dan milik preview sendiri
+                    image = Image.fromarray(frame)
                     photo = ImageTk.PhotoImage(image)
 
-                    # Update GUI di main thread
-                    self.root.after(0, self.update_video_label, photo)
-                    self.root.after(0, self.update_fps_label)
+                # Status tetap diperbarui walaupun preview disembunyikan
+                self.schedule_gui_update(photo)
 
             except Exception as e:
                 print(f"Error dalam update video: {e}")
                 break
 
-            time.sleep(1/30)  # Target 30 FPS
+    def schedule_gui_update(self, photo=None):
+        """Titipkan foto terbaru dan jadwalkan update GUI jika belum ada yang antre"""
+        with self._gui_update_lock:
+            if photo is not None:
+                self._pending_photo = photo
+            if self._gui_update_pending:
+                return
+            self._gui_update_pending = True
+        self.root.after(0, self.apply_gui_update)
+
+    def apply_gui_update(self):
+        """Callback main thread: tampilkan foto terbaru dan perbarui status"""
+        with self._gui_update_lock:
+            photo = self._pending_photo
+            self._pending_photo = None
+            self._gui_update_pending = False
+        if photo is not None:
+            self.update_video_label(photo)
+        self.update_fps_label()
 
     def update_video_label(self, photo):
         """Update label video"""
+        if not self.pipeline.preview_enabled:
+            return
         try:
             self.video_label.config(image=photo, text="")
             self.video_label.image = photo  # Keep reference
@@ -401,14 +3568,78 @@ class CamMouseGUI:
     def update_fps_label(self):
         """Update FPS label"""
         try:
-            self.fps_label.config(text=f"FPS: {self.controller.current_fps}")
+            pacer = self.pipeline.pacer
+            self.fps_label.config(
+                text=f"FPS: {pacer.achieved_fps:.1f} / {pacer.target_fps:.0f} "
+                     f"(skip {pacer.skipped_frames})")
+            stats = self.pipeline.get_stats()
+            self.drop_label.config(text="Drop: " + ", ".join(
+                f"{name} {stat['dropped']}" for name, stat in stats.items()))
+            self.update_latency_label()
+            self.update_calibration_label()
+            monitors = self.controller.display.monitors
+            self.display_label.config(
+                text=f"Layar: {len(monitors)} monitor, desktop "
+                     f"{self.controller.screen_width}x{self.controller.screen_height} "
+                     f"(scale {', '.join(f'{m.scale:g}' for m in monitors)})")
         except:
             pass
 
+    def update_calibration_label(self):
+        """Tampilkan instruksi kalibrasi atau status pemetaan aktif"""
+        session = self.controller.calibration
+        if session is not None:
+            text = session.prompt
+        elif self.controller.cursor_mapping is not None:
+            text = "Kalibrasi: area aktif terkalibrasi"
+        else:
+            text = "Kalibrasi: tidak ada (skala biasa)"
+        self.calibration_label.config(text=text)
+
+    def start_calibration(self):
+        """Mulai kalibrasi sudut jangkauan (kamera harus aktif)"""
+        if not self.controller.is_running:
+            messagebox.showwarning("Kalibrasi", "Mulai kamera terlebih dahulu")
+            return
+        self.controller.start_calibration()
+        self.update_calibration_label()
+
+    def clear_calibration(self):
+        """Hapus kalibrasi untuk kamera dan layar saat ini"""
+        self.controller.cancel_calibration()
+        self.controller.clear_calibration()
+        self.update_calibration_label()
+
+    def update_latency_label(self):
+        """Update ringkasan latensi per tahap di panel Status"""
+        lines = ["Latensi (p50/p95/p99 ms):"]
+        for stage, stats in self.controller.latency.summary().items():
+            if stats['count']:
+                lines.append(f"{stage:<10}{stats['p50_ms']:6.1f}{stats['p95_ms']:7.1f}"
+                             f"{stats['p99_ms']:7.1f}")
+        self.latency_label.config(text="\n".join(lines))
+
+    def export_latency(self):
+        """Export histogram latensi ke file JSON atau CSV"""
+        path = filedialog.asksaveasfilename(
+            title="Export Latensi",
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("CSV", "*.csv")])
+        if not path:
+            return
+        try:
+            self.controller.latency.export(path)
+            messagebox.showinfo("Export Latensi", f"Latensi disimpan ke {path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Gagal menyimpan latensi: {str(e)}")
+
     def on_closing(self):
         """Handle penutupan aplikasi"""
         self.is_gui_running = False
+        self.pipeline.stop()
         self.controller.stop_camera()
+        self.controller.actuator.close()
+        self.controller.display.stop()
         self.root.destroy()
 
     def run(self):
@@ -440,5 +3671,119 @@ def main():
         print(f"Error: {e}")
         messagebox.showerror("Error", f"Terjadi kesalahan: {str(e)}")
 
+def main_headless(argv=None):
+    """Mode headless: kontrol sistem tanpa GUI dan tanpa preview (dari terminal/tray)"""
+    parser = argparse.ArgumentParser(description="CamMouse Pro mode headless (kontrol saja)")
+    parser.add_argument('--headless', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--camera', default='0', help="Index atau path device kamera")
+    parser.add_argument('--backend', default='auto', choices=sorted(CAMERA_BACKENDS),
+                        help="Backend capture OpenCV")
+    parser.add_argument('--actuator', default='pyautogui', choices=sorted(ACTUATOR_BACKENDS),
+                        help="Backend injeksi input")
+    parser.add_argument('--width', type=int, default=640, help="Lebar capture")
+    parser.add_argument('--height', type=int, default=480, help="Tinggi capture")
+    parser.add_argument('--fps', type=float, default=30, help="Target FPS loop kontrol")
+    parser.add_argument('--sensitivity', type=float, default=1.5, help="Sensitivitas kursor")
+    parser.add_argument('--threshold', type=float, default=0.4,
+                        help="Threshold click (jarak pinch relatif terhadap ukuran telapak)")
+    parser.add_argument('--roi', action='store_true', help="Aktifkan mode ROI")
+    parser.add_argument('--filter', default='one_euro', choices=sorted(CURSOR_FILTERS),
+                        help="Filter smoothing kursor")
+    parser.add_argument('--mode', default='absolute', choices=['absolute', 'relative'],
+                        help="Mode kursor (relative: gaya trackpad, kepalkan tangan untuk clutch)")
+    parser.add_argument('--curve', default='sigmoid', choices=ACCELERATION_CURVES,
+                        help="Kurva akselerasi mode relatif")
+    parser.add_argument('--base-gain', type=float, default=0.6,
+                        help="Gain akselerasi untuk gerakan lambat (mode relatif)")
+    parser.add_argument('--max-gain', type=float, default=3.0,
+                        help="Gain akselerasi maksimum untuk gerakan cepat (mode relatif)")
+    parser.add_argument('--accel-threshold', type=float, default=0.5,
+                        help="Kecepatan tengah kurva akselerasi dalam lebar frame per detik")
+    parser.add_argument('--accel-exponent', type=float, default=2.0,
+                        help="Eksponen kurva akselerasi power/sigmoid")
+    parser.add_argument('--calibrate', action='store_true',
+                        help="Kalibrasi ulang sudut jangkauan sebelum kontrol aktif")
+    parser.add_argument('--workspace-swipes', action='store_true',
+                        help="Swipe telapak terbuka kiri/kanan untuk pindah workspace")
+    parser.add_argument('--pose-model', help="Model pose statis (.npz dari cammouse_gesture_train.py)")
+    parser.add_argument('--predict', action='store_true',
+                        help="Aktifkan prediksi gerak untuk kompensasi latensi")
+    parser.add_argument('--predict-lead', type=float, default=0.0,
+                        help="Tambahan horizon prediksi dalam detik (mis. latensi injeksi)")
+    parser.add_argument('--stats-interval', type=float, default=5.0,
+                        help="Interval cetak statistik dalam detik (0 = tidak mencetak)")
+    args = parser.parse_args(argv)
+
+    controller = CamMouseSystemController(actuation_backend=args.actuator)
+    controller.camera_index = int(args.camera) if args.camera.isdigit() else args.camera
+    controller.camera_backend = args.backend
+    controller.capture_width = args.width
+    controller.capture_height = args.height
+    controller.target_fps = args.fps
+    controller.cursor_sensitivity = args.sensitivity
+    controller.click_threshold = args.threshold
+    controller.roi_enabled = args.roi
+    controller.set_cursor_filter(args.filter)
+    controller.set_cursor_mode(args.mode, args.curve, base_gain=args.base_gain, max_gain=args.max_gain,
+                               threshold=args.accel_threshold, exponent=args.accel_exponent)
+    controller.set_workspace_swipes(args.workspace_swipes)
+    if args.pose_model:
+        try:
+            controller.load_pose_classifier(args.pose_model)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Gagal memuat model pose: {e}")
+            return 1
+    controller.prediction_enabled = args.predict
+    controller.prediction_lead = args.predict_lead
+
+    # Tanpa preview: tidak ada penggambaran landmark maupun konversi display
+    pipeline = CamMousePipeline(controller)
+    pipeline.set_preview_enabled(False)
+
+    if not controller.start_camera():
+        print(f"Gagal mengakses kamera: {controller.last_error}")
+        return 1
+    print(controller.describe_capture_mode())
+
+    controller.enable_system_control()
+    pipeline.start()
+
+    try:
+        if args.calibrate:
+            controller.start_calibration()
+            last_prompt = None
+            session = controller.calibration
+            while session is not None:
+                if session.prompt != last_prompt:
+                    last_prompt = session.prompt
+                    print(last_prompt)
+                time.sleep(0.1)
+                session = controller.calibration
+            print("Kalibrasi selesai" if controller.cursor_mapping else "Kalibrasi gagal")
+        print("KONTROL SISTEM AKTIF. Tekan Ctrl+C untuk berhenti "
+              "(atau geser kursor ke pojok kiri atas untuk failsafe).")
+
+        last_stats_time = time.time()
+        while controller.is_running and controller.is_system_control_enabled:
+            time.sleep(0.2)
+            if args.stats_interval and time.time() - last_stats_time >= args.stats_interval:
+                last_stats_time = time.time()
+                pacer = pipeline.pacer
+                drops = ", ".join(f"{name} {stat['dropped']}"
+                                  for name, stat in pipeline.get_stats().items())
+                print(f"FPS: {pacer.achieved_fps:.1f} / {pacer.target_fps:.0f} | Drop: {drops}")
+        if not controller.is_system_control_enabled:
+            print("Failsafe terpicu, kontrol sistem dinonaktifkan")
+    except KeyboardInterrupt:
+        print("\nAplikasi dihentikan oleh pengguna")
+    finally:
+        pipeline.stop()
+        controller.stop_camera()
+        controller.actuator.close()
+        controller.display.stop()
+    return 0
+
 if __name__ == "__main__":
+    if '--headless' in sys.argv[1:]:
+        sys.exit(main_headless(sys.argv[1:]))
     main()
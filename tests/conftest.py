@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modul CamMouse berada di root repository (bukan package)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,218 @@
+"""
+Uji backend aktuasi: AsyncActuator dengan NullActuator, serta backend nyata
+terhadap X server virtual (Xvfb) dan perangkat uinput.
+
+Uji backend nyata dilewati otomatis jika Xvfb/python-xlib tidak terpasang
+atau /dev/uinput tidak dapat ditulis (mis. di CI tanpa grup input).
+"""
+
+import os
+import select
+import shutil
+import struct
+import subprocess
+import time
+
+import pytest
+
+from cammouse_system_controller import AsyncActuator, NullActuator, UInputActuator, XTestActuator
+
+class CornerActuator(NullActuator):
+    """NullActuator dengan failsafe di pojok kiri atas"""
+
+    def move_to(self, x, y):
+        super().move_to(x, y)
+        return (x, y) != (0, 0)
+
+def recorded(backend):
+    return [(action, *args) for action, args, _ in backend.events]
+
+def test_async_failsafe_still_delivers_release():
+    backend = CornerActuator(record=True)
+    failsafes = []
+    actuator = AsyncActuator(backend, on_failsafe=lambda: failsafes.append(True))
+    # Lock antrean ditahan agar semua event dikirim worker dalam satu batch
+    with actuator._condition:
+        actuator.move_to(0, 0)
+        actuator.scroll(0, 1)
+        actuator.move_to(5, 5)
+        actuator.mouse_up('left')
+        actuator.click()
+        actuator.mouse_down('right')
+    actuator.close()
+    assert recorded(backend) == [('move_to', 0, 0), ('mouse_up', 'left')]
+    assert failsafes == [True]
+    assert not actuator.move_to(10, 10)
+
+def test_async_reset_keeps_pending_release():
+    backend = NullActuator(record=True)
+    actuator = AsyncActuator(backend)
+    with actuator._condition:
+        actuator.move_to(1, 1)
+        actuator.mouse_up('left')
+        actuator.reset()
+    actuator.close()
+    assert recorded(backend) == [('mouse_up', 'left')]
+
+class RecordingUInput(UInputActuator):
+    """UInputActuator tanpa /dev/uinput: event dan pembuatan perangkat dicatat"""
+
+    def _open_device(self):
+        self.fd = -1
+        self.opened = getattr(self, 'opened', 0) + 1
+        self.written = []
+
+    def _write_events(self, events):
+        self.written.extend(events)
+
+    def close(self):
+        self.fd = None
+
+def test_uinput_absolute_axes_follow_virtual_desktop():
+    actuator = RecordingUInput(screen_size=(1920, 1080))
+    # Monitor kedua di kiri primary: virtual desktop mulai di x negatif
+    actuator.set_bounds((-1280, 0, 3200, 1080))
+    assert actuator.opened == 2
+    assert actuator.screen_size == (3200, 1080)
+    assert actuator.move_to(-1000, 500)
+    assert actuator.written == [(actuator.EV_ABS, actuator.ABS_X, 280), (actuator.EV_ABS, actuator.ABS_Y, 500)]
+
+    # Delta relatif dibatasi ke tepi virtual desktop, bukan layar primary
+    actuator.written = []
+    assert actuator.move_relative(-5000, 0)
+    assert actuator.position == (-1280, 500)
+    assert actuator.written[0] == (actuator.EV_ABS, actuator.ABS_X, 0)
+
+    # Ukuran sama: origin diperbarui tanpa membuat ulang perangkat
+    actuator.set_bounds((0, 0, 3200, 1080))
+    assert actuator.opened == 2
+
+@pytest.fixture
+def xvfb_display():
+    """Jalankan Xvfb di display bebas dan kembalikan namanya"""
+    pytest.importorskip('Xlib')
+    if shutil.which('Xvfb') is None:
+        pytest.skip("Xvfb tidak terpasang")
+    number = next(n for n in range(90, 200) if not os.path.exists(f'/tmp/.X11-unix/X{n}'))
+    process = subprocess.Popen(['Xvfb', f':{number}', '-screen', '0', '800x600x24', '-nolisten', 'tcp'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.perf_counter() + 5.0
+    while not os.path.exists(f'/tmp/.X11-unix/X{number}'):
+        if process.poll() is not None or time.perf_counter() > deadline:
+            process.kill()
+            pytest.skip("Xvfb gagal dijalankan")
+        time.sleep(0.05)
+    yield f':{number}'
+    process.terminate()
+    process.wait()
+
+@pytest.fixture
+def xtest(xvfb_display):
+    actuator = XTestActuator(xvfb_display)
+    yield actuator
+    actuator.close()
+
+def pointer(actuator):
+    reply = actuator.screen.root.query_pointer()
+    return (reply.root_x, reply.root_y), reply.mask
+
+def test_xtest_move_and_buttons(xtest):
+    assert xtest.size() == (800, 600)
+    assert xtest.move_to(120, 80)
+    assert pointer(xtest)[0] == (120, 80)
+    assert xtest.move_relative(15, -10)
+    assert pointer(xtest)[0] == (135, 70)
+
+    xtest.mouse_down('left')
+    assert pointer(xtest)[1] & xtest._X.Button1Mask
+    xtest.mouse_up('left')
+    assert not pointer(xtest)[1] & xtest._X.Button1Mask
+
+def test_xtest_failsafe_from_sent_position(xtest):
+    assert xtest.move_to(0, 0)
+    assert not xtest.move_to(300, 300)
+    assert pointer(xtest)[0] == (0, 0)
+
+def test_xtest_failsafe_queries_pointer_at_limited_rate(xtest):
+    root = xtest.screen.root
+    query_pointer = root.query_pointer
+    calls = []
+    root.query_pointer = lambda: calls.append(1) or query_pointer()
+
+    xtest.failsafe_interval = 60.0
+    for i in range(50):
+        assert xtest.move_to(100 + i, 100)
+    assert len(calls) == 1
+
+    # Mouse fisik dipindah ke pojok: terdeteksi pada query berikutnya
+    xtest._xtest.fake_input(xtest.display, xtest._X.MotionNotify, x=0, y=0)
+    xtest.display.flush()
+    xtest.reset()
+    assert not xtest.move_to(200, 200)
+
+def read_input_events(fd, timeout=1.0):
+    """Baca semua struct input_event yang tersedia sebagai (type, code, value)"""
+    event_struct = struct.Struct(UInputActuator.EVENT_FORMAT)
+    events = []
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if not select.select([fd], [], [], 0.05)[0]:
+            if events:
+                break
+            continue
+        data = os.read(fd, event_struct.size * 64)
+        events.extend(event[2:] for event in event_struct.iter_unpack(data))
+    return events
+
+def open_event_node(name, timeout=2.0):
+    """Cari /dev/input/eventN milik perangkat virtual berdasarkan nama"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        with open('/proc/bus/input/devices') as devices:
+            for block in devices.read().split('\n\n'):
+                if f'N: Name="{name}"' in block:
+                    handler = next(h for h in block.split('H: Handlers=')[1].split() if h.startswith('event'))
+                    try:
+                        return os.open(f'/dev/input/{handler}', os.O_RDONLY | os.O_NONBLOCK)
+                    except (FileNotFoundError, PermissionError):
+                        break
+        time.sleep(0.05)
+    pytest.skip("Node event perangkat uinput tidak dapat dibaca")
+
+@pytest.fixture(params=['relative', 'absolute'])
+def uinput(request):
+    if not os.access('/dev/uinput', os.W_OK):
+        pytest.skip("/dev/uinput tidak tersedia atau tidak dapat ditulis")
+    name = f'CamMouse Test {request.param} {os.getpid()}'
+    actuator = UInputActuator(screen_size=(800, 600), mode=request.param, name=name)
+    fd = open_event_node(name)
+    yield actuator, fd
+    os.close(fd)
+    actuator.close()
+
+def test_uinput_move_and_buttons(uinput):
+    actuator, fd = uinput
+    if actuator.mode == 'absolute':
+        assert actuator.move_to(120, 80)
+        events = read_input_events(fd)
+        assert (actuator.EV_ABS, actuator.ABS_X, 120) in events
+        assert (actuator.EV_ABS, actuator.ABS_Y, 80) in events
+    else:
+        assert actuator.move_relative(15, -10)
+        events = read_input_events(fd)
+        assert (actuator.EV_REL, actuator.REL_X, 15) in events
+        assert (actuator.EV_REL, actuator.REL_Y, -10) in events
+
+    actuator.mouse_down('left')
+    actuator.mouse_up('left')
+    events = read_input_events(fd)
+    left = actuator.BUTTONS['left']
+    assert [event for event in events if event[:2] == (actuator.EV_KEY, left)] == [
+        (actuator.EV_KEY, left, 1), (actuator.EV_KEY, left, 0)]
+
+def test_uinput_failsafe(uinput):
+    actuator, fd = uinput
+    assert actuator.move_to(0, 0)
+    assert not actuator.move_to(300, 300)
+    actuator.reset()
+    assert actuator.move_to(300, 300)
@@ -0,0 +1,199 @@
+"""
+Uji deterministik GestureStateMachine dan jalur klik lengkap (landmark ->
+process_hand_landmarks -> execute_system_control) memakai tangan sintetis
+dan NullActuator(record=True), tanpa kamera maupun desktop.
+"""
+
+import numpy as np
+import pytest
+
+from cammouse_synthetic import hand_pose
+from cammouse_system_controller import (
+    INDEX_TIP, MIDDLE_TIP, CamMouseSystemController, GestureStateMachine, NullActuator)
+
+THRESHOLD = 0.4
+PINCH = 0.3      # Di bawah threshold
+HYSTERESIS = 0.5  # Di atas threshold, di bawah threshold * release_ratio
+OPEN = 0.8       # Di atas threshold * release_ratio
+
+def run(machine, distances):
+    return [machine.update(distance, THRESHOLD) for distance in distances]
+
+def test_press_is_debounced():
+    machine = GestureStateMachine()
+    # Noise satu frame tidak menekan tombol
+    assert run(machine, [PINCH, OPEN, PINCH, OPEN]) == [None, None, None, None]
+    assert machine.press_count == 0
+    assert run(machine, [PINCH, PINCH]) == [None, 'press']
+    assert machine.is_pressed and machine.press_count == 1
+
+def test_release_is_debounced():
+    machine = GestureStateMachine()
+    run(machine, [PINCH, PINCH])
+    assert run(machine, [OPEN, PINCH, OPEN]) == ['hold', 'hold', 'hold']
+    assert run(machine, [OPEN]) == ['release']
+    assert not machine.is_pressed
+
+def test_hysteresis_keeps_press_until_release_ratio():
+    machine = GestureStateMachine()
+    # Jarak antara threshold dan threshold * release_ratio tidak menekan...
+    assert run(machine, [HYSTERESIS] * 5) == [None] * 5
+    run(machine, [PINCH, PINCH])
+    # ...tetapi juga tidak melepas press yang sudah aktif
+    assert run(machine, [HYSTERESIS] * 5) == ['hold'] * 5
+    assert run(machine, [OPEN, OPEN]) == ['hold', 'release']
+    assert machine.press_count == 1
+
+def test_reset_drops_active_press():
+    machine = GestureStateMachine()
+    run(machine, [PINCH, PINCH])
+    machine.reset()
+    assert not machine.is_pressed
+    assert run(machine, [OPEN]) == [None]
+
+@pytest.fixture
+def controller():
+    controller = CamMouseSystemController(actuator=NullActuator(record=True))
+    controller.is_running = True
+    controller.enable_system_control()
+    yield controller
+    controller.hands.close()
+
+# Tingkat pinch (0 = terbuka, 1 = jempol menyentuh ujung jari) untuk hand_pose
+PINCH_POSE = 0.9
+HYSTERESIS_POSE = 0.6
+OPEN_POSE = 0.0
+
+class Hand:
+    """
+    Tangan sintetis yang diumpankan lewat jalur produksi: landmark (21, 3) ->
+    process_hand_landmarks (pinch jari terdekat, state machine) ->
+    execute_system_control (apply_buttons) ke NullActuator.
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.timestamp = 0.0
+        self.wrist = (0.5, 0.75)
+
+    def frame(self, pinch=OPEN_POSE, finger=INDEX_TIP, dx=0.0):
+        """Proses satu frame tanpa aktuasi (gesture dibuang buffer latest-wins)"""
+        self.timestamp += 1.0 / 30
+        self.wrist = (self.wrist[0] + dx, self.wrist[1])
+        points = hand_pose(self.wrist, pinch, finger)
+        return self.controller.process_hand_landmarks(points, 640, 480, self.timestamp)
+
+    def apply(self, pinch=OPEN_POSE, finger=INDEX_TIP, dx=0.0):
+        gestures = self.frame(pinch, finger, dx)
+        self.controller.execute_system_control(gestures)
+        return gestures
+
+    def lose(self):
+        """Frame kamera tanpa tangan lewat infer_frame"""
+        self.controller.infer_frame(np.zeros((120, 160, 3), dtype=np.uint8))
+
+def buttons(controller):
+    return [(action, *args) for action, args, _ in controller.actuator.events
+            if action in ('mouse_down', 'mouse_up')]
+
+def test_pose_levels_match_thresholds(controller):
+    hand = Hand(controller)
+    distances = {pinch: hand.frame(pinch)['features']['pinch_distances'][0]
+                 for pinch in (PINCH_POSE, HYSTERESIS_POSE, OPEN_POSE)}
+    threshold = controller.click_threshold
+    release = threshold * controller.click_machines['left'].release_ratio
+    assert distances[PINCH_POSE] < threshold < distances[HYSTERESIS_POSE] < release < distances[OPEN_POSE]
+
+def test_drag_holds_button_while_moving(controller):
+    hand = Hand(controller)
+    for _ in range(2):
+        hand.apply(PINCH_POSE)
+    for _ in range(3):
+        hand.apply(PINCH_POSE, dx=0.02)
+    for _ in range(2):
+        hand.apply(OPEN_POSE)
+    events = [(action, *args) for action, args, _ in controller.actuator.events]
+    down = events.index(('mouse_down', 'left'))
+    up = events.index(('mouse_up', 'left'))
+    moves = {tuple(args) for action, *args in events[down:up] if action == 'move_to'}
+    assert len(moves) > 1
+    assert buttons(controller) == [('mouse_down', 'left'), ('mouse_up', 'left')]
+    assert not controller.button_held['left']
+
+def test_hysteresis_keeps_drag(controller):
+    hand = Hand(controller)
+    for pinch in [PINCH_POSE] * 2 + [HYSTERESIS_POSE] * 5:
+        hand.apply(pinch)
+    assert buttons(controller) == [('mouse_down', 'left')]
+    for _ in range(2):
+        hand.apply(OPEN_POSE)
+    assert buttons(controller) == [('mouse_down', 'left'), ('mouse_up', 'left')]
+
+def test_single_frame_pinch_is_ignored(controller):
+    hand = Hand(controller)
+    for pinch in (OPEN_POSE, PINCH_POSE, OPEN_POSE, PINCH_POSE, OPEN_POSE):
+        hand.apply(pinch)
+    assert buttons(controller) == []
+
+def test_double_click(controller):
+    hand = Hand(controller)
+    for pinch in [PINCH_POSE] * 2 + [OPEN_POSE] * 2 + [PINCH_POSE] * 2 + [OPEN_POSE] * 2:
+        hand.apply(pinch)
+    assert buttons(controller) == [('mouse_down', 'left'), ('mouse_up', 'left')] * 2
+
+def test_right_click_uses_nearest_finger(controller):
+    hand = Hand(controller)
+    for pinch in [PINCH_POSE] * 2 + [OPEN_POSE] * 2:
+        hand.apply(pinch, finger=MIDDLE_TIP)
+    assert buttons(controller) == [('mouse_down', 'right'), ('mouse_up', 'right')]
+
+def test_press_and_release_between_actuation_frames(controller):
+    hand = Hand(controller)
+    hand.apply(OPEN_POSE)
+    # Press dan release lengkap terjadi di gesture yang dibuang buffer
+    for pinch in (PINCH_POSE, PINCH_POSE, OPEN_POSE, OPEN_POSE):
+        hand.frame(pinch)
+    hand.apply(OPEN_POSE)
+    assert buttons(controller) == [('mouse_down', 'left'), ('mouse_up', 'left')]
+    assert not controller.button_held['left']
+
+def test_release_and_press_between_actuation_frames(controller):
+    hand = Hand(controller)
+    hand.apply(PINCH_POSE)
+    hand.apply(PINCH_POSE)
+    # Release lalu press baru terlewat: tombol dilepas lalu ditekan lagi
+    for pinch in (OPEN_POSE, OPEN_POSE, PINCH_POSE):
+        hand.frame(pinch)
+    hand.apply(PINCH_POSE)
+    assert buttons(controller) == [('mouse_down', 'left'), ('mouse_up', 'left'), ('mouse_down', 'left')]
+    assert controller.button_held['left']
+
+def test_hand_loss_releases_button(controller):
+    hand = Hand(controller)
+    hand.apply(PINCH_POSE)
+    stale = hand.apply(PINCH_POSE)
+    hand.lose()
+    assert buttons(controller) == [('mouse_down', 'left'), ('mouse_up', 'left')]
+    # Gesture lama yang masih di buffer tidak menekan tombol lagi
+    controller.execute_system_control(stale)
+    assert buttons(controller) == [('mouse_down', 'left'), ('mouse_up', 'left')]
+    assert not controller.button_held['left']
+
+def test_stop_releases_button(controller):
+    hand = Hand(controller)
+    hand.apply(PINCH_POSE)
+    hand.apply(PINCH_POSE)
+    controller.stop_camera()
+    assert buttons(controller) == [('mouse_down', 'left'), ('mouse_up', 'left')]
+    assert not controller.is_system_control_enabled
+    assert not controller.button_held['left']
+
+def test_enable_during_pinch_does_not_press(controller):
+    hand = Hand(controller)
+    controller.disable_system_control()
+    hand.frame(PINCH_POSE)
+    hand.frame(PINCH_POSE)
+    controller.enable_system_control()
+    for pinch in (PINCH_POSE, OPEN_POSE, OPEN_POSE):
+        hand.apply(pinch)
+    assert buttons(controller) == []
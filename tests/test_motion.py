@@ -0,0 +1,61 @@
+"""
+Uji deterministik MotionGestureDetector: lintasan telapak sintetis (lingkaran
+dan swipe) dimasukkan frame demi frame lewat GestureRegistry.
+"""
+
+import numpy as np
+import pytest
+
+from cammouse_synthetic import hand_pose
+from cammouse_system_controller import GestureRegistry, MotionGestureDetector, compute_hand_features
+
+RATE = 30
+CENTER = np.array([0.5, 0.5])
+
+def detect(track):
+    """Semua gesture dinamis yang terdeteksi sepanjang track (M, 2) posisi pergelangan"""
+    registry = GestureRegistry([MotionGestureDetector()])
+    events = []
+    for i, wrist in enumerate(track):
+        detected = registry.detect(compute_hand_features(hand_pose(wrist), i / RATE))
+        if detected['motion']:
+            events.append(detected['motion'])
+    return events
+
+def with_rest(path, before=10, after=15):
+    """Tangan diam sebelum dan sesudah gerak"""
+    return np.concatenate([np.repeat(path[:1], before, 0), path, np.repeat(path[-1:], after, 0)])
+
+def circle(radius, period, sign, phase, turns=1):
+    angles = phase + sign * np.linspace(0.0, 2 * np.pi * turns, int(period * turns * RATE))
+    return with_rest(CENTER + radius * np.stack([np.cos(angles), np.sin(angles)], axis=1))
+
+@pytest.mark.parametrize('radius', [0.15, 0.2])
+@pytest.mark.parametrize('period', [1.0, 1.2])
+@pytest.mark.parametrize('sign, name', [(1.0, 'circle_cw'), (-1.0, 'circle_ccw')])
+def test_circle_is_not_a_swipe(radius, period, sign, name):
+    # Busur awal lingkaran tampak seperti garis di jendela swipe yang pendek
+    for phase in np.linspace(0.0, 2 * np.pi, 8, endpoint=False):
+        assert detect(circle(radius, period, sign, phase)) == [name]
+        assert detect(circle(radius, period, sign, phase, turns=2)) == [name, name]
+
+@pytest.mark.parametrize('name, direction', [
+    ('swipe_right', (1.0, 0.0)), ('swipe_left', (-1.0, 0.0)),
+    ('swipe_down', (0.0, 1.0)), ('swipe_up', (0.0, -1.0))])
+@pytest.mark.parametrize('pivot', [None, 0.5])
+def test_swipe_is_detected(name, direction, pivot):
+    direction = np.array(direction)
+    progress = np.linspace(0.0, 1.0, 9)
+    progress = progress * progress * (3 - 2 * progress)  # Percepat lalu perlambat
+    path = CENTER + np.outer(progress - 0.5, 0.3 * direction)
+    if pivot is not None:
+        # Swipe sungguhan sedikit melengkung (lengan berputar di siku)
+        offset = path - CENTER
+        along = offset @ direction
+        sagitta = pivot - np.sqrt(pivot ** 2 - along ** 2)
+        path = path + np.outer(sagitta, (-direction[1], direction[0]))
+    assert detect(with_rest(path)) == [name]
+
+def test_slow_move_is_not_a_gesture():
+    progress = np.linspace(0.0, 1.0, 60)[:, None]
+    assert detect(with_rest(CENTER + progress * (0.3, 0.1))) == []